@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Optional
 import datetime as dt
 import logging
@@ -151,6 +152,31 @@ class SearchMiddleware:
           raised when multiple worksheets, tables, or view exist in the
           platform by a single name
         """
+        data: TableRowsFormat = []
+        data_types: dict[str, str] = {}
+
+        # .pages() always yields at least once, so the types are known even when the search returns no rows.
+        for page, page_data_types in self.pages(query, worksheet=worksheet, table=table, view=view, sample=sample):
+            data.extend(page)
+            data_types = page_data_types
+
+        return (data, data_types) if include_dtype_mapping else data  # type: ignore
+
+    def pages(
+        self,
+        query: str,
+        *,
+        worksheet: Optional[str] = None,
+        table: Optional[str] = None,
+        view: Optional[str] = None,
+        sample: bool = -1,
+    ) -> Iterator[tuple[TableRowsFormat, dict[str, str]]]:
+        """
+        Search a data source, yielding each page of results as soon as it arrives.
+
+        Pages are cast to their intended column types, and are yielded along with
+        the mapping of column names to types. See ThoughtSpot.search() for details.
+        """
         if (worksheet, table, view).count(None) == 3:
             raise TypeError(
                 "ThoughtSpot.data.search() missing 1 of the required keyword-only "
@@ -192,7 +218,7 @@ class SearchMiddleware:
             guid = d[0]["id"]
 
         log.debug(f"executing search on guid {guid}\n\n{query}\n")
-        data = []
+        data_types = None
         offset = 0
 
         while True:
@@ -206,8 +232,19 @@ class SearchMiddleware:
 
             d = r.json()
 
-            # Add the rows to our dataset
-            data.extend(d.pop("data"))
+            # Get the data types
+            if data_types is None and "columnDetails" in d:  # DEV NOTE: Not available until 9.10.0
+                data_types = {column["name"]: column["data_type"] for column in d["columnDetails"]}
+
+            if data_types is None:
+                r = self.ts.api.v1.metadata_details(metadata_type="LOGICAL_TABLE", guids=[guid])
+                data_types = {c["header"]["name"]: c["dataType"] for c in r.json()["storables"][0]["columns"]}
+
+            # Cleanups
+            page = _fix_for_scal_101507(d.pop("data"))
+            page = _cast(page, headers_to_types=data_types)
+
+            yield page, data_types
 
             # Increment the row offset for the next batch
             offset += d["rowCount"]
@@ -225,19 +262,3 @@ class SearchMiddleware:
                     f"rows is not scalable, consider adding a filter or extracting "
                     f"directly from the underlying data source instead!"
                 )
-
-        # Get the data types
-        if "columnDetails" in d:  # DEV NOTE: Not available until 9.10.0
-            data_types = {column["name"]: column["data_type"] for column in d["columnDetails"]}
-        else:
-            r = self.ts.api.v1.metadata_details(metadata_type="LOGICAL_TABLE", guids=[guid])
-            data_types = {c["header"]["name"]: c["dataType"] for c in r.json()["storables"][0]["columns"]}
-
-        # Remap column names based on the desired column state
-        d["columnNames"] = list(data_types.keys())
-
-        # Cleanups
-        data = _fix_for_scal_101507(data)
-        data = _cast(data, headers_to_types=data_types)
-
-        return (data, data_types) if include_dtype_mapping else data  # type: ignore
@@ -9,12 +9,14 @@ from sqlmodel import Field, SQLModel
 import pydantic
 import typer
 
+from cs_tools import utils
 from cs_tools._compat import StrEnum
 from cs_tools.cli.dependencies import thoughtspot
 from cs_tools.cli.dependencies.syncer import DSyncer
 from cs_tools.cli.layout import LiveTasks
 from cs_tools.cli.types import SyncerProtocolType
 from cs_tools.cli.ux import CSToolsApp, rich_console
+from cs_tools.sync import utils as sync_utils
 
 log = logging.getLogger(__name__)
 app = CSToolsApp(help="Extract data from a worksheet, view, or table in ThoughtSpot.")
@@ -62,84 +64,93 @@ def search(
         ("syncer_dump", f"Writing rows to [b blue]{syncer.name}"),
     ]
 
-    with LiveTasks(tasks, console=rich_console) as tasks:
-        with tasks["gather_search"]:
-            search_kwargs = {data_type: dataset, "use_logical_column_names": True, "include_dtype_mapping": True}
-            data, column_mapping = ts.search(query, **search_kwargs)
-
-            renamed = []
-            curr_date, sk_idx = None, 0
-
-            for row in data:
-                row_date = row[date_partition_by].replace(tzinfo=dt.timezone.utc).date() if date_partition_by else None
-
-                # reset the surrogate key every day
-                if curr_date != row_date:
-                    curr_date = row_date
-                    sk_idx = 0
-
-                sk_idx += 1
-
-                renamed.append(
-                    {
-                        "sk_dummy": f"{ts.session_context.thoughtspot.cluster_id}-{row_date}-{sk_idx}",
-                        "cluster_guid": ts.session_context.thoughtspot.cluster_id,
-                        **row,
-                    }
-                )
-
-            if sql_friendly_names:
-                # Replace spaces with underscores, and lowercase everything
-                renamed = [{k.lower().replace(" ", "_"): v for k, v in row.items()} for row in renamed]
-                column_mapping = {k.lower().replace(" ", "_"): v for k, v in column_mapping.items()}
-
-            if syncer.is_database_syncer:
-                field_defs: dict[str, tuple[type, Field]] = {
-                    # Mark the SK as the PrimaryKey
-                    "sk_dummy": (str, Field(sa_column=Column(Text, primary_key=True))),
-                    "cluster_guid": (str, Field(sa_column=Column(Text, primary_key=True))),
-                }
-
-                sqla_types = {
-                    "CHAR": Text,
-                    "BOOL": Boolean,
-                    "FLOAT": Float,
-                    "INT32": SmallInteger,
-                    "INT64": BigInteger,
-                    "DATE": Date,
-                    "DATE_TIME": DateTime,
-                }
-
-                # Compute the column definitions
-                for column, ts_generic_type in column_mapping.items():
-                    if column == "sk_dummy":
-                        continue
-
-                    # Fetch the python type
-                    py_type = type(renamed[0][column])
-
-                    # Fetch the complementary sqlalchemy type
-                    sa_type = sqla_types.get(ts_generic_type, None)
-
-                    if sa_type is None:
-                        log.warning(f"Unknown type: {ts_generic_type} for column: {column}, falling back to VARCHAR..")
-                        sa_type = Text
-
-                    # Build and assign the sqlmodel.Field definition
-                    is_pk = column in ("sk_dummy", date_partition_by)
-
-                    field_defs[column] = (
-                        py_type,
-                        Field(
-                            ... if is_pk else None,
-                            sa_column=Column(name=column, type_=sa_type, primary_key=is_pk),
-                        ),
-                    )
-
-                # Create the dynamic table
-                model = pydantic.create_model(target, __base__=SQLModel, __cls_kwargs__={"table": True}, **field_defs)
-                model.__table__.to_metadata(syncer.metadata, schema=None)
-                syncer.metadata.create_all(syncer.engine, tables=list(syncer.metadata.sorted_tables))
+    def create_table(row: dict, column_mapping: dict[str, str]) -> None:
+        field_defs: dict[str, tuple[type, Field]] = {
+            # Mark the SK as the PrimaryKey
+            "sk_dummy": (str, Field(sa_column=Column(Text, primary_key=True))),
+            "cluster_guid": (str, Field(sa_column=Column(Text, primary_key=True))),
+        }
+
+        sqla_types = {
+            "CHAR": Text,
+            "BOOL": Boolean,
+            "FLOAT": Float,
+            "INT32": SmallInteger,
+            "INT64": BigInteger,
+            "DATE": Date,
+            "DATE_TIME": DateTime,
+        }
+
+        # Compute the column definitions
+        for column, ts_generic_type in column_mapping.items():
+            if column == "sk_dummy":
+                continue
+
+            # Fetch the python type
+            py_type = type(row[column])
+
+            # Fetch the complementary sqlalchemy type
+            sa_type = sqla_types.get(ts_generic_type, None)
+
+            if sa_type is None:
+                log.warning(f"Unknown type: {ts_generic_type} for column: {column}, falling back to VARCHAR..")
+                sa_type = Text
+
+            # Build and assign the sqlmodel.Field definition
+            is_pk = column in ("sk_dummy", date_partition_by)
+
+            field_defs[column] = (
+                py_type,
+                Field(
+                    ... if is_pk else None,
+                    sa_column=Column(name=column, type_=sa_type, primary_key=is_pk),
+                ),
+            )
+
+        # Create the dynamic table
+        model = pydantic.create_model(target, __base__=SQLModel, __cls_kwargs__={"table": True}, **field_defs)
+        syncer.create_model_table(model)
 
+    with LiveTasks(tasks, console=rich_console) as tasks:
+        # Each page of results is written in the background, while the next one is fetched.
         with tasks["syncer_dump"]:
-            syncer.dump(target.lower(), data=renamed)
+            with sync_utils.incremental_dump(syncer, target.lower()) as dump, utils.WritePipeline(dump) as pipeline:
+                with tasks["gather_search"]:
+                    curr_date, sk_idx = None, 0
+                    is_table_created = not syncer.is_database_syncer
+
+                    for data, column_mapping in ts.search.pages(query, **{data_type: dataset}):
+                        renamed = []
+
+                        for row in data:
+                            row_date = None
+
+                            if date_partition_by:
+                                row_date = row[date_partition_by].replace(tzinfo=dt.timezone.utc).date()
+
+                            # reset the surrogate key every day
+                            if curr_date != row_date:
+                                curr_date = row_date
+                                sk_idx = 0
+
+                            sk_idx += 1
+
+                            renamed.append(
+                                {
+                                    "sk_dummy": f"{ts.session_context.thoughtspot.cluster_id}-{row_date}-{sk_idx}",
+                                    "cluster_guid": ts.session_context.thoughtspot.cluster_id,
+                                    **row,
+                                }
+                            )
+
+                        if sql_friendly_names:
+                            # Replace spaces with underscores, and lowercase everything
+                            renamed = [{k.lower().replace(" ", "_"): v for k, v in row.items()} for row in renamed]
+                            column_mapping = {k.lower().replace(" ", "_"): v for k, v in column_mapping.items()}
+
+                        # The table is defined by the first page of results.
+                        if not is_table_created and renamed:
+                            create_table(renamed[0], column_mapping)
+                            is_table_created = True
+
+                        pipeline.put(renamed)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional
 import collections
+import json
 import logging
 import re
 
@@ -13,6 +14,7 @@ from thoughtspot_tml import Connection
 from thoughtspot_tml.exceptions import TMLError
 from thoughtspot_tml.utils import determine_tml_type, disambiguate
 
+from cs_tools import utils
 from cs_tools.cli.ux import rich_console
 from cs_tools.errors import CSToolsCLIError
 from cs_tools.types import GUID, TMLSupportedContent, TMLSupportedContentSubtype
@@ -45,7 +47,18 @@ class TMLExportResponse:
 
 
 def export(
-    ts, path, guids, tags, author, include_types, exclude_types, exclude_system_content, pattern, export_associated, org
+    ts,
+    path,
+    guids,
+    tags,
+    author,
+    include_types,
+    exclude_types,
+    exclude_system_content,
+    pattern,
+    export_associated,
+    org,
+    resume=False,
 ):
     if guids and (tags or author or include_types or exclude_types or pattern):
         raise CSToolsCLIError(
@@ -56,6 +69,21 @@ def export(
             ),
         )
 
+    # Only a run with the same arguments exports the same objects, so only it may be resumed.
+    arguments = [
+        path,
+        guids,
+        tags,
+        author,
+        include_types,
+        exclude_types,
+        exclude_system_content,
+        pattern,
+        export_associated,
+        org,
+    ]
+    run = f"scriptability-export/{ts.session_context.thoughtspot.cluster_id}/{json.dumps(arguments, default=str)}"
+
     if org is not None:
         ts.org.switch(org)
 
@@ -119,39 +147,45 @@ def export(
 
     results: list[TMLExportResponse] = []
 
-    for content in export_objects:
-        guid = content["id"]
-        metadata_type = content["metadata_type"]
-        with_ = "with" if export_associated else "without"
+    with utils.CheckpointStore(ts.config.temp_dir / "checkpoints.db", run=run, resume=resume) as checkpoints:
+        for content in export_objects:
+            guid = content["id"]
+            metadata_type = content["metadata_type"]
+            with_ = "with" if export_associated else "without"
 
-        with rich_console.status(f"[b green]exporting {guid} ({metadata_type}) {with_} associated content.[/]"):
-            try:
-                if metadata_type == TMLSupportedContent.connection:
-                    r = _download_connection(ts=ts, tmlfs=tmlfs, guid=guid)
-                else:
-                    r = _download_tml(ts=ts, tmlfs=tmlfs, guid=guid, export_associated=export_associated)
-
-                results.extend(r)
-
-            # Sometimes we get a 400 error on the content. Need to just log an error and continue.
-            except HTTPStatusError as e:
-                log.error(f"error exporting TML for GUID '[b blue]{guid}[/]'. check logs for more details..")
-                log.debug(e, exc_info=True)
-                results.append(
-                    TMLExportResponse(
-                        guid=guid,
-                        metadata_object_type=metadata_type,
-                        tml_type_name="UNKNOWN",
-                        name="UNKNOWN",
-                        status_code="ERROR",
-                        error_messages=str(e),
+            if checkpoints.is_complete("export", chunk=guid):
+                log.info(f"{guid} ({metadata_type}) was exported by the previous run, skipping..")
+                continue
+
+            with rich_console.status(f"[b green]exporting {guid} ({metadata_type}) {with_} associated content.[/]"):
+                try:
+                    if metadata_type == TMLSupportedContent.connection:
+                        r = _download_connection(ts=ts, tmlfs=tmlfs, guid=guid)
+                    else:
+                        r = _download_tml(ts=ts, tmlfs=tmlfs, guid=guid, export_associated=export_associated)
+
+                    results.extend(r)
+                    checkpoints.complete("export", chunk=guid)
+
+                # Sometimes we get a 400 error on the content. Need to just log an error and continue.
+                except HTTPStatusError as e:
+                    log.error(f"error exporting TML for GUID '[b blue]{guid}[/]'. check logs for more details..")
+                    log.debug(e, exc_info=True)
+                    results.append(
+                        TMLExportResponse(
+                            guid=guid,
+                            metadata_object_type=metadata_type,
+                            tml_type_name="UNKNOWN",
+                            name="UNKNOWN",
+                            status_code="ERROR",
+                            error_messages=str(e),
+                        )
                     )
-                )
 
-            except Exception as e:
-                log.error(f"Something went wrong went extracting {guid}, see logs for more details..")
-                log.debug(f"Full error: {e}", exc_info=True)
-                continue
+                except Exception as e:
+                    log.error(f"Something went wrong went extracting {guid}, see logs for more details..")
+                    log.debug(f"Full error: {e}", exc_info=True)
+                    continue
 
     if results:
         _show_results_as_table(results=results)
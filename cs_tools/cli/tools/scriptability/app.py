@@ -237,6 +237,7 @@ def scriptability_export(
         False, "--export-associated", help="if specified, also export related content (does not export connections)"
     ),
     org_override: str = typer.Option(None, "--org", help="the org to use, if any"),
+    resume: bool = typer.Option(False, "--resume", help="skip the objects exported by the last, interrupted run"),
 ):
     """
     Exports TML from ThoughtSpot.
@@ -265,6 +266,7 @@ def scriptability_export(
         exclude_system_content=not include_system_content,
         export_associated=export_associated,
         org=org_override,
+        resume=resume,
     )
 
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from typing import Optional
 import datetime as dt
+import itertools
 import json
 import logging
 import pathlib
@@ -11,12 +13,13 @@ from thoughtspot_tml.utils import determine_tml_type
 import httpx
 import typer
 
-from cs_tools import _compat
+from cs_tools import _compat, utils
 from cs_tools.cli.dependencies import thoughtspot
 from cs_tools.cli.dependencies.syncer import DSyncer
 from cs_tools.cli.layout import LiveTasks
 from cs_tools.cli.types import SyncerProtocolType, TZAwareDateTimeType
 from cs_tools.cli.ux import CSToolsApp, rich_console
+from cs_tools.sync import utils as sync_utils
 from cs_tools.sync.sqlite.syncer import SQLite
 from cs_tools.types import GUID, TMLImportPolicy
 
@@ -34,6 +37,13 @@ class FriendlyWindowEnd(_compat.StrEnum):
     TODAY_START_LOCAL = "TODAY_START_LOCAL"
 
 
+def _ensure_resumable(syncer: DSyncer, *, resume: bool) -> None:
+    """A resumed run skips what the last run checkpointed, so the Syncer must have kept it despite the failure."""
+    if resume and not syncer.commits_per_dump():
+        log.error(f"{syncer} only keeps what it wrote once the whole command succeeds, it can't --resume")
+        raise typer.Exit(1)
+
+
 @app.command(dependencies=[thoughtspot])
 def deploy(
     ctx: typer.Context,
@@ -173,12 +183,14 @@ def audit_logs(
     ),
     last_k_days: int = typer.Option(1, help="how many days of audit logs to fetch", min=1, max=30),
     window_end: FriendlyWindowEnd = typer.Option(FriendlyWindowEnd.NOW, help="how to track events through time"),
+    resume: bool = typer.Option(False, "--resume", help="skip the days written by the last, interrupted run"),
 ):
     """
     Extract audit logs from your ThoughtSpot platform.
 
     ThoughtSpot's retention policy for audit logs is 30 days.
     """
+    _ensure_resumable(syncer, resume=resume)
     ts = ctx.obj.thoughtspot
 
     if window_end == "NOW":
@@ -194,44 +206,29 @@ def audit_logs(
             .replace(hour=0, minute=0, second=0, microsecond=0)
         )
 
+    cluster_uuid = ts.session_context.thoughtspot.cluster_id
+
     # THOUGHTSPOT API SEEMS TO HAVE ISSUES WITH TIMEZONES AND CAUSES DUPLICATION OF DATA
     everseen = set()
 
-    renamed = []
-
-    for days_to_fetch in range(last_k_days):
-        utc_end = utc_terminal_end - dt.timedelta(days=days_to_fetch)
-        utc_start = utc_terminal_end - dt.timedelta(days=days_to_fetch + 1)
-
-        r = ts.api.v2.logs_fetch(log_type="SECURITY_AUDIT", utc_start=utc_start, utc_end=utc_end)
-
-        try:
-            r.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            log.error(e.response.json())
-            continue
-
-        rows = r.json()
-
-        if not rows:
-            log.info(f"Found no data for [NOW - {days_to_fetch} DAYS] ({utc_start.date()} -> {utc_end.date()})")
-            continue
+    def to_audit_logs_rows(rows: list[dict]) -> list[dict]:
+        renamed = []
 
         for row in rows:
             data = json.loads(row["log"])
 
             # THOUGHTSPOT API SEEMS TO HAVE ISSUES WITH TIMEZONES AND CAUSES DUPLICATION OF DATA
-            if f"{ts.session_context.thoughtspot.cluster_id}-{data['id']}" in everseen:
+            if f"{cluster_uuid}-{data['id']}" in everseen:
                 continue
 
-            everseen.add(f"{ts.session_context.thoughtspot.cluster_id}-{data['id']}")
+            everseen.add(f"{cluster_uuid}-{data['id']}")
 
             renamed.append(
                 models.AuditLogs.validated_init(
                     **{
-                        "cluster_guid": ts.session_context.thoughtspot.cluster_id,
+                        "cluster_guid": cluster_uuid,
                         "org_id": data["orgId"],
-                        "sk_dummy": f"{ts.session_context.thoughtspot.cluster_id}-{data['id']}",
+                        "sk_dummy": f"{cluster_uuid}-{data['id']}",
                         "timestamp": row["date"],
                         "log_type": data["type"],
                         "user_guid": data["userGUID"],
@@ -241,10 +238,52 @@ def audit_logs(
                 ).model_dump()
             )
 
-    # CLUSTER BY --> TIMESTAMP .. everything else is irrelevant after TS.
-    renamed.sort(key=lambda r: (r["timestamp"], r["sk_dummy"]))
+        # CLUSTER BY --> TIMESTAMP .. everything else is irrelevant after TS.
+        renamed.sort(key=lambda r: (r["timestamp"], r["sk_dummy"]))
+        return renamed
+
+    run = f"searchable-audit-logs/{cluster_uuid}/{last_k_days}/{window_end}"
+
+    with utils.CheckpointStore(ts.config.temp_dir / "checkpoints.db", run=run, resume=resume) as checkpoints:
+        # A resumed run must fetch the same days as the run it continues.
+        if checkpoints.is_complete("window_end"):
+            utc_terminal_end = dt.datetime.fromisoformat(checkpoints.staged("window_end"))
+
+        checkpoints.complete("window_end", data=utc_terminal_end)
+
+        pending = [n for n in range(last_k_days) if not checkpoints.is_complete("ts_audit_logs", chunk=n)]
+        resuming = len(pending) < last_k_days
+
+        # Days written by the interrupted run still take part in de-duplication.
+        for days_to_fetch in set(range(last_k_days)).difference(pending):
+            everseen.update(checkpoints.staged("ts_audit_logs", chunk=days_to_fetch))
 
-    syncer.dump("ts_audit_logs", data=renamed)
+        with sync_utils.incremental_dump(syncer, "ts_audit_logs", resuming=resuming) as dump:
+
+            def write_day(item: tuple[int, list[dict]]) -> None:
+                days_to_fetch, rows = item
+                dump(rows)
+                checkpoints.complete("ts_audit_logs", chunk=days_to_fetch, data=[row["sk_dummy"] for row in rows])
+
+            # Each day is written in the background while the next one is fetched, then checkpointed.
+            with utils.WritePipeline(write_day) as pipeline:
+                for days_to_fetch in pending:
+                    utc_end = utc_terminal_end - dt.timedelta(days=days_to_fetch)
+                    utc_start = utc_terminal_end - dt.timedelta(days=days_to_fetch + 1)
+
+                    r = ts.api.v2.logs_fetch(log_type="SECURITY_AUDIT", utc_start=utc_start, utc_end=utc_end)
+
+                    try:
+                        r.raise_for_status()
+                    except httpx.HTTPStatusError as e:
+                        log.error(e.response.json())
+                        continue
+
+                    if not (rows := r.json()):
+                        window = f"({utc_start.date()} -> {utc_end.date()})"
+                        log.info(f"Found no data for [NOW - {days_to_fetch} DAYS] {window}")
+
+                    pipeline.put((days_to_fetch, to_audit_logs_rows(rows)))
 
 
 @app.command(dependencies=[thoughtspot])
@@ -270,6 +309,7 @@ def bi_server(
         metavar="YYYY-MM-DD",
         help="inclusive upper bound of rows to select from TS: BI Server",
     ),
+    resume: bool = typer.Option(False, "--resume", help="skip the days written by the last, interrupted run"),
 ):
     """
     Extract usage statistics from your ThoughtSpot platform.
@@ -292,83 +332,140 @@ def bi_server(
         rich_console.print()
         raise typer.Abort()
 
+    _ensure_resumable(syncer, resume=resume)
+
     # DEV NOTE: @boonhapus
     # As of 9.10.0.cl , TS: BI Server only resides in the Primary Org(0), so switch to it
     if ts.session_context.thoughtspot.is_orgs_enabled:
         ts.org.switch(org=0)
 
     SEARCH_DATA_DATE_FMT = "%m/%d/%Y"
-    SEARCH_TOKENS = (
-        "[incident id] [timestamp].'detailed' [url] [http response code] "
-        "[browser type] [browser version] [client type] [client id] [answer book guid] "
-        "[viz id] [user id] [user action] [query text] [response size] [latency (us)] "
-        "[database latency (us)] [impressions] [timestamp] != 'today'"
-        # FOR DATA QUALITY PURPOSES
-        + " [incident id] != [incident id].{null}"
-        # CONDITIONALS BASED ON CLI OPTIONS OR ENVIRONMENT
-        + ("" if not compact else " [user action] != [user action].invalid [user action].{null}")
-        + ("" if from_date is None else f" [timestamp] >= '{from_date.strftime(SEARCH_DATA_DATE_FMT)}'")
-        + ("" if to_date is None else f" [timestamp] <= '{to_date.strftime(SEARCH_DATA_DATE_FMT)}'")
-        + ("" if not ts.session_context.thoughtspot.is_orgs_enabled else " [org id]")
-        + ("" if org_override is None else f" [org id] = {ts.org.guid_for(org_override)}")
-    )
+
+    def search_tokens(from_date: Optional[dt.datetime], to_date: Optional[dt.datetime]) -> str:
+        return (
+            "[incident id] [timestamp].'detailed' [url] [http response code] "
+            "[browser type] [browser version] [client type] [client id] [answer book guid] "
+            "[viz id] [user id] [user action] [query text] [response size] [latency (us)] "
+            "[database latency (us)] [impressions] [timestamp] != 'today'"
+            # FOR DATA QUALITY PURPOSES
+            + " [incident id] != [incident id].{null}"
+            # CONDITIONALS BASED ON CLI OPTIONS OR ENVIRONMENT
+            + ("" if not compact else " [user action] != [user action].invalid [user action].{null}")
+            + ("" if from_date is None else f" [timestamp] >= '{from_date.strftime(SEARCH_DATA_DATE_FMT)}'")
+            + ("" if to_date is None else f" [timestamp] <= '{to_date.strftime(SEARCH_DATA_DATE_FMT)}'")
+            + ("" if not ts.session_context.thoughtspot.is_orgs_enabled else " [org id]")
+            + ("" if org_override is None else f" [org id] = {ts.org.guid_for(org_override)}")
+        )
+
+    # With a bounded date range, fetch one day at a time so each day is written while the next is fetched. The
+    # surrogate key resets every day, so every day must still be fetched in full before it's keyed.
+    if from_date is not None and to_date is not None:
+        days = [from_date + dt.timedelta(days=n) for n in range((to_date.date() - from_date.date()).days + 1)]
+        windows = [(day, day) for day in days]
+    else:
+        windows = [(from_date, to_date)]
+
+    def to_bi_server_rows(data: list[dict]) -> list[dict]:
+        # THOUGHTSPOT API SEEMS TO HAVE ISSUES WITH TIMEZONES AND CAUSES DUPLICATION OF DATA
+        data = [dict(t) for t in {tuple(sorted(d.items())) for d in data}]
+
+        # CLUSTER BY --> TIMESTAMP .. everything else is irrelevant after TS.
+        data.sort(key=lambda r: (r["Timestamp"].replace(tzinfo=dt.timezone.utc), r["Incident Id"], r["Viz Id"]))
+
+        renamed = []
+        curr_date, sk_idx = None, 0
+
+        for row in data:
+            row_date = row["Timestamp"].replace(tzinfo=dt.timezone.utc).date()
+
+            # reset the surrogate key every day
+            if curr_date != row_date:
+                curr_date = row_date
+                sk_idx = 0
+
+            sk_idx += 1
+
+            renamed.append(
+                models.BIServer.validated_init(
+                    **{
+                        "cluster_guid": ts.session_context.thoughtspot.cluster_id,
+                        "sk_dummy": f"{ts.session_context.thoughtspot.cluster_id}-{row_date}-{sk_idx}",
+                        "org_id": row.get("Org Id", 0),
+                        "incident_id": row["Incident Id"],
+                        "timestamp": row["Timestamp"],
+                        "url": row["URL"],
+                        "http_response_code": row["HTTP Response Code"],
+                        "browser_type": row["Browser Type"],
+                        "browser_version": row["Browser Version"],
+                        "client_type": row["Client Type"],
+                        "client_id": row["Client Id"],
+                        "answer_book_guid": row["Answer Book GUID"],
+                        "viz_id": row["Viz Id"],
+                        "user_id": row["User Id"],
+                        "user_action": row["User Action"],
+                        "query_text": row["Query Text"],
+                        "response_size": row["Total Response Size"],
+                        "latency_us": row["Total Latency (us)"],
+                        "impressions": row["Total Impressions"],
+                    }
+                ).model_dump()
+            )
+
+        return renamed
 
     tasks = [
         ("gather_search", "Collecting data from [b blue]TS: BI Server"),
         ("syncer_dump", f"Writing rows to [b blue]{syncer.name}"),
     ]
 
-    with LiveTasks(tasks, console=rich_console) as tasks:
-        with tasks["gather_search"]:
-            data = ts.search(SEARCH_TOKENS, worksheet="TS: BI Server")
+    cluster_uuid = ts.session_context.thoughtspot.cluster_id
+    run = f"searchable-bi-server/{cluster_uuid}/{org_override}/{compact}/{from_date}/{to_date}"
 
-            # THOUGHTSPOT API SEEMS TO HAVE ISSUES WITH TIMEZONES AND CAUSES DUPLICATION OF DATA
-            data = [dict(t) for t in {tuple(sorted(d.items())) for d in data}]
-
-            # CLUSTER BY --> TIMESTAMP .. everything else is irrelevant after TS.
-            data.sort(key=lambda r: (r["Timestamp"].replace(tzinfo=dt.timezone.utc), r["Incident Id"], r["Viz Id"]))
-
-            renamed = []
-            curr_date, sk_idx = None, 0
-
-            for row in data:
-                row_date = row["Timestamp"].replace(tzinfo=dt.timezone.utc).date()
-
-                # reset the surrogate key every day
-                if curr_date != row_date:
-                    curr_date = row_date
-                    sk_idx = 0
-
-                sk_idx += 1
-
-                renamed.append(
-                    models.BIServer.validated_init(
-                        **{
-                            "cluster_guid": ts.session_context.thoughtspot.cluster_id,
-                            "sk_dummy": f"{ts.session_context.thoughtspot.cluster_id}-{row_date}-{sk_idx}",
-                            "org_id": row.get("Org Id", 0),
-                            "incident_id": row["Incident Id"],
-                            "timestamp": row["Timestamp"],
-                            "url": row["URL"],
-                            "http_response_code": row["HTTP Response Code"],
-                            "browser_type": row["Browser Type"],
-                            "browser_version": row["Browser Version"],
-                            "client_type": row["Client Type"],
-                            "client_id": row["Client Id"],
-                            "answer_book_guid": row["Answer Book GUID"],
-                            "viz_id": row["Viz Id"],
-                            "user_id": row["User Id"],
-                            "user_action": row["User Action"],
-                            "query_text": row["Query Text"],
-                            "response_size": row["Total Response Size"],
-                            "latency_us": row["Total Latency (us)"],
-                            "impressions": row["Total Impressions"],
-                        }
-                    ).model_dump()
-                )
+    with utils.CheckpointStore(ts.config.temp_dir / "checkpoints.db", run=run, resume=resume) as checkpoints:
+        pending = [w for w in windows if not checkpoints.is_complete("ts_bi_server", chunk=w[0])]
+        resuming = len(pending) < len(windows)
+
+        with sync_utils.incremental_dump(syncer, "ts_bi_server", resuming=resuming) as dump:
 
-        with tasks["syncer_dump"]:
-            syncer.dump("ts_bi_server", data=renamed)
+            def write_window(item: tuple[Optional[dt.datetime], list[dict]]) -> None:
+                window_start, rows = item
+                dump(rows)
+                checkpoints.complete("ts_bi_server", chunk=window_start)
+
+            with LiveTasks(tasks, console=rich_console) as tasks:
+                # Rows are written in the background for as long as they're being collected, then checkpointed.
+                with tasks["syncer_dump"], utils.WritePipeline(write_window) as pipeline:
+                    with tasks["gather_search"]:
+                        for window_start, window_end in pending:
+                            data = ts.search(search_tokens(window_start, window_end), worksheet="TS: BI Server")
+                            pipeline.put((window_start, to_bi_server_rows(data)))
+
+
+@app.command()
+def compact(
+    syncer: DSyncer = typer.Option(
+        ...,
+        click_type=SyncerProtocolType(),
+        help="protocol and path for options to pass to the syncer",
+        rich_help_panel="Syncer Options",
+    ),
+    directive: list[str] = typer.Option(
+        ["ts_bi_server", "ts_audit_logs"], help="the datasets to compact, can be specified multiple times"
+    ),
+):
+    """
+    Merge the small files within each partition of a Parquet dataset.
+
+    Incremental runs of bi-server and audit-logs add new files to a partitioned dataset
+    on each run, this rewrites each partition as a single file.
+    """
+    if syncer.protocol != "parquet":
+        log.error(f"Only the parquet syncer supports compaction, got '{syncer.protocol}'")
+        raise typer.Exit(1)
+
+    for name in directive:
+        removed = syncer.compact(name)
+        log.info(f"Compacted [b blue]{name}[/], removed {removed} files")
 
 
 @app.command("gather", dependencies=[thoughtspot], hidden=True)
@@ -409,6 +506,7 @@ def metadata(
         help="protocol and path for options to pass to the syncer",
         rich_help_panel="Syncer Options",
     ),
+    resume: bool = typer.Option(False, "--resume", help="skip the stages completed by the last, interrupted run"),
 ):
     """
     Extract metadata from your ThoughtSpot platform.
@@ -436,24 +534,32 @@ def metadata(
     # Silence the intermediate logger.
     logging.getLogger("cs_tools.sync.sqlite.syncer").setLevel(logging.CRITICAL)
 
-    with Live(table, console=rich_console, auto_refresh=1):
+    cluster_uuid = ts.session_context.thoughtspot.cluster_id
+    run = f"searchable-metadata/{cluster_uuid}/{org_override}/{include_column_access}"
+
+    # Each stage is checkpointed once its rows are staged in the intermediate database, which outlives the run.
+    checkpoints = utils.CheckpointStore(ts.config.temp_dir / "checkpoints.db", run=run, resume=resume)
+
+    with checkpoints, Live(table, console=rich_console, auto_refresh=1):
         temp_sync.dump(models.Cluster.__tablename__, data=transform.to_cluster(ts.session_context))
-        cluster_uuid = ts.session_context.thoughtspot.cluster_id
 
         for row, org_id in zip(table.data, orgs):
             if ts.session_context.thoughtspot.is_orgs_enabled:
                 ts.org.switch(org_id)
                 row[1] = ":fire:"
 
-                # org info
-                r = ts.api.v1.org_read(org_id=org_id)
-                temp_sync.dump(models.Org.__tablename__, data=transform.to_org(r.json(), cluster=cluster_uuid))
+                if not checkpoints.is_complete("org", org=org_id):
+                    # org info
+                    r = ts.api.v1.org_read(org_id=org_id)
+                    temp_sync.dump(models.Org.__tablename__, data=transform.to_org(r.json(), cluster=cluster_uuid))
+
+                    # org_membership
+                    r = ts.api.v1.user_read()
+                    members = {tuple(m.values()) for m in temp_sync.load(models.OrgMembership.__tablename__)}
+                    transformed = transform.to_org_membership(r.json(), cluster=cluster_uuid, ever_seen=members)
+                    temp_sync.dump(models.OrgMembership.__tablename__, data=transformed)
+                    checkpoints.complete("org", org=org_id)
 
-                # org_membership
-                r = ts.api.v1.user_read()
-                members = {tuple(m.values()) for m in temp_sync.load(models.OrgMembership.__tablename__)}
-                transformed = transform.to_org_membership(r.json(), cluster=cluster_uuid, ever_seen=members)
-                temp_sync.dump(models.OrgMembership.__tablename__, data=transformed)
                 row[1] = ":file_folder:"
             else:
                 default_org = {"orgId": 0, "orgName": "ThoughtSpot", "description": "Your cluster is not orgs enabled."}
@@ -463,79 +569,106 @@ def metadata(
             row[2] = ":fire:"
             # user
             # group_membership
-            r = ts.api.v1.user_read()
-            members = {m["user_guid"] for m in temp_sync.load(models.User.__tablename__)}
-            temp_sync.dump(
-                models.User.__tablename__, data=transform.to_user(r.json(), cluster=cluster_uuid, ever_seen=members)
-            )
-            temp_sync.dump(
-                models.GroupMembership.__tablename__, data=transform.to_group_membership(r.json(), cluster=cluster_uuid)
-            )
+            if not checkpoints.is_complete("user", org=org_id):
+                r = ts.api.v1.user_read()
+                members = {m["user_guid"] for m in temp_sync.load(models.User.__tablename__)}
+                temp_sync.dump(
+                    models.User.__tablename__, data=transform.to_user(r.json(), cluster=cluster_uuid, ever_seen=members)
+                )
+                temp_sync.dump(
+                    models.GroupMembership.__tablename__,
+                    data=transform.to_group_membership(r.json(), cluster=cluster_uuid),
+                )
+                checkpoints.complete("user", org=org_id)
+
             row[2] = ":file_folder:"
 
             row[3] = ":fire:"
             # group
             # group_privilege
             # group_membership
-            r = ts.api.v1.group_read()
-            temp_sync.dump(models.Group.__tablename__, data=transform.to_group(r.json(), cluster=cluster_uuid))
-            temp_sync.dump(
-                models.GroupPrivilege.__tablename__, data=transform.to_group_privilege(r.json(), cluster=cluster_uuid)
-            )
-            temp_sync.dump(
-                models.GroupMembership.__tablename__, data=transform.to_group_membership(r.json(), cluster=cluster_uuid)
-            )
+            if not checkpoints.is_complete("group", org=org_id):
+                r = ts.api.v1.group_read()
+                temp_sync.dump(models.Group.__tablename__, data=transform.to_group(r.json(), cluster=cluster_uuid))
+                temp_sync.dump(
+                    models.GroupPrivilege.__tablename__,
+                    data=transform.to_group_privilege(r.json(), cluster=cluster_uuid),
+                )
+                temp_sync.dump(
+                    models.GroupMembership.__tablename__,
+                    data=transform.to_group_membership(r.json(), cluster=cluster_uuid),
+                )
+                checkpoints.complete("group", org=org_id)
+
             row[3] = ":file_folder:"
 
             row[4] = ":fire:"
             # tags
-            r = ts.tag.all()
-            temp_sync.dump(models.Tag.__tablename__, data=transform.to_tag(r, cluster=cluster_uuid))
+            if not checkpoints.is_complete("tag", org=org_id):
+                r = ts.tag.all()
+                temp_sync.dump(models.Tag.__tablename__, data=transform.to_tag(r, cluster=cluster_uuid))
+                checkpoints.complete("tag", org=org_id)
+
             row[4] = ":file_folder:"
 
             row[5] = ":fire:"
             # metadata
-            content = [
-                *ts.logical_table.all(exclude_system_content=False, include_data_source=True, raise_on_error=False),
-                *ts.answer.all(exclude_system_content=False, raise_on_error=False),
-                *ts.liveboard.all(exclude_system_content=False, raise_on_error=False),
-            ]
-
-            members = {
-                (m["cluster_guid"], m["org_id"], m["object_guid"])
-                for m in temp_sync.load(models.MetadataObject.__tablename__)
-            }
-            temp_sync.dump(
-                models.DataSource.__tablename__, data=transform.to_data_source(content, cluster=cluster_uuid)
-            )
-            temp_sync.dump(
-                models.MetadataObject.__tablename__,
-                data=transform.to_metadata_object(content, cluster=cluster_uuid, ever_seen=members),
-            )
-            temp_sync.dump(
-                models.TaggedObject.__tablename__, data=transform.to_tagged_object(content, cluster=cluster_uuid)
-            )
+            # Later stages work from this content, so it's kept along with the checkpoint.
+            if checkpoints.is_complete("metadata", org=org_id):
+                content = checkpoints.staged("metadata", org=org_id)
+            else:
+                content = [
+                    *ts.logical_table.all(exclude_system_content=False, include_data_source=True, raise_on_error=False),
+                    *ts.answer.all(exclude_system_content=False, raise_on_error=False),
+                    *ts.liveboard.all(exclude_system_content=False, raise_on_error=False),
+                ]
+
+                members = {
+                    (m["cluster_guid"], m["org_id"], m["object_guid"])
+                    for m in temp_sync.load(models.MetadataObject.__tablename__)
+                }
+                temp_sync.dump(
+                    models.DataSource.__tablename__, data=transform.to_data_source(content, cluster=cluster_uuid)
+                )
+                temp_sync.dump(
+                    models.MetadataObject.__tablename__,
+                    data=transform.to_metadata_object(content, cluster=cluster_uuid, ever_seen=members),
+                )
+                temp_sync.dump(
+                    models.TaggedObject.__tablename__, data=transform.to_tagged_object(content, cluster=cluster_uuid)
+                )
+                checkpoints.complete("metadata", org=org_id, data=content)
+
             row[5] = ":file_folder:"
 
             # columns
             # synonyms
             row[6] = ":fire:"
-            guids = [obj["id"] for obj in content if obj["metadata_type"] == "LOGICAL_TABLE"]
-            r = ts.logical_table.columns(guids)
-            temp_sync.dump(
-                models.MetadataColumn.__tablename__, data=transform.to_metadata_column(r, cluster=cluster_uuid)
-            )
-            temp_sync.dump(
-                models.ColumnSynonym.__tablename__, data=transform.to_column_synonym(r, cluster=cluster_uuid)
-            )
+            if checkpoints.is_complete("columns", org=org_id):
+                columns = checkpoints.staged("columns", org=org_id)
+            else:
+                guids = [obj["id"] for obj in content if obj["metadata_type"] == "LOGICAL_TABLE"]
+                columns = ts.logical_table.columns(guids)
+                temp_sync.dump(
+                    models.MetadataColumn.__tablename__,
+                    data=transform.to_metadata_column(columns, cluster=cluster_uuid),
+                )
+                temp_sync.dump(
+                    models.ColumnSynonym.__tablename__, data=transform.to_column_synonym(columns, cluster=cluster_uuid)
+                )
+                checkpoints.complete("columns", org=org_id, data=columns)
+
             row[6] = ":file_folder:"
 
             # dependents
             row[7] = ":fire:"
-            r = ts.metadata.dependents([column["column_guid"] for column in r], for_columns=True)
-            temp_sync.dump(
-                models.DependentObject.__tablename__, data=transform.to_dependent_object(r, cluster=cluster_uuid)
-            )
+            if not checkpoints.is_complete("dependents", org=org_id):
+                r = ts.metadata.dependents([column["column_guid"] for column in columns], for_columns=True)
+                temp_sync.dump(
+                    models.DependentObject.__tablename__, data=transform.to_dependent_object(r, cluster=cluster_uuid)
+                )
+                checkpoints.complete("dependents", org=org_id)
+
             row[7] = ":file_folder:"
 
             # access_controls
@@ -551,22 +684,59 @@ def metadata(
             #    complete. We can probably find a better algorithm.
             #
             for metadata_type in types:
+                if checkpoints.is_complete("access_controls", org=org_id, chunk=metadata_type):
+                    continue
+
                 guids = [obj["id"] for obj in content if obj["metadata_type"] == metadata_type]
                 r = ts.metadata.permissions(guids, metadata_type=metadata_type)
                 temp_sync.dump(
                     models.SharingAccess.__tablename__, data=transform.to_sharing_access(r, cluster=cluster_uuid)
                 )
+                checkpoints.complete("access_controls", org=org_id, chunk=metadata_type)
 
             row[8] = ":file_folder:"
 
             # GO TO NEXT ORG BATCH -->
 
         # WRITE ALL THE COMBINED DATA TO THE TARGET SYNCER
-        is_syncer_initialized_as_db_truncate = syncer.is_database_syncer and syncer.load_strategy == "TRUNCATE"
-
-        for model in models.METADATA_MODELS:
-            for idx, rows in enumerate(temp_sync.read_stream(tablename=model.__tablename__, batch=1_000_000), start=1):
-                if is_syncer_initialized_as_db_truncate:
-                    syncer.load_strategy = "TRUNCATE" if idx == 1 else "APPEND"
-
-                syncer.dump(model.__tablename__, data=[model.validated_init(**row).model_dump() for row in rows])
+        #   Each round holds one batch of every table in memory at once, so batches are kept small.
+        streams = {
+            model.__tablename__: (model, temp_sync.read_stream(tablename=model.__tablename__, batch=50_000))
+            for model in models.METADATA_MODELS
+        }
+
+        # The first round replaces the table's contents, the rest are added to it, while a SWAP only replaces each table
+        # once every round is written. Each table's batch is checkpointed on its own, because dump_many() may commit
+        # one table at a time. Batches are only checkpointed if the Syncer keeps them when the command later fails.
+        keeps_batches = syncer.commits_per_dump()
+
+        with sync_utils.incremental_writes(syncer) as next_write:
+            # Each round takes the next batch of every table, so that independent tables can be written concurrently.
+            for idx in itertools.count(start=1):
+                directives = {}
+
+                for tablename, (model, stream) in list(streams.items()):
+                    if (rows := next(stream, None)) is None:
+                        streams.pop(tablename)
+                        continue
+
+                    # Batches written by the interrupted run only need to be read past.
+                    if keeps_batches and checkpoints.is_complete("sync", chunk=f"{idx}/{tablename}"):
+                        continue
+
+                    directives[tablename] = [model.validated_init(**row).model_dump() for row in rows]
+
+                if not streams:
+                    break
+
+                # Every round keeps its own strategy, even when the interrupted run already wrote some of its tables.
+                next_write()
+
+                if directives and keeps_batches:
+                    syncer.dump_many(
+                        directives,
+                        on_written=lambda tablename, idx=idx: checkpoints.complete("sync", chunk=f"{idx}/{tablename}"),
+                    )
+
+                elif directives:
+                    syncer.dump_many(directives)
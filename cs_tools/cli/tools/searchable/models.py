@@ -279,6 +279,8 @@ class AuditLogs(ValidatedSQLModel, table=True):
     description: str
     details: str = Field(sa_column_kwargs={"comment": "JSON body of the Log Event"})
 
+    _clustered_on = pydantic.PrivateAttr(["timestamp"])
+
 
 class BIServer(ValidatedSQLModel, table=True):
     __tablename__ = "ts_bi_server"
@@ -302,6 +304,8 @@ class BIServer(ValidatedSQLModel, table=True):
     latency_us: Optional[int] = Field(sa_column=Column(BigInteger))
     impressions: Optional[float]
 
+    _clustered_on = pydantic.PrivateAttr(["timestamp"])
+
     @pydantic.field_validator("timestamp", mode="before")
     @classmethod
     def check_valid_utc_datetime(cls, value: Any) -> dt.datetime:
@@ -5,7 +5,6 @@ import collections.abc
 import itertools as it
 import logging
 import pathlib
-import urllib.parse
 
 import click
 import pendulum
@@ -15,6 +14,7 @@ import sqlalchemy
 from cs_tools._compat import StrEnum
 from cs_tools.cli.dependencies.syncer import DSyncer
 from cs_tools.errors import ConfigDoesNotExist
+from cs_tools.sync import base as sync_base
 
 log = logging.getLogger(__name__)
 
@@ -150,7 +150,7 @@ class SyncerProtocolType(click.ParamType):
         return "protocol://DEFINITION.toml"
 
     def _sanitize_definition(self, definition):
-        if definition.endswith("toml"):
+        if sync_base.is_definition_file(definition):
             definition_fp = pathlib.Path(definition)
 
             if not definition_fp.exists():
@@ -160,15 +160,13 @@ class SyncerProtocolType(click.ParamType):
 
             return {"definition_fp": definition_fp}
 
-        query_string = urllib.parse.urlparse(f"proto://?{definition}").query
-        definition_kw = {k: vs[0] for k, vs in urllib.parse.parse_qs(query_string).items()}
-        return {"definition_kw": definition_kw}
+        return {"definition_kw": sync_base.parse_definition(definition)}
 
     def convert(self, value, param, ctx):  # noqa: ARG002
         if value is None:
             return value
 
-        proto, definition_str = value.split("://")
+        proto, definition_str = value.split("://", maxsplit=1)
         definition = self._sanitize_definition(definition_str)
         syncer_dependency = DSyncer(protocol=proto, parameters=[], **definition, models=self.models)
         ctx.command.dependencies.append(syncer_dependency)
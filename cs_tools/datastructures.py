@@ -69,7 +69,8 @@ class ValidatedSQLModel(sqlmodel.SQLModel):
 
     model_config = sqlmodel._compat.SQLModelConfig(env_prefix="CS_TOOLS_SYNCER_", **_COMMON_MODEL_CONFIG)
 
-    _clustered_on: Optional[list[sa.Column]] = pydantic.PrivateAttr(None)
+    _clustered_on: Optional[list[str]] = pydantic.PrivateAttr(None)
+    """Names of the columns which the table is physically ordered by, if not its primary key."""
 
     @pydantic.model_serializer(mode="wrap")
     def _ignore_extras(self, handler) -> dict[str, Any]:
@@ -82,10 +83,25 @@ class ValidatedSQLModel(sqlmodel.SQLModel):
         sanitized = cls.model_validate(data, context=context)
         return cls(**sanitized.model_dump())
 
+    @classmethod
+    def is_clustered(cls) -> bool:
+        """Whether the table declares columns to be physically ordered by, rather than its primary key."""
+        return cls.__private_attributes__["_clustered_on"].default is not None
+
+    @classmethod
+    def clustering_columns(cls) -> list[sa.Column]:
+        """Define the sorting strategy for the given table, without needing an instance."""
+        names = cls.__private_attributes__["_clustered_on"].default
+
+        if names is None:
+            return list(cls.__table__.primary_key)
+
+        return [cls.__table__.columns[name] for name in names]
+
     @property
     def clustered_on(self) -> list[sa.Column]:
         """Define the sorting strategy for the given table."""
-        return self.__table__.primary_key if self._clustered_on is None else self._clustered_on
+        return self.clustering_columns()
 
 
 class ExecutionEnvironment(_GlobalSettings):
@@ -1,17 +1,24 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Literal, Optional
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, Callable, Literal, Optional
+import concurrent.futures as cf
+import contextlib
 import functools as ft
 import importlib.util
 import logging
 import pathlib
 import sys
+import threading
+import urllib.parse
+import uuid
 import warnings
 
 from packaging.requirements import Requirement
 import pydantic
 import sqlalchemy as sa
 import sqlmodel
+import toml
 
 from cs_tools import errors, utils
 from cs_tools.datastructures import ValidatedSQLModel, _GlobalModel, _GlobalSettings
@@ -128,11 +135,29 @@ class Syncer(_GlobalSettings):
         """Will be called after __init__()."""
         pass
 
+    def __teardown__(self, exc: Optional[BaseException] = None) -> None:
+        """
+        Will be called once the command is finished with the Syncer.
+
+        When the command failed, exc is the error it failed with. Side effects which finalize
+        the output (eg. replacing a file) should then be skipped.
+        """
+        pass
+
     def __repr__(self) -> str:
         return f"<Syncer to '{self.name}'>"
 
     __str__ = __repr__
 
+    @property
+    def is_database_syncer(self) -> bool:
+        """Whether rows are written to Database tables, which must be created before they're written to."""
+        return isinstance(self, DatabaseSyncer)
+
+    def commits_per_dump(self) -> bool:
+        """Whether rows outlive a failed command as soon as dump() returns, so an interrupted command may resume."""
+        return False
+
     def load(self, directive: str) -> TableRows:
         """Fetch data from the external data source."""
         raise NotImplementedError(f"There is no default implementation for {self.__class__.__name__}.load")
@@ -141,18 +166,50 @@ class Syncer(_GlobalSettings):
         """Send data to the external data source."""
         raise NotImplementedError(f"There is no default implementation for {self.__class__.__name__}.dump")
 
+    def dump_many(
+        self, directives: dict[str, TableRows], *, on_written: Optional[Callable[[str], None]] = None
+    ) -> None:
+        """
+        Send data for many directives to the external data source.
+
+        If given, on_written is called with each directive once its data has been written.
+        """
+        for directive, data in directives.items():
+            self.dump(directive, data=data)
+
+            if on_written is not None:
+                on_written(directive)
+
 
 class DatabaseSyncer(Syncer, is_base_class=True):
     """A connection to an Database."""
 
     metadata: sqlmodel.MetaData = sqlmodel.MetaData()
     models: list[type[ValidatedSQLModel]] = []  # noqa: RUF012
-    load_strategy: Literal["APPEND", "TRUNCATE", "UPSERT"] = "APPEND"
+    load_strategy: Literal["APPEND", "TRUNCATE", "UPSERT", "SWAP"] = "APPEND"
+    pool_size: int = pydantic.Field(default=5, ge=1)
+    pool_pre_ping: bool = False
+    dump_parallelism: int = pydantic.Field(default=1, ge=1)
 
     # To be defined during __init__() by subclasses of the DatabaseSyncer
     _engine: sa.engine.Engine = None
     _session: sa.orm.Session = None
 
+    _local: threading.local = None
+    """Holds the Session of a dump_many() worker, for the thread it runs in."""
+
+    _clustering: dict[str, list[str]] = {}  # noqa: RUF012
+    """The column names each table is physically ordered by."""
+
+    _shadows: Optional[dict[str, sa.Table]] = None
+    """The shadow of each table in an incremental SWAP load, these are only swapped in once the load ends."""
+
+    __sorts_by_clustering__: bool = False
+    """Whether writing rows in clustering order lets the Database prune its storage when reading, eg. zone maps."""
+
+    __commits_per_dump__: bool = False
+    """Whether dump() commits its own transaction, rather than leaving it for teardown to commit."""
+
     @pydantic.field_validator("load_strategy", mode="before")
     def case_insensitive(cls, value: str) -> str:
         return value.upper()
@@ -165,8 +222,16 @@ class DatabaseSyncer(Syncer, is_base_class=True):
     @property
     def session(self) -> sa.orm.Session:
         """The SQLALchemy session which represents an active connection to our Database."""
+        if self._local is not None and getattr(self._local, "session", None) is not None:
+            return self._local.session
+
         return self._session
 
+    @property
+    def pool_options(self) -> dict[str, Any]:
+        """Connection pool configuration, to pass along to sa.create_engine()."""
+        return {"pool_size": self.pool_size, "pool_pre_ping": self.pool_pre_ping}
+
     def __finalize__(self) -> None:
         # Metaclass-ish wizardry to determine if the DatabaseSyncer subclass defines the necessary properties.
         if self._engine is None:
@@ -186,8 +251,328 @@ class DatabaseSyncer(Syncer, is_base_class=True):
 
         log.debug(f"Attempting CREATE TABLE {[t.name for t in self.metadata.sorted_tables]} in {self!r}")
         self.metadata.create_all(self._engine, tables=list(self.metadata.sorted_tables))
+
+        self._clustering = {}
+
+        for model in self.models:
+            # Primary keys are already indexed (or are the natural ordering) in most databases, so only tables which
+            # declare their clustering are clustered.
+            if not model.is_clustered():
+                continue
+
+            table = self.table(model.__tablename__)
+            columns = [column.name for column in model.clustering_columns()]
+            self._clustering[table.name] = columns
+            self.cluster_table(table, columns=columns)
+
+        self._local = threading.local()
         self._session = sa.orm.Session(self._engine)
         self._session.begin()
 
     def __repr__(self) -> str:
         return f"<DatabaseSyncer to '{self.name}'>"
+
+    def commits_per_dump(self) -> bool:
+        # A SWAP only replaces the table once every write of the load has been made.
+        return self.__commits_per_dump__ and self.load_strategy != "SWAP"
+
+    def table(self, tablename: str) -> sa.Table:
+        """Fetch the Table, qualifying it with the MetaData schema if one is set."""
+        if self.metadata.schema is None:
+            return self.metadata.tables[tablename]
+
+        return self.metadata.tables[f"{self.metadata.schema}.{tablename}"]
+
+    def create_model_table(self, model: type[sqlmodel.SQLModel]) -> None:
+        """CREATE TABLE for a model which is only defined once the Syncer is running, if it does not already exist."""
+        model.__table__.to_metadata(self.metadata, schema=None)
+        self.metadata.create_all(self._engine, tables=[self.table(model.__tablename__)])
+
+    def cluster_table(self, table: sa.Table, *, columns: list[str]) -> None:
+        """Physically organize the table by the given columns, not every Database supports this."""
+        pass
+
+    def create_index(self, table: sa.Table, *, columns: list[str]) -> None:
+        """CREATE INDEX on the table, if it does not already exist."""
+        index = sa.Index(f"ix_{table.name}_{'_'.join(columns)}", *(table.columns[name] for name in columns))
+        index.create(self._engine, checkfirst=True)
+
+    def sort_by_clustering(self, tablename: str, *, data: TableRows) -> TableRows:
+        """Order rows by the table's clustering columns, so they're written in physical order."""
+        if not self.__sorts_by_clustering__:
+            return data
+
+        if not (columns := self._clustering.get(tablename)):
+            return data
+
+        # NULLs sort last, and are never compared against values.
+        return sorted(data, key=lambda row: tuple((True,) if row[c] is None else (False, row[c]) for c in columns))
+
+    def shadow_table(self, table: sa.Table) -> sa.Table:
+        """CREATE an empty copy of the Table to load into, for the SWAP load_strategy."""
+        shadow = sa.Table(
+            f"{table.name}_swap_{uuid.uuid4().hex[:5]}",
+            sa.MetaData(schema=table.schema),
+            *(sa.Column(c.name, c.type, primary_key=c.primary_key, nullable=c.nullable) for c in table.columns),
+        )
+        shadow.create(self.session.connection())
+        return shadow
+
+    def dependent_views(self, table: sa.Table) -> list[str]:  # noqa: ARG002
+        """Find the views which select from the Table, not every Database tracks these."""
+        return []
+
+    @contextlib.contextmanager
+    def loading_shadow(self, table: sa.Table) -> Iterator[sa.Table]:
+        """
+        Write to the Table's shadow, then swap it in for the SWAP load_strategy.
+
+        Within swap_once(), every write shares the same shadow and it's only swapped in once
+        the load ends.
+        """
+        if self._shadows is None:
+            shadow = self.shadow_table(table)
+            yield shadow
+            self.swap_table(table, shadow=shadow)
+            return
+
+        if table.key not in self._shadows:
+            self._shadows[table.key] = self.shadow_table(table)
+
+        yield self._shadows[table.key]
+
+    @contextlib.contextmanager
+    def swap_once(self) -> Iterator[None]:
+        """Treat every SWAP write made within the context as a single load, so readers never see it half-finished."""
+        self._shadows = {}
+
+        try:
+            yield
+
+        except BaseException:
+            # The table keeps its previous data, so the partly loaded shadows can go.
+            self.session.rollback()
+
+            for shadow in self._shadows.values():
+                try:
+                    self.drop_shadow(shadow)
+                    self.session.commit()
+                except Exception as e:
+                    log.warning(f"Could not clean up {shadow.name}, drop it manually: {e}")
+                    self.session.rollback()
+
+            raise
+
+        else:
+            for key, shadow in self._shadows.items():
+                self.swap_table(self.metadata.tables[key], shadow=shadow)
+
+        finally:
+            self._shadows = None
+
+    def drop_shadow(self, shadow: sa.Table) -> None:
+        """DROP a shadow which won't be swapped in."""
+        shadow.drop(self.session.connection(), checkfirst=True)
+
+    def swap_table(self, table: sa.Table, *, shadow: sa.Table) -> None:
+        """Replace the Table with its fully loaded shadow, by renaming both within the current transaction."""
+        # Views stay bound to the table they were created on, so it can't be renamed and dropped from under them.
+        if views := self.dependent_views(table):
+            log.info(f"{table.name} is used by views {', '.join(views)}, replacing its rows in place instead")
+            self.session.execute(table.delete())
+            self.session.execute(
+                table.insert().from_select([c.name for c in table.columns], sa.select(*shadow.columns))
+            )
+            shadow.drop(self.session.connection())
+            return
+
+        preparer = self.engine.dialect.identifier_preparer
+        retired = sa.Table(f"{table.name}_retired_{uuid.uuid4().hex[:5]}", sa.MetaData(schema=table.schema))
+
+        # fmt: off
+        SQL_RETIRE = sa.sql.text(f"ALTER TABLE {preparer.format_table(table)} RENAME TO {preparer.quote(retired.name)}")
+        SQL_REPLACE = sa.sql.text(f"ALTER TABLE {preparer.format_table(shadow)} RENAME TO {preparer.quote(table.name)}")
+        # fmt: on
+        self.session.execute(SQL_RETIRE)
+        self.session.execute(SQL_REPLACE)
+        retired.drop(self.session.connection())
+
+        # Indexes belong to the table they were created on, so they left along with the retired table.
+        for index in table.indexes:
+            index.create(self.session.connection(), checkfirst=True)
+
+    def _dump_in_transaction(self, tablename: str, *, data: TableRows) -> sa.engine.Transaction:
+        """Dump rows over a dedicated connection, leaving its transaction open for the caller to finish."""
+        connection = self.engine.connect()
+        transaction = connection.begin()
+
+        # SQLALCHEMY DOCS:
+        #   In rollback_only mode, Session.commit() inside of .dump() does not end the connection's transaction.
+        #   https://docs.sqlalchemy.org/en/20/orm/session_transaction.html
+        #
+        self._local.session = sa.orm.Session(bind=connection, join_transaction_mode="rollback_only")
+
+        try:
+            self.dump(tablename, data=data)
+
+        except Exception:
+            transaction.rollback()
+            connection.close()
+            raise
+
+        finally:
+            self._local.session.close()
+            self._local.session = None
+
+        return transaction
+
+    def dump_many(
+        self, directives: dict[str, TableRows], *, on_written: Optional[Callable[[str], None]] = None
+    ) -> None:
+        """
+        INSERT rows into many tables concurrently, each over its own pooled connection.
+
+        Nothing is committed until every table has been written, and all of them are rolled
+        back if any write fails. Each table then commits its own transaction in turn, so if a
+        commit fails the tables before it stay committed and the rest are rolled back. Only
+        the committed tables are passed to on_written.
+
+        Work already done in this Syncer's own Session is committed up front, so that the
+        other connections can see it.
+        """
+        workers = min(self.dump_parallelism, self.pool_size, len(directives))
+
+        if workers <= 1:
+            return super().dump_many(directives, on_written=on_written)
+
+        # Work done in our own Session must be visible to the other connections.
+        self.session.commit()
+
+        transactions: dict[str, sa.engine.Transaction] = {}
+        failures: list[BaseException] = []
+
+        with cf.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dump_many") as pool:
+            futures = {pool.submit(self._dump_in_transaction, t, data=d): t for t, d in directives.items()}
+
+            for future in cf.as_completed(futures):
+                if (exc := future.exception()) is not None:
+                    log.error(f"Failed to write {futures[future]} to {self}: {exc}")
+                    failures.append(exc)
+                else:
+                    transactions[futures[future]] = future.result()
+
+        try:
+            # Commit in the order the tables were given, rather than the order they finished in.
+            for tablename in (t for t in directives if t in transactions):
+                transaction = transactions[tablename]
+
+                if failures:
+                    transaction.rollback()
+                    continue
+
+                try:
+                    transaction.commit()
+                except Exception as exc:
+                    log.error(f"Failed to commit {tablename} to {self}: {exc}")
+                    failures.append(exc)
+                    continue
+
+                if on_written is not None:
+                    on_written(tablename)
+
+        finally:
+            for transaction in transactions.values():
+                transaction.connection.close()
+
+        if failures:
+            raise failures[0]
+
+    def read_stream(self, tablename: str, *, batch: int = 100_000) -> Iterator[TableRows]:
+        """Read rows from the Database in batches, over a server-side cursor where the dialect supports it."""
+        # SQLALCHEMY DOCS:
+        #   yield_per implies stream_results, the dialect fetches at most batch rows at a time from the cursor.
+        #   https://docs.sqlalchemy.org/en/20/core/connections.html#using-server-side-cursors-a-k-a-stream-results
+        query = self.table(tablename).select().execution_options(yield_per=batch)
+
+        with self.session.execute(query) as result:
+            for rows in result.partitions():
+                yield [row._asdict() for row in rows]
+
+    # MANDATORY PROTOCOL MEMBERS
+
+    def load(self, tablename: str) -> TableRows:
+        """SELECT rows from the Database."""
+        return [row for rows in self.read_stream(tablename) for row in rows]
+
+
+def syncer_class(protocol: str) -> type[Syncer]:
+    """Import the Syncer which implements the protocol."""
+    if protocol == "custom":
+        _, _, syncer_pathlike = protocol.rpartition("@")
+        syncer_dir = pathlib.Path(syncer_pathlike)
+    else:
+        syncer_dir = utils.get_package_directory("cs_tools") / "sync" / protocol
+
+    manifest = SyncerManifest.model_validate_json(syncer_dir.joinpath("MANIFEST.json").read_text())
+    return manifest.import_syncer_class(fp=syncer_dir / "syncer.py")
+
+
+def is_definition_file(definition: str) -> bool:
+    """Determine if the definition is a path to a TOML file, rather than a query string of parameters."""
+    return "=" not in definition and definition.endswith(".toml")
+
+
+def read_definition_file(fp: pathlib.Path) -> dict[str, Any]:
+    """Read the configuration from a Syncer definition TOML file."""
+    try:
+        conf = toml.load(fp)
+    except toml.TomlDecodeError as e:
+        text = fp.read_text()
+        line = text.splitlines()[e.lineno - 1]
+        trim = line if len(line) < 5 else f"{line[:5]}..."
+        raise errors.CSToolsError(
+            f"Could not parse syncer definition syntax, error on line {e.lineno} beginning with '{trim}'"
+            f"\nSyncer definition path:  {fp}"
+        ) from None
+
+    return conf["configuration"]
+
+
+def parse_definition(definition: str) -> dict[str, Any]:
+    """
+    Parse a Syncer definition into its configuration.
+
+    The definition is either a path to a TOML file or a query string of parameters, eg.
+    directory=.&compression=zstd . Parameters which are given more than once become a list.
+    """
+    if is_definition_file(definition):
+        fp = pathlib.Path(definition)
+
+        if not fp.exists():
+            raise errors.CSToolsError(f"Syncer definition {fp.as_posix()} does not exist.")
+
+        return read_definition_file(fp)
+
+    query_string = urllib.parse.urlparse(f"proto://?{definition}").query
+    return {k: vs[0] if len(vs) == 1 else vs for k, vs in urllib.parse.parse_qs(query_string).items()}
+
+
+def teardown(syncer: Syncer, exc: Optional[BaseException] = None) -> None:
+    """Finish with the Syncer, committing a DatabaseSyncer's transaction only if the command succeeded."""
+    try:
+        syncer.__teardown__(exc)
+
+    except Exception as e:
+        exc = e
+        raise
+
+    finally:
+        if isinstance(syncer, DatabaseSyncer):
+            if exc is None:
+                syncer.session.commit()
+                syncer.session.close()
+            else:
+                # Dialects which commit each dump() only lose the write which was in progress.
+                kept = ", rows committed by earlier writes are kept" if syncer.__commits_per_dump__ else ""
+                log.warning(f"Caught Exception, rolling back transaction{kept}: {type(exc).__name__}: {exc}")
+                syncer.session.rollback()
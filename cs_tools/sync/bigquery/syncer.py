@@ -1,17 +1,22 @@
 from __future__ import annotations
 
-from typing import Union
+from typing import Literal, Optional, Union
+import concurrent.futures as cf
 import datetime as dt
+import io
 import logging
 import pathlib
 import uuid
 
 from google.cloud import bigquery
 from sqlalchemy_bigquery._helpers import create_bigquery_client
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pydantic
 import sqlalchemy as sa
 
-from cs_tools import __version__
+from cs_tools import __version__, errors, utils
+from cs_tools.sync import utils as sync_utils
 from cs_tools.sync.base import DatabaseSyncer
 from cs_tools.sync.types import TableRows
 
@@ -29,8 +34,13 @@ class BigQuery(DatabaseSyncer):
     project_id: str
     dataset: str
     credentials_keyfile: pydantic.FilePath
+    stage_format: Literal["json", "parquet"] = "json"
+    load_batch_size: int = pydantic.Field(default=500_000, ge=1)
+    load_parallelism: int = pydantic.Field(default=4, ge=1)
+    dump_parallelism: int = pydantic.Field(default=4, ge=1)
 
     _bq: bigquery.Client = None
+    _pending_jobs: list[Union[bigquery.LoadJob, bigquery.QueryJob]] = []  # noqa: RUF012
 
     @property
     def bq(self) -> bigquery.Client:
@@ -40,36 +50,108 @@ class BigQuery(DatabaseSyncer):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._engine = sa.create_engine(self.make_url(), connect_args={"client": self.bq}, future=True)
+        self._bq = self.make_client()
+        self._pending_jobs = []
+        self._engine = sa.create_engine(
+            self.make_url(), connect_args={"client": self.bq}, **self.pool_options, future=True
+        )
+
+    def __teardown__(self, exc: Optional[BaseException] = None) -> None:
+        # Jobs are submitted without waiting on them, so that all tables load concurrently. They can't be taken back
+        # once submitted, so they're awaited even when the command failed.
+        try:
+            self.wait_for_pending_jobs()
+
+        except errors.CSToolsError as e:
+            if exc is None:
+                raise
+
+            log.error(f"{e}, while handling: {exc}")
 
     def __repr__(self):
         return f"<BigQuerySyncer to {self.project_id}/{self.dataset}>"
 
-    def make_url(self) -> str:
-        """Create a connection string for the BigQuery JDBC driver."""
+    def make_client(self) -> bigquery.Client:
+        """Create the BigQuery API client."""
         job_config = bigquery.QueryJobConfig()
         job_config.default_dataset = f"{self.project_id}.{self.dataset}"
         job_config.labels = {"query_client": f"thoughtspot_cs_tools_v{__version__.replace('.', '-')}"}
 
-        self._bq = create_bigquery_client(
+        client = create_bigquery_client(
             credentials_path=self.credentials_keyfile,
             default_query_job_config=job_config,
             project_id=self.project_id,
         )
 
+        return client
+
+    def make_url(self) -> str:
+        """Create a connection string for the BigQuery JDBC driver."""
         return f"bigquery://{self.project_id}/{self.dataset}?credentials_path={self.credentials_keyfile}"
 
-    def copy_into(self, *, data: TableRows, into: Union[sa.Table, str], wait: bool = False) -> None:
+    def wait_for_jobs(self, jobs: list[Union[bigquery.LoadJob, bigquery.QueryJob]]) -> None:
+        """Block until every job has completed, raising once all of them have if any failed."""
+        failures: list[tuple[str, Exception]] = []
+
+        for job in jobs:
+            try:
+                job.result()
+            except Exception as e:
+                log.debug(f"BigQuery {job.job_type.upper()} job failed: {job.job_id}", exc_info=True)
+                failures.append((job.job_id, e))
+            else:
+                log.debug(f"BigQuery {job.job_type.upper()} job completed: {job.job_id}")
+
+        if failures:
+            reasons = "\n".join(f"  {job_id}: {e}" for job_id, e in failures)
+            raise errors.CSToolsError(f"{len(failures)} BigQuery jobs failed\n{reasons}") from failures[0][1]
+
+    def wait_for_pending_jobs(self) -> None:
+        """Block until every submitted job has completed."""
+        jobs, self._pending_jobs = self._pending_jobs, []
+        self.wait_for_jobs(jobs)
+
+    def load_job(self, data: TableRows, *, into: bigquery.Table, like: sa.Table) -> bigquery.LoadJob:
+        """Submit a single load job using the BigQuery API."""
+        if self.stage_format == "parquet":
+            # Encode straight from typed Arrow to an in-memory Parquet file, BigQuery infers nothing from text.
+            buffer = io.BytesIO()
+            pq.write_table(pa.Table.from_pylist(data, schema=sync_utils.arrow_schema_from_table(like)), buffer)
+
+            config = bigquery.LoadJobConfig(source_format=bigquery.SourceFormat.PARQUET)
+            job = self.bq.load_table_from_file(buffer, into, job_config=config, rewind=True)
+
+        else:
+            config = bigquery.LoadJobConfig(schema=into.schema)
+            job = self.bq.load_table_from_json(sanitize.clean_for_bq(data), into, job_config=config)
+
+        log.debug(f"BigQuery {job.job_type.upper()} job started: {job.job_id} (>> {job.destination})")
+        return job
+
+    def copy_into(
+        self, *, data: TableRows, into: Union[sa.Table, str], wait: bool = False, like: Optional[sa.Table] = None
+    ) -> None:
         """Implement a COPY INTO statement using the BigQuery API."""
         table = self.bq.get_table(f"{self.project_id}.{self.dataset}.{into}")
-        data = sanitize.clean_for_bq(data)
 
-        config = bigquery.LoadJobConfig(schema=table.schema)
-        job = self.bq.load_table_from_json(data, table, job_config=config)
-        log.debug(f"BigQuery {job.job_type.upper()} job started: {job.job_id} (>> {job.destination})")
+        # Staging tables aren't in our MetaData, so they must tell us which Table they look like.
+        like = into if like is None else like
+        assert isinstance(like, sa.Table), "like= must be provided when loading into a table by name"
 
-        if wait:
-            job.result()
+        # Each batch is uploaded and submitted as its own job, concurrently.
+        with cf.ThreadPoolExecutor(max_workers=self.load_parallelism) as pool:
+            futures = [
+                pool.submit(self.load_job, list(rows), into=table, like=like)
+                for rows in utils.batched(data, n=self.load_batch_size)
+            ]
+
+            jobs = [future.result() for future in futures]
+
+        if not wait:
+            self._pending_jobs.extend(jobs)
+            return
+
+        self.wait_for_jobs(jobs)
 
     def merge_into(self, *, data: TableRows, into: sa.Table) -> None:
         """Implement a MERGE INTO statement using the BigQuery API."""
@@ -85,8 +167,8 @@ class BigQuery(DatabaseSyncer):
         temporary_stage.expires = dt.datetime.now(tz=dt.timezone.utc) + dt.timedelta(hours=1)
         self.bq.update_table(table=temporary_stage, fields=["expires"])
 
-        # PUT (from in-memory)
-        self.copy_into(data=data, into=temporary_stage_name, wait=True)
+        # PUT (from in-memory), the MERGE needs the whole stage to be loaded.
+        self.copy_into(data=data, into=temporary_stage_name, wait=True, like=into)
 
         # MERGE INTO
         joins = [f"SOURCE.{c.name} = TARGET.{c.name}" for c in into.primary_key]
@@ -110,12 +192,55 @@ class BigQuery(DatabaseSyncer):
 
         job = self.bq.query(SQL_MERGE_INTO)
         log.debug(f"BigQuery {job.job_type.upper()} job started: {job.job_id} (>> {job.destination})")
+        self._pending_jobs.append(job)
+
+    def shadow_table(self, table: sa.Table) -> sa.Table:
+        """CREATE an empty copy of the Table, inheriting its schema and clustering fields."""
+        shadow = sa.Table(f"TMP_TABLE_{table.name}_{uuid.uuid4().hex[:5]}", sa.MetaData())
+        target = self.bq.get_table(f"{self.project_id}.{self.dataset}.{table.name}")
+
+        shadow_table = bigquery.Table(table_ref=f"{self.project_id}.{self.dataset}.{shadow.name}", schema=target.schema)
+        shadow_table.clustering_fields = target.clustering_fields
+
+        # SET EXPIRY, in case we never make it to the SWAP.
+        shadow_table.expires = dt.datetime.now(tz=dt.timezone.utc) + dt.timedelta(hours=1)
+        self.bq.create_table(table=shadow_table)
+        return shadow
+
+    def swap_table(self, table: sa.Table, *, shadow: sa.Table) -> None:
+        """Replace the Table with its fully loaded shadow, using a WRITE_TRUNCATE copy job."""
+        # BIGQUERY DOCS:
+        #   Copy jobs are atomic, readers see either the old or the new data and no DML is billed.
+        #   https://cloud.google.com/bigquery/docs/managing-tables#copy-table
+        #
+        config = bigquery.CopyJobConfig(write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE)
+        job = self.bq.copy_table(
+            sources=f"{self.project_id}.{self.dataset}.{shadow.name}",
+            destination=f"{self.project_id}.{self.dataset}.{table.name}",
+            job_config=config,
+        )
+        log.debug(f"BigQuery {job.job_type.upper()} job started: {job.job_id} (>> {job.destination})")
+        job.result()
 
-    def load(self, tablename: str) -> TableRows:
-        """SELECT rows from BigQuery."""
-        table = self.metadata.tables[tablename]
-        rows = self.session.execute(table.select())
-        return [row.model_dump() for row in rows]
+        self.drop_shadow(shadow)
+
+    def drop_shadow(self, shadow: sa.Table) -> None:
+        """Delete a shadow table, which only BigQuery's own client knows about."""
+        self.bq.delete_table(f"{self.project_id}.{self.dataset}.{shadow.name}", not_found_ok=True)
+
+    def cluster_table(self, table: sa.Table, *, columns: list[str]) -> None:
+        """Set the clustering fields of the table."""
+        # BIGQUERY DOCS:
+        #   Clustering fields may be changed on existing tables, at most 4 columns can be specified.
+        #   https://cloud.google.com/bigquery/docs/manage-clustered-tables#modifying-cluster-spec
+        #
+        bq_table = self.bq.get_table(f"{self.project_id}.{self.dataset}.{table.name}")
+
+        if bq_table.clustering_fields == columns[:4]:
+            return
+
+        bq_table.clustering_fields = columns[:4]
+        self.bq.update_table(bq_table, ["clustering_fields"])
 
     def dump(self, tablename: str, *, data: TableRows) -> None:
         """INSERT rows into BigQuery."""
@@ -123,6 +248,7 @@ class BigQuery(DatabaseSyncer):
             log.warning(f"no data to write to syncer {self}")
             return
 
+        data = self.sort_by_clustering(tablename, data=data)
         table = self.metadata.tables[tablename]
 
         if self.load_strategy == "APPEND":
@@ -132,5 +258,9 @@ class BigQuery(DatabaseSyncer):
             self.session.execute(table.delete().where(True))  # type: ignore
             self.copy_into(data=data, into=table)
 
+        if self.load_strategy == "SWAP":
+            with self.loading_shadow(table) as shadow:
+                self.copy_into(data=data, into=shadow.name, wait=True, like=table)
+
         if self.load_strategy == "UPSERT":
             self.merge_into(data=data, into=table)
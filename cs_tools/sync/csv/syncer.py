@@ -1,22 +1,156 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
-from typing import TYPE_CHECKING, Any, Literal, Union
+from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, Union
+import contextlib
 import csv
+import datetime as dt
+import gzip
+import io
+import itertools as it
 import logging
 import pathlib
 
 import pydantic
+import sqlmodel
 
 from cs_tools import utils
 from cs_tools.sync import utils as sync_utils
 from cs_tools.sync.base import Syncer
 
 if TYPE_CHECKING:
+    from cs_tools.datastructures import ValidatedSQLModel
     from cs_tools.sync.types import TableRows
 
 log = logging.getLogger(__name__)
 
+_EXTENSIONS = {"NONE": ".csv", "GZIP": ".csv.gz", "ZSTD": ".csv.zst"}
+
+
+class CSVPartWriter:
+    """
+    An open CSV file, which rolls over to a new numbered part once it grows too large.
+
+    Without any limits, this is just a single file named {filename}.csv (+ the compression
+    extension).
+    """
+
+    def __init__(
+        self, syncer: CSV, filename: str, *, header: list[str], formatters: list[Optional[Callable[[Any], Any]]]
+    ):
+        self.syncer = syncer
+        self.filename = filename
+        self.header = header
+        self.formatters = [(idx, formatter) for idx, formatter in enumerate(formatters) if formatter is not None]
+        self.save_strategy = syncer.save_strategy
+        self.is_rolling = syncer.is_rolling
+        self.extension = _EXTENSIONS[syncer.compression]
+        self.part_number = 0
+        self.rows_in_part = 0
+        self._raw: Optional[io.BufferedWriter] = None
+        self._fd: Optional[io.TextIOWrapper] = None
+        self._writer: Any = None
+
+        if self.is_rolling:
+            existing = sorted(syncer.directory.glob(f"{filename}.[0-9][0-9][0-9][0-9]{self.extension}"))
+
+            if self.save_strategy == "OVERWRITE":
+                for fp in existing:
+                    fp.unlink()
+
+            if self.save_strategy == "APPEND" and existing:
+                self.part_number = int(existing[-1].name[len(filename) + 1 :].split(".")[0]) + 1
+
+    @property
+    def path(self) -> pathlib.Path:
+        if not self.is_rolling:
+            return self.syncer.directory.joinpath(f"{self.filename}{self.extension}")
+
+        return self.syncer.directory.joinpath(f"{self.filename}.{self.part_number:04d}{self.extension}")
+
+    @property
+    def is_full(self) -> bool:
+        if self.syncer.max_rows_per_file is not None and self.rows_in_part >= self.syncer.max_rows_per_file:
+            return True
+
+        if self.syncer.max_file_size_mb is not None and self._raw is not None:
+            return self._raw.tell() >= self.syncer.max_file_size_mb * 1024 * 1024
+
+        return False
+
+    def _open(self) -> None:
+        # Only the first part is subject to the OVERWRITE strategy, later parts are always new files.
+        mode = "ab" if self.save_strategy == "APPEND" else "wb"
+
+        # An appended-to file already has its header. This is checked up front, since compressed streams write their
+        # own header as soon as they're opened.
+        is_new_file = mode == "wb" or not self.path.exists() or self.path.stat().st_size == 0
+
+        self._raw = self.path.open(mode=mode)
+
+        if self.syncer.compression == "GZIP":
+            stream = gzip.GzipFile(fileobj=self._raw, mode=mode, compresslevel=6)
+
+        elif self.syncer.compression == "ZSTD":
+            import zstandard
+
+            stream = zstandard.ZstdCompressor(level=3).stream_writer(self._raw, closefd=False)
+
+        else:
+            stream = self._raw
+
+        self._fd = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+        self._writer = csv.writer(self._fd, **self.syncer.dialect_and_format_parameters())
+        self.rows_in_part = 0
+
+        if self.syncer.header and is_new_file:
+            self._writer.writerow(self.header)
+
+    def close(self) -> None:
+        if self._fd is not None:
+            self._fd.close()
+
+        if self._raw is not None and not self._raw.closed:
+            self._raw.close()
+
+        self._raw, self._fd, self._writer = None, None, None
+
+    def to_values(self, row: dict[str, Any]) -> list[Any]:
+        """Convert a row to a list of formatted values, in header order."""
+        values = [row.get(column) for column in self.header]
+
+        for idx, formatter in self.formatters:
+            values[idx] = formatter(values[idx])
+
+        return values
+
+    def writerows(self, data: TableRows) -> None:
+        """Write rows, rolling over to the next part as necessary."""
+        rows = map(self.to_values, data)
+
+        # Check on the file size every so often, rather than on every row.
+        chunk_size = 10_000
+
+        while True:
+            if self._writer is None:
+                self._open()
+
+            elif self.is_rolling and self.is_full:
+                self.close()
+                self.part_number += 1
+                self._open()
+
+            if self.syncer.max_rows_per_file is not None:
+                chunk_size = min(10_000, self.syncer.max_rows_per_file - self.rows_in_part)
+
+            chunk = list(it.islice(rows, chunk_size))
+
+            if not chunk:
+                break
+
+            self._writer.writerows(chunk)
+            self.rows_in_part += len(chunk)
+
 
 class CSV(Syncer):
     """Interact with a CSV file."""
@@ -32,9 +166,12 @@ class CSV(Syncer):
     date_time_format: str = sync_utils.DATETIME_FORMAT_TSLOAD
     header: bool = True
     save_strategy: Literal["APPEND", "OVERWRITE"] = "OVERWRITE"
+    compression: Literal["NONE", "GZIP", "ZSTD"] = "NONE"
+    max_rows_per_file: Optional[int] = pydantic.Field(default=None, ge=1)
+    max_file_size_mb: Optional[int] = pydantic.Field(default=None, ge=1)
 
-    _written_header: dict[str, bool] = {}  # noqa: RUF012
-    """Whether or not the header has been written for a given file already"""
+    _writers: dict[str, CSVPartWriter] = {}  # noqa: RUF012
+    """The open file for each directive, files are kept open for the life of the Syncer."""
 
     @pydantic.field_validator("directory", mode="after")
     @classmethod
@@ -66,6 +203,24 @@ class CSV(Syncer):
 
         raise ValueError(f"Invalid quoting type: {value}")
 
+    @pydantic.field_validator("compression", mode="before")
+    @classmethod
+    def case_insensitive(cls, value: str) -> str:
+        return value.upper()
+
+    def __finalize__(self) -> None:
+        self._writers = {}
+
+    def __teardown__(self, exc: Optional[BaseException] = None) -> None:
+        for writer in self._writers.values():
+            writer.close()
+
+        self._writers = {}
+
+    def commits_per_dump(self) -> bool:
+        # Files are closed, and so kept, whether or not the command succeeded.
+        return True
+
     def dialect_and_format_parameters(self) -> dict[str, Any]:
         """The specification passed to csv.DictWriter"""
         # fmt: off
@@ -96,39 +251,168 @@ class CSV(Syncer):
         # fmt: on
         return parameters
 
-    def maybe_replace_empty_with_null(self, rows: TableRows) -> TableRows:
-        return [{k: None if v == "" else v for k, v in row.items()} for row in rows]
+    def column_formatters(self, filename: str, *, data: TableRows) -> list[Optional[Callable[[Any], Any]]]:
+        """Determine, once per file, how to format each column's values."""
+        dt_format = self.date_time_format
+
+        def format_datetime(value: Optional[dt.datetime]) -> Any:
+            return value if value is None else value.strftime(dt_format)
+
+        def format_any(value: Any) -> Any:
+            return value.strftime(dt_format) if isinstance(value, dt.datetime) else value
+
+        table = sqlmodel.SQLModel.metadata.tables.get(filename)
+        formatters: list[Optional[Callable[[Any], Any]]] = []
+
+        for column in data[0]:
+            if table is not None and column in table.columns:
+                try:
+                    python_type = table.columns[column].type.python_type
+                except NotImplementedError:
+                    python_type = object
+
+                formatters.append(format_datetime if python_type is dt.datetime else None)
+                continue
+
+            # Without a model, fall back to inspecting values, only columns which contain datetimes need the check.
+            seen = (row[column] for row in data if row[column] is not None)
+            sample = next(seen, None)
+            formatters.append(None if sample is not None and not isinstance(sample, dt.datetime) else format_any)
+
+        return formatters
 
     def __repr__(self):
         return f"<CSVSyncer path='{self.directory}' in '{self.save_strategy}' mode>"
 
-    def read_stream(self, filename: str, *, batch: int = 100_000) -> Iterator[TableRows]:
-        """Read rows from a CSV file in the directory."""
-        path = self.directory.joinpath(f"{filename}.csv")
+    @property
+    def is_rolling(self) -> bool:
+        """Whether each directive is written as many numbered parts, rather than a single file."""
+        return self.max_rows_per_file is not None or self.max_file_size_mb is not None
+
+    def input_paths(self, filename: str) -> list[pathlib.Path]:
+        """Find the files this Syncer writes for the directive, ignoring those of other compressions or layouts."""
+        extension = _EXTENSIONS[self.compression]
+
+        if self.is_rolling:
+            return sorted(self.directory.glob(f"{filename}.[0-9][0-9][0-9][0-9]{extension}"))
+
+        fp = self.directory.joinpath(f"{filename}{extension}")
+        return [fp] if fp.exists() else []
+
+    def column_casters(
+        self,
+        header: list[str],
+        *,
+        model: Optional[type[ValidatedSQLModel]] = None,
+        column_types: Optional[dict[str, type]] = None,
+    ) -> list[Callable[[str], Any]]:
+        """Determine, once per file, how to convert each column's string values."""
+        dt_format = self.date_time_format
+        types = {} if column_types is None else dict(column_types)
+
+        if model is not None:
+            for column in model.__table__.columns:
+                try:
+                    types.setdefault(column.name, column.type.python_type)
+                except NotImplementedError:
+                    types.setdefault(column.name, str)
+
+        # Timestamps are stored in UTC, so a format without an offset was written in UTC as well.
+        has_offset = "%z" in dt_format
+
+        def to_datetime(value: str) -> dt.datetime:
+            try:
+                if has_offset:
+                    return dt.datetime.strptime(value, dt_format).astimezone(dt.timezone.utc)
+
+                return dt.datetime.strptime(value, dt_format).replace(tzinfo=dt.timezone.utc)
+
+            except ValueError:
+                parsed = dt.datetime.fromisoformat(value)
+                return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=dt.timezone.utc)
+
+        # fmt: off
+        converters: dict[type, Callable[[str], Any]] = {
+            bool: lambda value: value.lower() in ("true", "t", "yes", "y", "1"),
+            int: int,
+            float: float,
+            dt.datetime: to_datetime,
+            dt.date: dt.date.fromisoformat,
+        }
+        # fmt: on
+
+        casters = []
 
-        if not path.exists():
-            return iter([])
+        for column in header:
+            converter = converters.get(types.get(column, str))
 
-        with path.open(mode="r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f, **self.dialect_and_format_parameters())
+            if converter is None:
+                casters.append(lambda value: None if value == "" else value)
+            else:
+                casters.append(lambda value, convert=converter: None if value == "" else convert(value))
 
-            for rows in utils.batched(reader, n=batch):
-                yield self.maybe_replace_empty_with_null(rows)
+        return casters
 
-    # MANDATORY PROTOCOL MEMBERS
+    def read_stream(
+        self,
+        filename: str,
+        *,
+        batch: int = 100_000,
+        model: Optional[type[ValidatedSQLModel]] = None,
+        column_types: Optional[dict[str, type]] = None,
+    ) -> Iterator[TableRows]:
+        """
+        Read rows from the CSV files in the directory, in batches.
+
+        Provide either a model or explicit column types to convert values from strings.
+        """
+        # Rows written earlier in this session may still be buffered, and a compressed file is only readable once its
+        # trailer is written. Later dumps open the file again.
+        if filename in self._writers:
+            self._writers.pop(filename).close()
 
-    def load(self, filename: str) -> TableRows:
-        """Read rows from a CSV file in the directory."""
-        path = self.directory.joinpath(f"{filename}.csv")
+        for path in self.input_paths(filename):
+            with contextlib.ExitStack() as stack:
+                if path.suffix == ".gz":
+                    f = stack.enter_context(gzip.open(path, mode="rt", newline="", encoding="utf-8"))
 
-        if not path.exists():
-            return []
+                elif path.suffix == ".zst":
+                    import zstandard
 
-        with path.open(mode="r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f, **self.dialect_and_format_parameters())
-            data = self.maybe_replace_empty_with_null(reader)
+                    raw = stack.enter_context(path.open(mode="rb"))
+                    decompressed = stack.enter_context(zstandard.ZstdDecompressor().stream_reader(raw))
+                    f = stack.enter_context(io.TextIOWrapper(decompressed, encoding="utf-8", newline=""))
 
-        return data
+                else:
+                    f = stack.enter_context(path.open(mode="r", newline="", encoding="utf-8"))
+
+                reader = csv.reader(f, **self.dialect_and_format_parameters())
+
+                if self.header:
+                    header = next(reader, [])
+                elif model is not None:
+                    header = [column.name for column in model.__table__.columns]
+                elif column_types is not None:
+                    header = list(column_types)
+                else:
+                    raise ValueError(f"Cannot determine the columns of {path.name}, it has no header row")
+
+                casters = self.column_casters(header, model=model, column_types=column_types)
+
+                for rows in utils.batched(reader, n=batch):
+                    yield [{k: c(v) for k, c, v in zip(header, casters, values)} for values in rows]
+
+    # MANDATORY PROTOCOL MEMBERS
+
+    def load(
+        self,
+        filename: str,
+        *,
+        model: Optional[type[ValidatedSQLModel]] = None,
+        column_types: Optional[dict[str, type]] = None,
+    ) -> TableRows:
+        """Read rows from the CSV files in the directory."""
+        return [row for rows in self.read_stream(filename, model=model, column_types=column_types) for row in rows]
 
     def dump(self, filename: str, *, data: TableRows) -> None:
         """Write rows to a CSV file in the directory."""
@@ -136,15 +420,13 @@ class CSV(Syncer):
             log.warning(f"no data to write to syncer {self}")
             return
 
-        path = self.directory.joinpath(f"{filename}.csv")
-        header = data[0].keys()
-        mode = "a" if self.save_strategy == "APPEND" else "w"
-
-        with path.open(mode=mode, newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=header, **self.dialect_and_format_parameters())
+        # Each OVERWRITE replaces whatever the file held, while APPEND keeps adding to the open file.
+        if self.save_strategy == "OVERWRITE" and filename in self._writers:
+            self._writers.pop(filename).close()
 
-            if self.header and filename not in self._written_header:
-                self._written_header[filename] = True
-                writer.writeheader()
+        if filename not in self._writers:
+            header = list(data[0].keys())
+            formatters = self.column_formatters(filename, data=data)
+            self._writers[filename] = CSVPartWriter(self, filename, header=header, formatters=formatters)
 
-            writer.writerows([sync_utils.format_datetime_values(r, dt_format=self.date_time_format) for r in data])
+        self._writers[filename].writerows(data)
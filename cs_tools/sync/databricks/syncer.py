@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 import base64
+import concurrent.futures as cf
 import logging
 import pathlib
 import uuid
@@ -23,6 +24,8 @@ class Databricks(DatabaseSyncer):
 
     __manifest_path__ = pathlib.Path(__file__).parent / "MANIFEST.json"
     __syncer_name__ = "Databricks"
+    __sorts_by_clustering__ = True
+    __commits_per_dump__ = True
 
     server_hostname: str
     http_path: str
@@ -32,6 +35,10 @@ class Databricks(DatabaseSyncer):
     port: Optional[int] = 443
     temp_dir: Optional[pydantic.DirectoryPath] = pathlib.Path(".")
     use_experimental_dataload: bool = False
+    stage_format: Literal["csv", "parquet"] = "csv"
+    stage_file_size_mb: int = pydantic.Field(default=128, ge=1)
+    stage_parallelism: int = pydantic.Field(default=4, ge=1)
+    dump_parallelism: int = pydantic.Field(default=4, ge=1)
 
     @pydantic.field_validator("access_token", mode="before")
     @classmethod
@@ -42,9 +49,11 @@ class Databricks(DatabaseSyncer):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._engine = sa.create_engine(self.make_url(), future=True)
+        self._engine = sa.create_engine(self.make_url(), **self.pool_options, future=True)
         self.metadata = sqlmodel.MetaData(schema=self.schema_)
-        self.http_session = httpx.Client(base_url=self.server_hostname)
+        self.http_session = httpx.Client(
+            base_url=self.server_hostname, limits=httpx.Limits(max_connections=self.stage_parallelism)
+        )
         self.http_session.headers["Authorization"] = f"Bearer {self.access_token}"
 
     def __repr__(self):
@@ -59,51 +68,87 @@ class Databricks(DatabaseSyncer):
         query = f"http_path={self.http_path}&catalog={self.catalog}&schema={self.schema_}"
         return f"databricks://{username}:{password}@{host}:{port}?{query}"
 
-    def stage_and_put(self, tablename: str, *, data: TableRows) -> str:
-        """Add a local file to Databrick's internal temporary stage."""
-        assert self.temp_dir is not None
-        stage_name = f"TMP_STAGE_{tablename}_{uuid.uuid4().hex[:5]}.csv"
-
+    def dbfs_put(self, fp: pathlib.Path, *, path: str) -> None:
+        """Upload a local file to DBFS."""
         # Further reading:
         #  https://docs.databricks.com/api/workspace/dbfs/create
         #  https://docs.databricks.com/api/workspace/dbfs/addblock
         #  https://docs.databricks.com/api/workspace/dbfs/close
         #
 
-        r = self.http_session.post("api/2.0/dbfs/create", data={"path": f"/mnt/cs_tools/{stage_name}"})
+        r = self.http_session.post("api/2.0/dbfs/create", json={"path": path, "overwrite": True})
         r.raise_for_status()
 
         remote_fh = r.json()["handle"]
 
-        with sync_utils.temp_csv_for_upload(tmp=self.temp_dir, filename=tablename, data=data) as fd:
-            ONE_MB = 1024 * 1024
+        # DBFS accepts at most 1MB per block, read each one into the same buffer rather than allocating anew.
+        ONE_MB = 1024 * 1024
+        block = bytearray(ONE_MB)
+        view = memoryview(block)
 
-            while block_raw := fd.read(ONE_MB):
-                encoded = base64.b64encode(block_raw).decode("utf-8")
-                r = self.http_session.post("api/2.0/dbfs/add-block", data={"handle": remote_fh, "data": encoded})
+        with fp.open(mode="rb") as fd:
+            while size := fd.readinto(block):
+                encoded = base64.b64encode(view[:size]).decode("ascii")
+                r = self.http_session.post("api/2.0/dbfs/add-block", json={"handle": remote_fh, "data": encoded})
                 r.raise_for_status()
 
-        r = self.http_session.post("api/2.0/dbfs/close", data={"handle": remote_fh})
+        r = self.http_session.post("api/2.0/dbfs/close", json={"handle": remote_fh})
+        r.raise_for_status()
+
+    def dbfs_delete(self, path: str) -> None:
+        """Remove a file, or a directory and everything in it, from DBFS."""
+        # Further reading:
+        #  https://docs.databricks.com/api/workspace/dbfs/delete
+        #
+        r = self.http_session.post("api/2.0/dbfs/delete", json={"path": path, "recursive": True})
         r.raise_for_status()
 
-        return stage_name
+    def stage_path_for(self, tablename: str) -> str:
+        """A unique DBFS directory to stage a single load under."""
+        return f"/mnt/cs_tools/TMP_STAGE_{tablename}_{uuid.uuid4().hex[:5]}"
+
+    def stage_and_put(self, tablename: str, *, data: TableRows, path: str) -> None:
+        """Upload data as many files to a directory in DBFS."""
+        assert self.temp_dir is not None
+        max_file_size = self.stage_file_size_mb * 1024 * 1024
+
+        if self.stage_format == "parquet":
+            table = self.table(tablename)
+            files = sync_utils.temp_parquet_parts_for_upload(
+                tmp=self.temp_dir, filename=tablename, table=table, data=data, max_file_size=max_file_size
+            )
+        else:
+            files = sync_utils.temp_csv_parts_for_upload(
+                tmp=self.temp_dir, filename=tablename, data=data, max_file_size=max_file_size, include_header=True
+            )
+
+        # Each file gets its own DBFS handle, so they can be uploaded concurrently over the pooled http_session.
+        with files as parts, cf.ThreadPoolExecutor(max_workers=self.stage_parallelism) as pool:
+            log.debug(f"Staging {len(parts)} {self.stage_format} file(s) for {tablename}")
+            futures = [pool.submit(self.dbfs_put, part, path=f"{path}/{part.name}") for part in parts]
+
+            for future in cf.as_completed(futures):
+                future.result()
 
     def copy_into(self, *, into: str, from_: str) -> None:
         """Implement the COPY INTO statement."""
         #  https://docs.databricks.com/en/ingestion/copy-into/examples.html#load-csv-files-with-copy-into
         #
 
+        if self.stage_format == "parquet":
+            file_format = "PARQUET"
+            format_options = "'mergeSchema' = 'true'"
+        else:
+            file_format = "CSV"
+            format_options = "'mergeSchema' = 'true', 'delimiter' = '|', 'header' = 'true'"
+
         # fmt: off
         SQL_COPY_INTO = sa.sql.text(
             f"""
             COPY INTO {into}
-            FROM '/mnt/cs_tools/{from_}'
-            FILEFORMAT = CSV
-            FORMAT_OPTIONS (
-                'mergeSchema' = 'true',
-                'delimiter' = '|',
-                'header' = 'true'
-            )
+            FROM '{from_}'
+            FILEFORMAT = {file_format}
+            FORMAT_OPTIONS ({format_options})
             COPY_OPTIONS ('mergeSchema' = 'true')
             """
         )
@@ -111,11 +156,116 @@ class Databricks(DatabaseSyncer):
         r = self.session.execute(SQL_COPY_INTO)
         log.debug("Databricks response >> COPY INTO\n%s", r.scalar())
 
-    def load(self, tablename: str) -> TableRows:
-        """SELECT rows from Databricks"""
-        table = self.metadata.tables[f"{self.schema_}.{tablename}"]
-        rows = self.session.execute(table.select())
-        return [row.model_dump() for row in rows]
+    def insert_into(self, into: sa.Table, *, tablename: str, data: TableRows) -> None:
+        """INSERT rows into the table, COPYing them from a DBFS stage with use_experimental_dataload."""
+        if not self.use_experimental_dataload:
+            sync_utils.batched(into.insert().values, session=self.session, data=data, max_parameters=250)
+            return
+
+        # Decided before uploading, so a partial upload is cleaned up too.
+        path = self.stage_path_for(tablename)
+
+        try:
+            self.stage_and_put(tablename=tablename, data=data, path=path)
+            self.copy_into(into=into.name, from_=path)
+
+        finally:
+            try:
+                self.dbfs_delete(path)
+            except httpx.HTTPError as e:
+                log.warning(f"Could not remove staged files from dbfs:{path}: {e}")
+
+    def merge_into(self, *, into: sa.Table, from_: str) -> None:
+        """Implement the MERGE INTO statement."""
+        #  https://docs.databricks.com/en/sql/language-manual/delta-merge-into.html
+        #
+        joins = [f"SOURCE.{c.name} = TARGET.{c.name}" for c in into.primary_key]
+
+        joined = " AND ".join(joins)
+        update = ", ".join(f"TARGET.{c.name} = SOURCE.{c.name}" for c in into.columns if c.name not in into.primary_key)
+        insert = ", ".join(c.name for c in into.columns)
+        values = ", ".join(f"SOURCE.{c.name}" for c in into.columns)
+
+        # fmt: off
+        SQL_MERGE_INTO = sa.sql.text(
+            f"""
+            MERGE INTO {into} AS TARGET
+            USING {from_}     AS SOURCE
+               ON {joined}
+             WHEN     MATCHED THEN UPDATE SET {update}
+             WHEN NOT MATCHED THEN INSERT ({insert}) VALUES ({values})
+            """
+        )
+        # fmt: on
+        r = self.session.execute(SQL_MERGE_INTO)
+        log.debug("Databricks response >> MERGE INTO\n%s", r.scalar())
+
+    def upsert_via_staging_table(self, table: sa.Table, *, data: TableRows) -> None:
+        """Load data into a staging Delta table, then MERGE it into the target in a single statement."""
+        staging = sa.Table(
+            f"TMP_TABLE_{table.name}_{uuid.uuid4().hex[:5]}",
+            sa.MetaData(schema=self.schema_),
+            *(sa.Column(c.name, c.type) for c in table.columns),
+        )
+        staging.create(self.session.connection())
+
+        try:
+            self.insert_into(staging, tablename=table.name, data=data)
+            self.merge_into(from_=f"{staging}", into=table)
+
+        finally:
+            staging.drop(self.session.connection())
+
+    def shadow_table(self, table: sa.Table) -> sa.Table:
+        """CREATE an empty staging Delta table to load into."""
+        shadow = sa.Table(
+            f"TMP_TABLE_{table.name}_{uuid.uuid4().hex[:5]}",
+            sa.MetaData(schema=self.schema_),
+            *(sa.Column(c.name, c.type) for c in table.columns),
+        )
+        shadow.create(self.session.connection())
+        return shadow
+
+    def swap_table(self, table: sa.Table, *, shadow: sa.Table) -> None:
+        """Implement the INSERT OVERWRITE statement."""
+        # DATABRICKS DOCS:
+        #   Overwrites are a single Delta commit, readers see either the old or the new data.
+        #   https://docs.databricks.com/en/sql/language-manual/sql-ref-syntax-dml-insert-into.html
+        #
+        # fmt: off
+        SQL_INSERT_OVERWRITE = sa.sql.text(
+            f"""
+            INSERT OVERWRITE {table} SELECT {", ".join(c.name for c in table.columns)} FROM {shadow}
+            """
+        )
+        # fmt: on
+        try:
+            r = self.session.execute(SQL_INSERT_OVERWRITE)
+            log.debug("Databricks response >> INSERT OVERWRITE\n%s", r.scalar())
+
+        finally:
+            shadow.drop(self.session.connection())
+
+    def cluster_table(self, table: sa.Table, *, columns: list[str]) -> None:
+        """Implement the ALTER TABLE .. CLUSTER BY statement."""
+        # DATABRICKS DOCS:
+        #   Liquid clustering can only be enabled on unpartitioned Delta tables.
+        #   https://docs.databricks.com/en/delta/clustering.html
+        #
+        # fmt: off
+        SQL_CLUSTER_BY = sa.sql.text(
+            f"""
+            ALTER TABLE {self.catalog}.{table} CLUSTER BY ({", ".join(columns)})
+            """
+        )
+        # fmt: on
+        try:
+            with self.engine.begin() as connection:
+                connection.execute(SQL_CLUSTER_BY)
+
+        except sa.exc.DatabaseError as e:
+            log.warning(f"Could not set clustering keys on {table}, see logs for details..")
+            log.debug(e, exc_info=True)
 
     def dump(self, tablename: str, *, data: TableRows) -> None:
         """INSERT rows into Databricks."""
@@ -123,26 +273,19 @@ class Databricks(DatabaseSyncer):
             log.warning(f"no data to write to syncer {self}")
             return
 
+        data = self.sort_by_clustering(tablename, data=data)
         table = self.metadata.tables[f"{self.schema_}.{tablename}"]
 
         if self.load_strategy == "APPEND":
-            if self.use_experimental_dataload:
-                stage = self.stage_and_put(tablename=tablename, data=data)
-                self.copy_into(from_=stage, into=tablename)
-            else:
-                sync_utils.batched(table.insert().values, session=self.session, data=data, max_parameters=250)
+            self.insert_into(table, tablename=tablename, data=data)
 
         if self.load_strategy == "TRUNCATE":
             self.session.execute(table.delete())
-            if self.use_experimental_dataload:
-                stage = self.stage_and_put(tablename=tablename, data=data)
-                self.copy_into(from_=stage, into=tablename)
-            else:
-                sync_utils.batched(table.insert().values, session=self.session, data=data, max_parameters=250)
+            self.insert_into(table, tablename=tablename, data=data)
+
+        if self.load_strategy == "SWAP":
+            with self.loading_shadow(table) as shadow:
+                self.insert_into(shadow, tablename=tablename, data=data)
 
         if self.load_strategy == "UPSERT":
-            # TODO: @sameerjain901, 2024/02/10
-            #   need to investigate COPY->MERGE INTO functionality, similar to how we have in Snowflake syncer
-            #   https://docs.databricks.com/en/sql/language-manual/delta-merge-into.html
-            #
-            sync_utils.generic_upsert(table, session=self.session, data=data, max_params=250)
+            self.upsert_via_staging_table(table, data=data)
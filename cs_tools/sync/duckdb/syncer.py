@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal, Optional, Union
+import logging
+import pathlib
+import uuid
+
+import pyarrow as pa
+import pydantic
+import sqlalchemy as sa
+
+from cs_tools.sync import utils as sync_utils
+from cs_tools.sync.base import DatabaseSyncer
+
+if TYPE_CHECKING:
+    from cs_tools.sync.types import TableRows
+
+log = logging.getLogger(__name__)
+
+
+class DuckDB(DatabaseSyncer):
+    """Interact with a DuckDB database."""
+
+    __manifest_path__ = pathlib.Path(__file__).parent / "MANIFEST.json"
+    __syncer_name__ = "duckdb"
+    __sorts_by_clustering__ = True
+    __commits_per_dump__ = True
+
+    database_path: Union[pydantic.FilePath, pydantic.NewPath]
+    export_directory: Optional[pydantic.DirectoryPath] = None
+    export_compression: Literal["ZSTD", "SNAPPY", "GZIP", "UNCOMPRESSED"] = "ZSTD"
+
+    _dumped: set[str] = set()  # noqa: RUF012
+    """Tables which have been written to during the life of the Syncer."""
+
+    @pydantic.field_validator("database_path", mode="after")
+    def ensure_endswith_duckdb(cls, path: pathlib.Path) -> pathlib.Path:
+        if path.suffix not in (".duckdb", ".db"):
+            raise ValueError("path must be a valid .duckdb file")
+        return path
+
+    @pydantic.field_validator("export_compression", mode="before")
+    def _export_compression_case_insensitive(cls, value: str) -> str:
+        return value.upper()
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._engine = sa.create_engine(f"duckdb:///{self.database_path}", **self.pool_options, future=True)
+        self._dumped = set()
+
+    def __teardown__(self, exc: Optional[BaseException] = None) -> None:
+        # Only export the tables of a command which succeeded. Each dump() is committed on its own, so a failed command
+        # may have written only some of its rows.
+        if self.export_directory is None or exc is not None:
+            return
+
+        for tablename in sorted(self._dumped):
+            self.export_parquet(tablename, directory=self.export_directory)
+
+    def __repr__(self):
+        return f"<DuckDBSyncer conn_string='{self.engine.url}'>"
+
+    def insert_from_arrow(self, table: sa.Table, *, data: TableRows, verb: str = "INSERT") -> None:
+        """Bulk INSERT rows by registering them with DuckDB as an Arrow relation."""
+        # DUCKDB DOCS:
+        #   Arrow tables can be queried directly from the same process, without copying them into DuckDB first.
+        #   https://duckdb.org/docs/guides/python/sql_on_arrow
+        #
+        schema = sync_utils.arrow_schema_from_table(table)
+
+        # DuckDB would read tz-aware timestamps in the session's local time zone, so keep them as naive UTC.
+        naive = pa.schema(
+            pa.field(f.name, pa.timestamp(f.type.unit), nullable=f.nullable) if pa.types.is_timestamp(f.type) else f
+            for f in schema
+        )
+        relation = pa.Table.from_pylist(data, schema=schema).cast(naive)
+
+        preparer = self.engine.dialect.identifier_preparer
+        columns = ", ".join(preparer.quote(c.name) for c in table.columns)
+        view_name = f"cs_tools_arrow_{uuid.uuid4().hex[:8]}"
+
+        # Use the Session's own connection, so the INSERT participates in the current transaction.
+        duckdb_connection = self.session.connection().connection.driver_connection
+        duckdb_connection.register(view_name, relation)
+
+        try:
+            # fmt: off
+            SQL_INSERT = sa.sql.text(
+                f"""
+                {verb} INTO {preparer.format_table(table)} ({columns})
+                SELECT {columns} FROM {view_name}
+                """
+            )
+            # fmt: on
+            r = self.session.execute(SQL_INSERT)
+            log.debug("DuckDB response >> %s\n%s", verb, r.rowcount)
+
+        finally:
+            duckdb_connection.unregister(view_name)
+
+    def export_parquet(self, tablename: str, *, directory: pathlib.Path) -> pathlib.Path:
+        """Write the contents of a table to a Parquet file."""
+        table = self.table(tablename)
+        fp = directory.joinpath(f"{tablename}.parquet")
+
+        # fmt: off
+        SQL_COPY_TO = sa.sql.text(
+            f"""
+            COPY {self.engine.dialect.identifier_preparer.format_table(table)}
+            TO '{fp.resolve().as_posix()}'
+            (FORMAT PARQUET, COMPRESSION {self.export_compression})
+            """
+        )
+        # fmt: on
+        self.session.execute(SQL_COPY_TO)
+        log.debug(f"Exported {tablename} to {fp.as_posix()}")
+        return fp
+
+    # MANDATORY PROTOCOL MEMBERS
+
+    def dump(self, tablename: str, *, data: TableRows) -> None:
+        """INSERT rows into DuckDB."""
+        if not data:
+            log.warning(f"no '{tablename}' data to write to syncer {self}")
+            return
+
+        data = self.sort_by_clustering(tablename, data=data)
+        table = self.table(tablename)
+
+        if self.load_strategy == "APPEND":
+            self.insert_from_arrow(table, data=data)
+
+        if self.load_strategy == "TRUNCATE":
+            self.session.execute(table.delete())
+            self.insert_from_arrow(table, data=data)
+
+        if self.load_strategy == "SWAP":
+            with self.loading_shadow(table) as shadow:
+                self.insert_from_arrow(shadow, data=data)
+
+        if self.load_strategy == "UPSERT":
+            # DUCKDB DOCS:
+            #   https://duckdb.org/docs/sql/statements/insert#insert-or-replace
+            self.insert_from_arrow(table, data=data, verb="INSERT OR REPLACE")
+
+        self._dumped.add(tablename)
+        self.session.commit()
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal, Union
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union
+import datetime as dt
 import logging
+import os
 import pathlib
 
 import openpyxl
 import pydantic
 
+from cs_tools import utils
 from cs_tools.sync import utils as sync_utils
 from cs_tools.sync.base import Syncer
 
@@ -25,10 +29,54 @@ class Excel(Syncer):
     filepath: Union[pydantic.FilePath, pydantic.NewPath]
     date_time_format: str = sync_utils.DATETIME_FORMAT_ISO_8601
     save_strategy: Literal["APPEND", "OVERWRITE"] = "OVERWRITE"
+    write_only: bool = False
 
     def __init__(self, **data):
         super().__init__(**data)
-        self.workbook = self._load_workbook()
+
+        if self.write_only:
+            # The Workbook is built in a single pass and only saved once, when the Syncer is torn down.
+            self.workbook = openpyxl.Workbook(write_only=True)
+        else:
+            self.workbook = self._load_workbook()
+
+    def __teardown__(self, exc: Optional[BaseException] = None) -> None:
+        # A failed command leaves the original file untouched.
+        if not self.write_only or exc is not None:
+            return
+
+        # A write-only Workbook replaces the file entirely, so carry over any tabs we didn't touch.
+        for tab_name in self._existing_tab_names():
+            if tab_name not in self.workbook.sheetnames:
+                self.carry_over(tab_name)
+
+        if not self.workbook.sheetnames:
+            return
+
+        # Write alongside the original first, since existing tabs are streamed from it, and only replace it once the
+        # new Workbook has been saved in full.
+        temp = self.filepath.with_name(f".{self.filepath.name}.tmp")
+
+        try:
+            self.workbook.save(temp)
+            os.replace(temp, self.filepath)
+        finally:
+            temp.unlink(missing_ok=True)
+
+    def commits_per_dump(self) -> bool:
+        # A write-only Workbook is only saved once the command succeeds.
+        return not self.write_only
+
+    def _existing_tab_names(self) -> list[str]:
+        if not self.filepath.exists():
+            return []
+
+        wb = openpyxl.load_workbook(self.filepath, read_only=True)
+
+        try:
+            return list(wb.sheetnames)
+        finally:
+            wb.close()
 
     def _load_workbook(self) -> openpyxl.Workbook:
         try:
@@ -48,6 +96,46 @@ class Excel(Syncer):
 
         return tab
 
+    def carry_over(self, tab_name: str) -> int:
+        """Stream the saved rows of a tab into the write-only Workbook, returning the number of rows copied."""
+        # Write-only tabs can't be edited in place, so existing rows must be written before any new ones.
+        tab = self.tab(tab_name)
+        copied = 0
+
+        for row in self.iter_rows(tab_name):
+            tab.append(row)
+            copied += 1
+
+        return copied
+
+    def iter_rows(self, tab_name: str) -> Iterator[tuple[Any, ...]]:
+        """Stream rows, including the header, from a tab in the saved Workbook."""
+        if not self.filepath.exists():
+            return
+
+        wb = openpyxl.load_workbook(self.filepath, read_only=True, data_only=True)
+
+        try:
+            if tab_name not in wb.sheetnames:
+                return
+
+            yield from wb[tab_name].iter_rows(values_only=True)
+
+        finally:
+            wb.close()
+
+    def read_stream(self, tab_name: str, *, batch: int = 100_000) -> Iterator[TableRows]:
+        """Read rows from a tab in the Workbook, in batches."""
+        rows = self.iter_rows(tab_name)
+        header: Optional[tuple[Any, ...]] = next(rows, None)
+
+        if header is None:
+            log.warning(f"No data found in tab '{tab_name}'")
+            return
+
+        for values in utils.batched(rows, n=batch):
+            yield [dict(zip(header, row)) for row in values]
+
     def __repr__(self):
         return f"<ExcelSyncer path='{self.filepath}' in '{self.save_strategy}' mode>"
 
@@ -55,14 +143,7 @@ class Excel(Syncer):
 
     def load(self, tab_name: str) -> TableRows:
         """Read rows from a tab in the Workbook."""
-        tab = self.tab(tab_name)
-
-        if tab.calculate_dimension() == "A1:A1":
-            log.warning(f"No data found in tab '{tab_name}'")
-            return []
-
-        header = tab.iter_rows(min_row=1, max_row=1, values_only=True)
-        data = [dict(zip(header, row)) for row in tab.iter_rows(min_row=2, values_only=True)]
+        data = [row for rows in self.read_stream(tab_name) for row in rows]
 
         if not data:
             log.warning(f"No data found in tab '{tab_name}'")
@@ -75,6 +156,10 @@ class Excel(Syncer):
             log.warning(f"No data to write to syncer {self}")
             return
 
+        if self.write_only:
+            self.dump_write_only(tab_name, data=data)
+            return
+
         tab = self.tab(tab_name)
 
         if self.save_strategy == "OVERWRITE":
@@ -91,3 +176,20 @@ class Excel(Syncer):
             tab.append(list(row.values()))
 
         self.workbook.save(self.filepath)
+
+    def dump_write_only(self, tab_name: str, *, data: TableRows) -> None:
+        """Append rows to a tab in the write-only Workbook."""
+        if tab_name not in self.workbook.sheetnames:
+            copied = self.carry_over(tab_name) if self.save_strategy == "APPEND" else 0
+
+            # HEADER, only once per tab, and never in the middle of APPENDed data.
+            if not copied:
+                self.tab(tab_name).append(list(data[0].keys()))
+
+        tab = self.tab(tab_name)
+
+        # DATA
+        dt_format = self.date_time_format
+
+        for row in data:
+            tab.append([v.strftime(dt_format) if isinstance(v, dt.datetime) else v for v in row.values()])
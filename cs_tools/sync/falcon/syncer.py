@@ -39,6 +39,12 @@ class Falcon(DatabaseSyncer):
     ignore_load_balancer_redirect: bool = False
     wait_for_dataload_completion: bool = False
 
+    @pydantic.field_validator("load_strategy", mode="after")
+    def ensure_swap_not_requested(cls, value: str) -> str:
+        if value == "SWAP":
+            raise ValueError("Falcon does not support the SWAP load_strategy, use TRUNCATE instead")
+        return value
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._engine = sa.engine.create_mock_engine("sqlite://", self.sql_query_to_api_call)  # type: ignore[assignment]
@@ -89,6 +95,7 @@ class Falcon(DatabaseSyncer):
             log.warning(f"no data to write to syncer {self}")
             return
 
+        data = self.sort_by_clustering(tablename, data=data)
         data = utils.roundtrip_json_for_falcon(data)
         name = f"{self.database}_{self.schema_}_{tablename}"
 
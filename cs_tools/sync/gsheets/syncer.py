@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, Literal, Optional
+import concurrent.futures as cf
+import datetime as dt
 import logging
 import pathlib
 
@@ -15,6 +18,15 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# GOOGLE SHEETS DOCS:
+#   A spreadsheet may contain at most 10 million cells, across all of its tabs. While the API does not document a hard
+#   limit on payload size, a maximum of 2MB per request is recommended.
+#
+#   https://support.google.com/drive/answer/37603
+#   https://developers.google.com/sheets/api/limits
+#
+MAX_CELLS_PER_SPREADSHEET = 10_000_000
+
 
 class GoogleSheets(Syncer):
     """Interact with a GoogleSheet."""
@@ -26,33 +38,127 @@ class GoogleSheets(Syncer):
     credentials_file: pydantic.FilePath
     date_time_format: str = sync_utils.DATETIME_FORMAT_ISO_8601
     save_strategy: Literal["APPEND", "OVERWRITE"] = "OVERWRITE"
+    max_request_bytes: int = pydantic.Field(default=2 * 1024 * 1024, ge=1024)
+    write_parallelism: int = pydantic.Field(default=4, ge=1)
+
+    _pending: dict[str, cf.Future] = {}  # noqa: RUF012
+    """The most recent write to each tab, writes to different tabs happen concurrently."""
 
     def __init__(self, **data):
         super().__init__(**data)
-        self.client = gspread.service_account(filename=self.credentials_file)
+        self.client = self.make_client()
         self.workbook = self.client.open(self.spreadsheet)
+        self._pool = cf.ThreadPoolExecutor(max_workers=self.write_parallelism, thread_name_prefix="gsheets")
+        self._pending = {}
+
+    def __teardown__(self, exc: Optional[BaseException] = None) -> None:
+        try:
+            for tab_name in list(self._pending):
+                try:
+                    self.wait_for_pending_writes(tab_name)
+                except gspread.exceptions.APIError:
+                    # Don't mask the failure which ended the command with one of our own.
+                    if exc is None:
+                        raise
+        finally:
+            self._pool.shutdown(wait=True)
+
+    def make_client(self) -> gspread.Client:
+        """Authenticate to Google, override this to substitute a different client."""
+        return gspread.service_account(filename=self.credentials_file)
 
     @property
     def url(self) -> str:
         """Return the URL of the Google Sheet."""
         return self.workbook.url
 
-    def tab(self, tab_name: str) -> gspread.worksheet.Worksheet:
+    def tab(self, tab_name: str, *, rows: int = 1000, cols: int = 26) -> gspread.worksheet.Worksheet:
         """Fetch the tab. If it does not yet exist, create it."""
         try:
             tab = self.workbook.worksheet(title=tab_name)
         except gspread.WorksheetNotFound:
-            tab = self.workbook.add_worksheet(title=tab_name, rows=1000, cols=26)
+            tab = self.workbook.add_worksheet(title=tab_name, rows=rows, cols=cols)
 
         return tab
 
     def __repr__(self):
         return f"<GoogleSheetsSyncer url='{self.workbook.url}' in '{self.save_strategy}' mode>"
 
+    def wait_for_pending_writes(self, tab_name: str) -> None:
+        """Block until every submitted write to the tab has completed."""
+        future = self._pending.pop(tab_name, None)
+
+        if future is not None:
+            future.result()
+
+    def chunked(self, values: list[list[Any]]) -> Iterator[tuple[int, list[list[Any]]]]:
+        """Split values into (offset, chunk) pairs, each of roughly max_request_bytes when serialized."""
+        offset, size, chunk = 0, 0, []
+
+        for row in values:
+            # Approximate the JSON encoded size, each value is quoted and comma separated.
+            row_size = sum(len(str(value)) + 3 for value in row) + 2
+
+            if chunk and size + row_size > self.max_request_bytes:
+                yield offset, chunk
+                offset, size, chunk = offset + len(chunk), 0, []
+
+            chunk.append(row)
+            size += row_size
+
+        if chunk:
+            yield offset, chunk
+
+    def write(
+        self,
+        tab_name: str,
+        *,
+        values: list[list[Any]],
+        strategy: Literal["APPEND", "OVERWRITE"],
+        previous: Optional[cf.Future],
+    ) -> None:
+        """Write values to a tab in the Workbook, in as few requests as possible."""
+        # Writes to the same tab must happen in order.
+        if previous is not None:
+            previous.result()
+
+        n_rows, n_cols = len(values), max(len(row) for row in values)
+
+        try:
+            if strategy == "OVERWRITE":
+                tab = self.tab(tab_name, rows=n_rows, cols=n_cols)
+                tab.clear()
+
+                # Size the grid to exactly the data, so one resize replaces many auto-expansions and no cells are
+                # wasted against the spreadsheet-wide cell limit.
+                if (tab.row_count, tab.col_count) != (n_rows, n_cols):
+                    tab.resize(rows=n_rows, cols=n_cols)
+
+                for offset, chunk in self.chunked(values):
+                    tab.update(values=chunk, range_name=f"A{offset + 1}", value_input_option="RAW")
+
+            if strategy == "APPEND":
+                tab = self.tab(tab_name, rows=n_rows, cols=n_cols)
+
+                for _, chunk in self.chunked(values):
+                    tab.append_rows(chunk, value_input_option="RAW", insert_data_option="INSERT_ROWS")
+
+        except gspread.exceptions.APIError as e:
+            try:
+                log.error(f"GoogleSheets Error: {e._extract_text(e)}")
+            except AttributeError:
+                log.error(f"GoogleSheets Error: {e}")
+
+            if "limit of 10000000 cells" in str(e):
+                log.warning("Consider using a Database Syncer instead, such as SQLite.")
+
+            raise
+
     # MANDATORY PROTOCOL MEMBERS
 
     def load(self, tab_name: str) -> TableRows:
         """Read rows from a tab in the Workbook."""
+        self.wait_for_pending_writes(tab_name)
         tab = self.tab(tab_name)
 
         if not (data := tab.get_all_records()):
@@ -66,28 +172,28 @@ class GoogleSheets(Syncer):
             log.warning(f"No data to write to syncer {self}")
             return
 
-        tab = self.tab(tab_name)
-        new = []
-
-        if self.save_strategy == "OVERWRITE":
-            tab.clear()
+        # The strategy can change between dumps (see sync_utils.incremental_writes), so capture it before queueing.
+        strategy = self.save_strategy
+        values = []
 
+        if strategy == "OVERWRITE":
             # HEADER
-            new.append(list(data[0].keys()))
+            values.append(list(data[0].keys()))
 
         # DATA
-        for row in data:
-            row = sync_utils.format_datetime_values(row, dt_format=self.date_time_format)
-            new.append(list(row.values()))
+        dt_format = self.date_time_format
 
-        # SAVE ON API CALLS, ONLY MAKE A SINGLE ONE
-        try:
-            tab.append_rows(new)
-        except gspread.exceptions.APIError as e:
-            try:
-                log.error(f"GoogleSheets Error: {e._extract_text(e)}")
-            except AttributeError:
-                log.error(f"GoogleSheets Error: {e}")
-
-            if "limit of 10000000 cells" in str(e):
-                log.warning("Consider using a Database Syncer instead, such as SQLite.")
+        for row in data:
+            values.append([v.strftime(dt_format) if isinstance(v, dt.datetime) else v for v in row.values()])
+
+        if len(values) * len(values[0]) > MAX_CELLS_PER_SPREADSHEET:
+            log.warning(
+                f"Writing {len(values) * len(values[0]):,} cells to '{tab_name}' exceeds the Google Sheets limit of "
+                f"{MAX_CELLS_PER_SPREADSHEET:,} cells. Consider using a Database Syncer instead, such as SQLite."
+            )
+
+        # Tabs are written concurrently, and waited upon when the Syncer is torn down.
+        previous = self._pending.get(tab_name)
+        self._pending[tab_name] = self._pool.submit(
+            self.write, tab_name, values=values, strategy=strategy, previous=previous
+        )
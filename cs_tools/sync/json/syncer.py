@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Literal, Optional, Union
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, Union
 import datetime as dt
+import gzip
+import io
 import json
 import logging
 import pathlib
 
 import pydantic
 
+from cs_tools import utils
 from cs_tools.sync.base import Syncer
 
 if TYPE_CHECKING:
@@ -30,6 +34,14 @@ class SyncerEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def _isoformat_default(obj: Any) -> str:
+    """A fast-path for SyncerEncoder.default, CS Tools data only ever contains time-like non-JSON types."""
+    if isinstance(obj, (dt.datetime, dt.date)):
+        return obj.isoformat()
+
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
 class JSON(Syncer):
     """Interact with a JSON file."""
 
@@ -39,6 +51,16 @@ class JSON(Syncer):
     directory: Union[pydantic.DirectoryPath, pydantic.NewPath]
     encoding: Optional[Literal["UTF-8"]] = None
     indentation: Optional[int] = None
+    format: Literal["json", "jsonl"] = "json"
+    compression: Literal["NONE", "GZIP"] = "NONE"
+
+    _writers: dict[str, io.TextIOWrapper] = {}  # noqa: RUF012
+    """The open JSON Lines file for each directive, files are kept open for the life of the Syncer."""
+
+    _written: set[str] = set()  # noqa: RUF012
+    """Directives which have been written to during the life of the Syncer."""
+
+    _encode: Callable[[Any], str] = None
 
     @pydantic.field_validator("directory", mode="after")
     @classmethod
@@ -60,17 +82,79 @@ class JSON(Syncer):
 
         raise ValueError("JSON indentation level must be within 1-10")
 
+    @pydantic.field_validator("format", mode="before")
+    @classmethod
+    def _format_case_insensitive(cls, value: str) -> str:
+        return value.lower()
+
+    @pydantic.field_validator("compression", mode="before")
+    @classmethod
+    def _compression_case_insensitive(cls, value: str) -> str:
+        return value.upper()
+
+    def __finalize__(self) -> None:
+        self._writers = {}
+        self._written = set()
+        self._encode = json.JSONEncoder(
+            ensure_ascii=self.encoding is None, separators=(",", ":"), default=_isoformat_default
+        ).encode
+
+    def __teardown__(self, exc: Optional[BaseException] = None) -> None:
+        for fd in self._writers.values():
+            fd.close()
+
+        self._writers = {}
+
+    def commits_per_dump(self) -> bool:
+        # A JSON file is rewritten by every dump, while JSON Lines files are appended to and kept after a failure.
+        return self.format == "jsonl"
+
     def __repr__(self):
         return f"<JSONSyncer directory={self.directory.as_posix()}'>"
 
     def make_filename(self, filename: str) -> pathlib.Path:
         """Enforce the JSON extension."""
-        return self.directory / f"{filename}.json"
+        if self.format == "json":
+            return self.directory / f"{filename}.json"
+
+        return self.directory / f"{filename}.jsonl{'.gz' if self.compression == 'GZIP' else ''}"
+
+    def open_text(self, path: pathlib.Path, *, mode: Literal["r", "w", "a"]) -> io.TextIOWrapper:
+        """Open a JSON Lines file, decompressing it if necessary."""
+        encoding = self.encoding or "utf-8"
+
+        if path.suffix == ".gz":
+            return io.TextIOWrapper(gzip.open(path, mode=f"{mode}b", compresslevel=6), encoding=encoding, newline="\n")
+
+        return path.open(mode=mode, encoding=encoding, newline="\n", buffering=1024 * 1024)
+
+    def read_stream(self, filename: str, *, batch: int = 100_000) -> Iterator[TableRows]:
+        """Fetch rows from a JSON file in batches, JSON Lines files are read line by line."""
+        if self.format == "json":
+            yield self.load(filename)
+            return
+
+        # Rows written earlier in this session may still be buffered, and a compressed file is only readable once its
+        # trailer is written. Later dumps open the file again.
+        if filename in self._writers:
+            self._writers.pop(filename).close()
+
+        path = self.make_filename(filename)
+
+        if not path.exists():
+            return
+
+        with self.open_text(path, mode="r") as fd:
+            for lines in utils.batched((line for line in fd if line.strip()), n=batch):
+                yield [json.loads(line) for line in lines]
 
     # MANDATORY PROTOCOL MEMBERS
 
     def load(self, filename: str) -> TableRows:
         """Fetch rows from a JSON file."""
+        if self.format == "jsonl":
+            return [row for rows in self.read_stream(filename) for row in rows]
+
         text = self.make_filename(filename).read_text(encoding=self.encoding)
         data = json.loads(text) if text else []
         return data
@@ -81,6 +165,17 @@ class JSON(Syncer):
             log.warning(f"no data to write to syncer {self}")
             return
 
+        if self.format == "jsonl":
+            # The first dump of the session replaces the file, every dump after that appends one record per line.
+            if filename not in self._writers:
+                mode = "a" if filename in self._written else "w"
+                self._writers[filename] = self.open_text(self.make_filename(filename), mode=mode)
+                self._written.add(filename)
+
+            encode = self._encode
+            self._writers[filename].writelines(f"{encode(row)}\n" for row in data)
+            return
+
         text = json.dumps(
             data,
             ensure_ascii=True if self.encoding is None else False,
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal, Union
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union
 import logging
+import operator
+import os
 import pathlib
+import uuid
 
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 import pydantic
+import sqlmodel
 
+from cs_tools import utils
+from cs_tools.sync import utils as sync_utils
 from cs_tools.sync.base import Syncer
 
 if TYPE_CHECKING:
@@ -15,6 +24,61 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+Filter = tuple[str, Literal["==", "!=", "<", "<=", ">", ">=", "in"], Any]
+"""A simple predicate, eg. ("object_type", "==", "LOGICAL_TABLE")."""
+
+# fmt: off
+_COMPUTE_FUNCTIONS = {
+    "==": pc.equal,
+    "!=": pc.not_equal,
+    "<": pc.less,
+    "<=": pc.less_equal,
+    ">": pc.greater,
+    ">=": pc.greater_equal,
+    "in": lambda column, values: pc.is_in(column, value_set=pa.array(values)),
+}
+
+_EXPRESSIONS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda field, values: field.isin(values),
+}
+# fmt: on
+
+
+def _row_group_may_match(statistics: Optional[pq.Statistics], op: str, value: Any) -> bool:
+    """Determine from a column chunk's min/max whether any row in the row group could satisfy the predicate."""
+    if statistics is None or not statistics.has_min_max:
+        return True
+
+    lo, hi = statistics.min, statistics.max
+
+    try:
+        if op == "==":
+            return lo <= value <= hi
+        if op == "!=":
+            return not (lo == hi == value)
+        if op == "<":
+            return lo < value
+        if op == "<=":
+            return lo <= value
+        if op == ">":
+            return hi > value
+        if op == ">=":
+            return hi >= value
+        if op == "in":
+            return any(lo <= v <= hi for v in value)
+
+    # Statistics may not be comparable to the value (eg. naive vs aware datetimes), so we can't skip the row group.
+    except TypeError:
+        return True
+
+    return True
+
 
 class Parquet(Syncer):
     """Interact with a Parquet file."""
@@ -23,7 +87,16 @@ class Parquet(Syncer):
     __syncer_name__ = "parquet"
 
     directory: Union[pydantic.DirectoryPath, pydantic.NewPath]
-    compression: Literal["GZIP", "SNAPPY"] = "GZIP"
+    compression: Literal["GZIP", "SNAPPY", "ZSTD", "LZ4", "NONE"] = "GZIP"
+    row_group_size: int = pydantic.Field(default=100_000, ge=1)
+    partition_by: list[str] = []  # noqa: RUF012
+
+    _writers: dict[str, pq.ParquetWriter] = {}  # noqa: RUF012
+    _parts: dict[str, list[pathlib.Path]] = {}  # noqa: RUF012
+    """Finalized part files written this session, which replace the file at teardown."""
+
+    _partitions: dict[str, set[tuple[Any, ...]]] = {}  # noqa: RUF012
+    """The partitions of each dataset written this session."""
 
     @pydantic.field_validator("directory", mode="after")
     @classmethod
@@ -37,16 +110,276 @@ class Parquet(Syncer):
 
         return value
 
+    @pydantic.field_validator("partition_by", mode="before")
+    @classmethod
+    def _split_comma_separated(cls, value: Union[str, list[str]]) -> list[str]:
+        if isinstance(value, str):
+            return [column.strip() for column in value.split(",") if column.strip()]
+
+        return value
+
+    @pydantic.field_validator("compression", mode="before")
+    @classmethod
+    def case_insensitive(cls, value: str) -> str:
+        return value.upper()
+
+    def __finalize__(self) -> None:
+        self._writers = {}
+        self._parts = {}
+        self._partitions = {}
+
+    def __teardown__(self, exc: Optional[BaseException] = None) -> None:
+        # Parquet files are only readable once their footer has been written.
+        for filename in list(self._writers):
+            self.close_writer(filename)
+
+        for filename in list(self._parts):
+            parts = self._parts.pop(filename)
+
+            try:
+                # A failed command leaves the original file untouched.
+                if exc is None:
+                    self.replace_with_parts(filename, parts=parts)
+            finally:
+                for fp in parts:
+                    fp.unlink(missing_ok=True)
+
     def __repr__(self):
         return f"<ParquetSyncer directory='{self.directory}'>"
 
+    def schema_for(self, filename: str, *, data: TableRows) -> pa.Schema:
+        """Determine a stable schema for the file, preferring the model definition over the data itself."""
+        table = sqlmodel.SQLModel.metadata.tables.get(filename)
+
+        if table is not None:
+            return sync_utils.arrow_schema_from_table(table)
+
+        return pa.Table.from_pylist(data).schema
+
+    def open_writer(self, filename: str, *, data: TableRows) -> pq.ParquetWriter:
+        """Fetch the writer for this file, creating a new part file if there isn't one open."""
+        if filename not in self._writers:
+            parts = self._parts.setdefault(filename, [])
+
+            # Every part of a file must share a schema, the first part decides it.
+            schema = pq.read_schema(parts[0]) if parts else self.schema_for(filename, data=data)
+
+            # Write under a hidden name, dataset discovery ignores it and a crash never leaves a file without a footer.
+            fp = self.directory.joinpath(f".{filename}-{uuid.uuid4().hex}.parquet.part")
+            self._writers[filename] = pq.ParquetWriter(fp, schema=schema, compression=self.compression.lower())
+            parts.append(fp)
+
+        return self._writers[filename]
+
+    def close_writer(self, filename: str) -> None:
+        """Write the part file footer, finalizing it. Further writes go to a new part file."""
+        writer = self._writers.pop(filename, None)
+
+        if writer is not None:
+            writer.close()
+
+    def replace_with_parts(self, filename: str, *, parts: list[pathlib.Path]) -> None:
+        """Merge the finalized part files, then atomically replace the file with them."""
+        fp = self.directory.joinpath(f"{filename}.parquet")
+
+        if len(parts) == 1:
+            os.replace(parts[0], fp)
+            return
+
+        temp = self.directory.joinpath(f".{filename}-{uuid.uuid4().hex}.parquet.part")
+
+        try:
+            with pq.ParquetWriter(
+                temp, schema=pq.read_schema(parts[0]), compression=self.compression.lower()
+            ) as writer:
+                for part in parts:
+                    with pq.ParquetFile(part) as pf:
+                        for idx in range(pf.metadata.num_row_groups):
+                            writer.write_table(pf.read_row_group(idx), row_group_size=self.row_group_size)
+
+            os.replace(temp, fp)
+        finally:
+            temp.unlink(missing_ok=True)
+
+    def with_partition_columns(self, table: pa.Table) -> tuple[pa.Table, list[str]]:
+        """Add a date column for each timestamp partition, so files are split by day rather than by instant."""
+        partitions = []
+
+        for column in self.partition_by:
+            if not pa.types.is_timestamp(table.schema.field(column).type):
+                partitions.append(column)
+                continue
+
+            derived = f"{column}_date"
+            table = table.append_column(derived, table.column(column).cast(pa.date32()))
+            partitions.append(derived)
+
+        return table, partitions
+
+    def dump_partitioned(self, filename: str, *, data: TableRows) -> None:
+        """
+        Write rows to a hive-partitioned parquet dataset.
+
+        The first write to each partition during the session replaces the files it held, so a
+        re-run window doesn't duplicate its rows. Later writes add files alongside them.
+        """
+        schema = self.schema_for(filename, data=data)
+        table, partitions = self.with_partition_columns(pa.Table.from_pylist(data, schema=schema))
+
+        written = self._partitions.setdefault(filename, set())
+        keys = list(zip(*(table.column(column).to_pylist() for column in partitions)))
+        is_new = pa.array([key not in written for key in keys], type=pa.bool_())
+
+        # PYARROW DOCS:
+        #   delete_matching removes the existing files of each partition the call writes to, overwrite_or_ignore leaves
+        #   them alone. Every call writes new, uniquely named files.
+        #
+        #   https://arrow.apache.org/docs/python/dataset.html#writing-partitioned-data
+        #
+        for mask, existing_data_behavior in ((is_new, "delete_matching"), (pc.invert(is_new), "overwrite_or_ignore")):
+            if not (rows := table.filter(mask)).num_rows:
+                continue
+
+            ds.write_dataset(
+                rows,
+                base_dir=self.directory.joinpath(filename),
+                format="parquet",
+                partitioning=ds.partitioning(pa.schema([table.schema.field(c) for c in partitions]), flavor="hive"),
+                basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+                existing_data_behavior=existing_data_behavior,
+                file_options=ds.ParquetFileFormat().make_write_options(compression=self.compression.lower()),
+                max_rows_per_group=self.row_group_size,
+            )
+
+        written.update(keys)
+
+    def compact(self, filename: str) -> int:
+        """Merge the small files within each partition of a dataset into one, returning the number of files removed."""
+        root = self.directory.joinpath(filename)
+
+        if not root.is_dir():
+            log.info(f"{root.as_posix()} is not a partitioned dataset, nothing to compact")
+            return 0
+
+        removed = 0
+
+        for leaf in sorted({fp.parent for fp in root.rglob("*.parquet")}):
+            parts = sorted(leaf.glob("*.parquet"))
+
+            if len(parts) < 2:
+                continue
+
+            # Files in a leaf directory do not contain the partition columns, they're encoded in the path.
+            table = ds.dataset(parts, format="parquet").to_table()
+
+            # Write under a hidden name first, dataset discovery ignores it until it's renamed into place.
+            temp = leaf.joinpath(f".compacting-{uuid.uuid4().hex}")
+            pq.write_table(table, temp, compression=self.compression.lower(), row_group_size=self.row_group_size)
+            os.replace(temp, leaf.joinpath(f"part-{uuid.uuid4().hex}-0.parquet"))
+
+            for fp in parts:
+                fp.unlink()
+
+            log.debug(f"Compacted {len(parts)} files in {leaf.relative_to(root).as_posix()}")
+            removed += len(parts) - 1
+
+        return removed
+
+    def read_stream(
+        self,
+        filename: str,
+        *,
+        batch: int = 100_000,
+        columns: Optional[list[str]] = None,
+        filters: Optional[list[Filter]] = None,
+    ) -> Iterator[TableRows]:
+        """
+        Read rows from a parquet file in batches.
+
+        Only the requested columns are decoded, and row groups which cannot satisfy every
+        filter (according to their min/max statistics) are skipped entirely.
+        """
+        filters = filters or []
+
+        if self.directory.joinpath(filename).is_dir():
+            dataset = ds.dataset(self.directory.joinpath(filename), format="parquet", partitioning="hive")
+            expression = None
+
+            # A timestamp's date partition only exists to lay out the files, it may be filtered on but isn't returned.
+            if columns is None:
+                names = dataset.schema.names
+                columns = [name for name in names if not (name.endswith("_date") and name[: -len("_date")] in names)]
+
+            for column, op, value in filters:
+                predicate = _EXPRESSIONS[op](ds.field(column), value)
+                expression = predicate if expression is None else expression & predicate
+
+            for record_batch in dataset.to_batches(columns=columns, filter=expression, batch_size=batch):
+                yield record_batch.to_pylist()
+
+            return
+
+        # Rows written earlier in this session must be flushed before the file can be read.
+        self.close_writer(filename)
+
+        fp = self.directory.joinpath(f"{filename}.parquet")
+
+        # Rows written this session replace the file at teardown, so until then they're read in its place.
+        if filename in self._parts:
+            files = self._parts[filename]
+        elif fp.exists():
+            files = [fp]
+        else:
+            return
+
+        for part in files:
+            yield from self.read_file(part, batch=batch, columns=columns, filters=filters)
+
+    def read_file(
+        self, fp: pathlib.Path, *, batch: int, columns: Optional[list[str]], filters: list[Filter]
+    ) -> Iterator[TableRows]:
+        """Read rows from a single parquet file in batches, skipping row groups which cannot match the filters."""
+        with pq.ParquetFile(fp, memory_map=True) as pf:
+            names = pf.schema_arrow.names
+            row_groups = []
+
+            for idx in range(pf.metadata.num_row_groups):
+                row_group = pf.metadata.row_group(idx)
+
+                if all(_row_group_may_match(row_group.column(names.index(c)).statistics, o, v) for c, o, v in filters):
+                    row_groups.append(idx)
+
+            log.debug(f"Reading {len(row_groups)}/{pf.metadata.num_row_groups} row groups from {fp.name}")
+
+            if not row_groups:
+                return
+
+            # Filtered columns must be read too, even if they aren't projected.
+            needed = None if columns is None else list(dict.fromkeys([*columns, *(c for c, _, _ in filters)]))
+
+            for record_batch in pf.iter_batches(batch_size=batch, row_groups=row_groups, columns=needed):
+                mask = None
+
+                for column, op, value in filters:
+                    matches = _COMPUTE_FUNCTIONS[op](record_batch.column(column), value)
+                    mask = matches if mask is None else pc.and_kleene(mask, matches)
+
+                if mask is not None:
+                    record_batch = record_batch.filter(mask)
+
+                if columns is not None:
+                    record_batch = pa.RecordBatch.from_arrays([record_batch.column(c) for c in columns], names=columns)
+
+                if record_batch.num_rows:
+                    yield record_batch.to_pylist()
+
     # MANDATORY PROTOCOL MEMBERS
 
-    def load(self, filename: str) -> TableRows:
+    def load(
+        self, filename: str, *, columns: Optional[list[str]] = None, filters: Optional[list[Filter]] = None
+    ) -> TableRows:
         """Read rows from a parquet file."""
-        fp = self.directory.joinpath(f"{filename}.parquet")
-        table = pq.read_table(fp)
-        return table.to_pylist()
+        return [row for rows in self.read_stream(filename, columns=columns, filters=filters) for row in rows]
 
     def dump(self, filename: str, *, data: TableRows) -> None:
         """Write rows to a parquet file."""
@@ -54,6 +387,13 @@ class Parquet(Syncer):
             log.warning(f"No data to write to syncer {self}")
             return
 
-        data = pa.Table.from_pylist(data)
-        fp = self.directory.joinpath(f"{filename}.parquet")
-        pq.write_table(data, fp, compression=self.compression.lower())
+        if self.partition_by:
+            self.dump_partitioned(filename, data=data)
+            return
+
+        # Each call appends to the file for the life of the Syncer, one or more row groups at a time.
+        writer = self.open_writer(filename, data=data)
+
+        for rows in utils.batched(data, n=self.row_group_size):
+            batch = pa.Table.from_pylist(list(rows), schema=writer.schema)
+            writer.write_table(batch, row_group_size=self.row_group_size)
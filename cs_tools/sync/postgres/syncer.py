@@ -1,24 +1,83 @@
 from __future__ import annotations
 
-from typing import Optional
+from collections.abc import Iterable, Iterator
+from typing import Any, Optional
+import datetime as dt
 import logging
 import pathlib
+import uuid
 
+from cs_tools import utils
 from cs_tools.sync import utils as sync_utils
 from cs_tools.sync.base import DatabaseSyncer
 from cs_tools.sync.types import TableRows
+from sqlalchemy.dialects.postgresql import insert
 import pydantic
 import sqlalchemy as sa
 import sqlmodel
 
 log = logging.getLogger(__name__)
 
+# POSTGRES DOCS:
+# https://www.postgresql.org/docs/current/sql-copy.html#id-1.9.3.55.9.2
+_COPY_TEXT_NULL = "\\N"
+_COPY_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _encode_copy_text_value(value: Any) -> str:
+    """Convert a python value to its COPY ... (FORMAT TEXT) representation."""
+    if value is None:
+        return _COPY_TEXT_NULL
+
+    if isinstance(value, bool):
+        return "t" if value else "f"
+
+    if isinstance(value, (dt.datetime, dt.date)):
+        return value.isoformat()
+
+    return str(value).translate(_COPY_TEXT_ESCAPES)
+
+
+class CopyTextStream:
+    """
+    A read-only file-like object which encodes rows into COPY TEXT format on demand.
+
+    psycopg2's copy_expert() only asks for the next chunk of bytes as it sends them to
+    the server, so the full payload never needs to exist in memory.
+    """
+
+    def __init__(self, data: Iterable[dict[str, Any]], *, columns: list[str]):
+        self._lines = self._encode_lines(data, columns=columns)
+        self._buffer = bytearray()
+
+    @staticmethod
+    def _encode_lines(data: Iterable[dict[str, Any]], *, columns: list[str]) -> Iterator[bytes]:
+        for row in data:
+            line = "\t".join(_encode_copy_text_value(row.get(column)) for column in columns)
+            yield f"{line}\n".encode()
+
+    def read(self, size: int = -1) -> bytes:
+        """Fetch up to size bytes of encoded rows."""
+        while size < 0 or len(self._buffer) < size:
+            try:
+                self._buffer += next(self._lines)
+            except StopIteration:
+                break
+
+        if size < 0:
+            size = len(self._buffer)
+
+        chunk = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return chunk
+
 
 class Postgres(DatabaseSyncer):
     """Interact with Postgres database."""
 
     __manifest_path__ = pathlib.Path(__file__).parent / "MANIFEST.json"
     __syncer_name__ = "postgres"
+    __commits_per_dump__ = True
 
     host: str
     port: Optional[int] = pydantic.Field(default=5432)
@@ -26,10 +85,11 @@ class Postgres(DatabaseSyncer):
     schema_: str = pydantic.Field(default="public", alias="schema")
     username: str
     secret: Optional[str] = None
+    stage_upsert_with_copy: bool = False
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._engine = sa.create_engine(self.make_url(), future=True)
+        self._engine = sa.create_engine(self.make_url(), **self.pool_options, future=True)
         self.metadata = sqlmodel.MetaData(schema=self.schema_)
 
     def __repr__(self) -> str:
@@ -40,11 +100,81 @@ class Postgres(DatabaseSyncer):
         auth = f"{self.username}:{self.secret}" if self.secret is not None else self.username
         return f"postgresql+psycopg2://{auth}@{self.host}:{self.port}/{self.database}"
 
-    def load(self, tablename: str) -> TableRows:
-        """SELECT rows from PostgreSQL."""
-        table = self.metadata.tables[f"{self.schema_}.{tablename}"]
-        rows = self.session.execute(table.select())
-        return [row.model_dump() for row in rows]
+    def copy_from_stdin(self, table: sa.Table, *, data: TableRows) -> None:
+        """Implement the COPY FROM STDIN statement."""
+        # Further reading:
+        #   https://www.postgresql.org/docs/current/sql-copy.html
+        #   https://www.psycopg.org/docs/cursor.html#cursor.copy_expert
+        #
+        preparer = self.engine.dialect.identifier_preparer
+        target = preparer.format_table(table)
+        column = ", ".join(preparer.quote(c.name) for c in table.columns)
+
+        SQL_COPY_FROM = f"COPY {target} ({column}) FROM STDIN WITH (FORMAT TEXT)"
+
+        # Borrow the raw DBAPI cursor from the Session so that COPY participates in the same transaction.
+        cursor = self.session.connection().connection.cursor()
+
+        try:
+            cursor.copy_expert(SQL_COPY_FROM, CopyTextStream(data, columns=[c.name for c in table.columns]))
+            log.debug(f"Postgres response >> COPY {cursor.rowcount} rows into {target}")
+        finally:
+            cursor.close()
+
+    def insert_on_conflict(self, table: sa.Table, *, select: Optional[sa.Select] = None) -> sa.Insert:
+        """UPSERT."""
+        stmt = insert(table) if select is None else insert(table).from_select(table.columns, select)
+
+        if table.columns == table.primary_key:
+            set_ = {c.key: getattr(stmt.excluded, c.key) for c in table.columns}
+        else:
+            set_ = {c.key: getattr(stmt.excluded, c.key) for c in table.columns if c.key not in table.primary_key}
+
+        stmt = stmt.on_conflict_do_update(
+            index_elements=table.primary_key,
+            set_=set_,
+        )
+        return stmt
+
+    def upsert_via_temp_table(self, table: sa.Table, *, data: TableRows) -> None:
+        """COPY data into a temporary table, then INSERT .. ON CONFLICT from it in a single statement."""
+        temp = sa.Table(
+            f"tmp_{table.name}_{uuid.uuid4().hex[:5]}",
+            sa.MetaData(),
+            *(sa.Column(c.name, c.type) for c in table.columns),
+            prefixes=["TEMPORARY"],
+            postgresql_on_commit="DROP",
+        )
+        temp.create(self.session.connection())
+
+        self.copy_from_stdin(temp, data=data)
+        self.session.execute(self.insert_on_conflict(table, select=sa.select(*temp.columns)))
+
+    def dependent_views(self, table: sa.Table) -> list[str]:
+        """Find the views which select from the Table."""
+        # POSTGRES DOCS:
+        #   A view is implemented by a rewrite rule, which depends on every table the view selects from.
+        #   https://www.postgresql.org/docs/current/catalog-pg-depend.html
+        #
+        # fmt: off
+        SQL_DEPENDENT_VIEWS = sa.sql.text(
+            """
+            SELECT DISTINCT v.relname
+              FROM pg_depend AS d
+              JOIN pg_rewrite AS r ON r.oid = d.objid
+              JOIN pg_class AS v ON v.oid = r.ev_class
+             WHERE d.classid = CAST('pg_rewrite' AS regclass)
+               AND d.refobjid = CAST(:table AS regclass)
+               AND v.oid <> d.refobjid
+            """
+        )
+        # fmt: on
+        target = self.engine.dialect.identifier_preparer.format_table(table)
+        return list(self.session.execute(SQL_DEPENDENT_VIEWS, {"table": target}).scalars())
+
+    def cluster_table(self, table: sa.Table, *, columns: list[str]) -> None:
+        """Add a secondary index, used for range scans on the clustering columns."""
+        self.create_index(table, columns=columns)
 
     def dump(self, tablename: str, *, data: TableRows) -> None:
         """INSERT rows into PostgreSQL."""
@@ -52,18 +182,41 @@ class Postgres(DatabaseSyncer):
             log.warning(f"no data to write to syncer {self}")
             return
 
+        data = self.sort_by_clustering(tablename, data=data)
         table = self.metadata.tables[f"{self.schema_}.{tablename}"]
 
         if self.load_strategy == "APPEND":
-            sync_utils.batched(table.insert().values, session=self.session, data=data)
+            self.copy_from_stdin(table, data=data)
+            self.session.commit()
 
         if self.load_strategy == "TRUNCATE":
             self.session.execute(table.delete())
-            sync_utils.batched(table.insert().values, session=self.session, data=data)
+            self.copy_from_stdin(table, data=data)
+            self.session.commit()
+
+        if self.load_strategy == "SWAP":
+            with self.loading_shadow(table) as shadow:
+                self.copy_from_stdin(shadow, data=data)
+            self.session.commit()
 
         if self.load_strategy == "UPSERT":
-            # TODO: @dhinesh-ts, 2024/05/19
-            #   need to investigate COPY->INSERT ON CONFLICT functionality, similar to how we have in Snowflake syncer
+            # POSTGRES DOCS:
             #   https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#insert-on-conflict-upsert
             #
-            sync_utils.generic_upsert(table, session=self.session, data=data)
+            #   INSERT .. ON CONFLICT DO UPDATE may not affect the same row twice, so a key which appears more than once
+            #   in a single statement fails the whole statement.
+            #
+            #   https://www.postgresql.org/docs/current/sql-insert.html#SQL-ON-CONFLICT
+            #
+            data = sync_utils.last_row_per_key(data, key=[c.name for c in table.primary_key])
+
+            if self.stage_upsert_with_copy:
+                self.upsert_via_temp_table(table, data=data)
+                self.session.commit()
+            else:
+                stmt = self.insert_on_conflict(table)
+
+                # executemany() lets the psycopg2 dialect pack each batch into as few round trips as possible.
+                for rows in utils.batched(data, n=5000):
+                    self.session.execute(stmt, list(rows))
+                    self.session.commit()
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
-from typing import Literal
+from typing import Literal, Optional
+import concurrent.futures as cf
 import logging
 import pathlib
+import uuid
 
+from pydantic_core import PydanticCustomError
+import pydantic
 import sqlalchemy as sa
 
 from cs_tools.sync import utils as sync_utils
 from cs_tools.sync.base import DatabaseSyncer
 from cs_tools.sync.types import TableRows
 
-from . import compiler  # noqa: F401
+from . import compiler
 
 log = logging.getLogger(__name__)
 
@@ -20,6 +24,8 @@ class Redshift(DatabaseSyncer):
 
     __manifest_path__ = pathlib.Path(__file__).parent
     __syncer_name__ = "Redshift"
+    __sorts_by_clustering__ = True
+    __commits_per_dump__ = True
 
     host: str
     port: int = 5439
@@ -27,10 +33,37 @@ class Redshift(DatabaseSyncer):
     secret: str
     database: str
     authentication: Literal["basic"] = "basic"
+    temp_dir: Optional[pydantic.DirectoryPath] = pathlib.Path(".")
+    stage_bucket: Optional[str] = None
+    stage_prefix: str = "cs_tools"
+    stage_region: Optional[str] = None
+    stage_endpoint_url: Optional[str] = None
+    stage_access_key_id: Optional[str] = None
+    stage_secret_access_key: Optional[str] = None
+    stage_iam_role: Optional[str] = None
+    stage_file_size_mb: int = pydantic.Field(default=128, ge=1)
+    stage_parallelism: int = pydantic.Field(default=4, ge=1)
+    dump_parallelism: int = pydantic.Field(default=4, ge=1)
+    stage_format: Literal["csv", "parquet"] = "csv"
+
+    @pydantic.model_validator(mode="after")
+    def ensure_stage_credentials_given(self) -> Redshift:
+        if self.stage_bucket is None or self.stage_iam_role is not None:
+            return self
+
+        if self.stage_access_key_id is None or self.stage_secret_access_key is None:
+            raise PydanticCustomError(
+                "missing",
+                "Field required, staging to a bucket requires either stage_iam_role or an access key pair",
+                {"stage_iam_role": self.stage_iam_role},
+            )
+
+        return self
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._engine = sa.create_engine(self.make_url(), future=True)
+        # COPY is given the staging credentials as parameters, so keep them out of logs and error messages.
+        self._engine = sa.create_engine(self.make_url(), **self.pool_options, hide_parameters=True, future=True)
 
     def make_url(self) -> str:
         """Create a connection string for the Redshift JDBC driver."""
@@ -44,11 +77,267 @@ class Redshift(DatabaseSyncer):
     def __repr__(self):
         return f"<RedshiftSyncer to {self.host}/{self.database}>"
 
-    def load(self, tablename: str) -> TableRows:
-        """SELECT rows from Redshift."""
-        table = self.metadata.tables[tablename]
-        rows = self.session.execute(table.select())
-        return [row.model_dump() for row in rows]
+    def stage_prefix_for(self, tablename: str) -> str:
+        """A unique S3 prefix to stage a single load under."""
+        return f"{self.stage_prefix.strip('/')}/TMP_STAGE_{tablename}_{uuid.uuid4().hex[:5]}/"
+
+    def column_order(self, table: sa.Table) -> list[str]:
+        """Fetch the order of the Table's columns in Redshift, which may differ from the model's."""
+        inspector = sa.inspect(self.engine)
+        known = {column.name for column in table.columns}
+        return [c["name"] for c in inspector.get_columns(table.name, schema=table.schema) if c["name"] in known]
+
+    def stage_and_put(self, tablename: str, *, data: TableRows, prefix: str) -> None:
+        """Upload data as many compressed files to the staging bucket, under the S3 prefix."""
+        import boto3
+
+        assert self.stage_bucket is not None
+        assert self.temp_dir is not None
+
+        client = boto3.client(
+            "s3",
+            region_name=self.stage_region,
+            endpoint_url=self.stage_endpoint_url,
+            aws_access_key_id=self.stage_access_key_id,
+            aws_secret_access_key=self.stage_secret_access_key,
+        )
+
+        # REDSHIFT DOCS:
+        #   COPY loads files in parallel across slices, so split the data into multiple compressed files of roughly
+        #   equal size, between 1MB and 1GB each.
+        #
+        #   https://docs.aws.amazon.com/redshift/latest/dg/c_best-practices-use-multiple-files.html
+        #
+        max_file_size = self.stage_file_size_mb * 1024 * 1024
+
+        table = self.table(tablename)
+        data = self.trim_strings(table, data=data)
+
+        if self.stage_format == "parquet":
+            # Parquet columns are COPYd by position, so they must be written in the order Redshift has them.
+            files = sync_utils.temp_parquet_parts_for_upload(
+                tmp=self.temp_dir,
+                filename=tablename,
+                table=table,
+                data=data,
+                max_file_size=max_file_size,
+                columns=self.column_order(table),
+            )
+        else:
+            # CSV columns are COPYd by the column list in .copy_into(), so they must be written in the same order.
+            files = sync_utils.temp_csv_parts_for_upload(
+                tmp=self.temp_dir,
+                filename=tablename,
+                data=data,
+                max_file_size=max_file_size,
+                fieldnames=[column.name for column in table.columns],
+            )
+
+        with files as parts, cf.ThreadPoolExecutor(max_workers=self.stage_parallelism) as pool:
+            log.debug(f"Staging {len(parts)} {self.stage_format} file(s) to s3://{self.stage_bucket}/{prefix}")
+            futures = [
+                pool.submit(client.upload_file, fp.as_posix(), self.stage_bucket, f"{prefix}{fp.name}") for fp in parts
+            ]
+
+            for future in cf.as_completed(futures):
+                future.result()
+
+    def trim_strings(self, table: sa.Table, *, data: TableRows) -> TableRows:
+        """Trim values too long for their VARCHAR, as a bound parameter of a TrimmedString column would be."""
+        columns = [column for column in table.columns if isinstance(column.type, compiler.TrimmedString)]
+
+        if not columns:
+            return data
+
+        # Staged files are COPYd straight from the bucket, they never pass through the column's type.
+        dialect = self.engine.dialect
+
+        return [
+            {**row, **{c.name: c.type.process_bind_param(row[c.name], dialect) for c in columns if c.name in row}}
+            for row in data
+        ]
+
+    def remove_staged(self, prefix: str) -> None:
+        """Remove the staged files from the bucket."""
+        import boto3
+
+        resource = boto3.resource(
+            "s3",
+            region_name=self.stage_region,
+            endpoint_url=self.stage_endpoint_url,
+            aws_access_key_id=self.stage_access_key_id,
+            aws_secret_access_key=self.stage_secret_access_key,
+        )
+        resource.Bucket(self.stage_bucket).objects.filter(Prefix=prefix).delete()
+
+    def copy_into(self, *, into: sa.Table, from_: str) -> None:
+        """Implement the COPY statement."""
+        preparer = self.engine.dialect.identifier_preparer
+
+        # Prefer the IAM role, it's not a secret. Both are bound as parameters, an ARN's colons would otherwise be
+        # parsed as parameters themselves.
+        if self.stage_iam_role is not None:
+            authorization = "IAM_ROLE :iam_role"
+            credentials = {"iam_role": self.stage_iam_role}
+        else:
+            authorization = "ACCESS_KEY_ID :access_key_id SECRET_ACCESS_KEY :secret_access_key"
+            credentials = {
+                "access_key_id": self.stage_access_key_id,
+                "secret_access_key": self.stage_secret_access_key,
+            }
+
+        if self.stage_format == "parquet":
+            # Parquet columns are mapped to the target table by position.
+            target = preparer.format_table(into)
+            file_format = "FORMAT AS PARQUET"
+        else:
+            column = ", ".join(preparer.quote(c.name) for c in into.columns)
+            target = f"{preparer.format_table(into)} ({column})"
+            file_format = "FORMAT AS CSV DELIMITER '|' GZIP EMPTYASNULL BLANKSASNULL TIMEFORMAT 'auto'"
+
+        region = "" if self.stage_region is None else f"REGION '{self.stage_region}'"
+
+        # fmt: off
+        SQL_COPY_INTO = sa.sql.text(
+            f"""
+            COPY {target}
+            FROM 's3://{self.stage_bucket}/{from_}'
+            {authorization}
+            {file_format}
+            {region}
+            """
+        )
+        # fmt: on
+        r = self.session.execute(SQL_COPY_INTO, credentials)
+        log.debug("Redshift response >> COPY\n%s", r.rowcount)
+
+    def merge_into(self, *, into: sa.Table, from_: str) -> None:
+        """Implement the MERGE statement."""
+        # REDSHIFT DOCS:
+        #   https://docs.aws.amazon.com/redshift/latest/dg/r_MERGE.html
+        #
+        preparer = self.engine.dialect.identifier_preparer
+        quoted = {c.name: preparer.quote(c.name) for c in into.columns}
+
+        joined = " AND ".join(f"SOURCE.{quoted[c.name]} = TARGET.{quoted[c.name]}" for c in into.primary_key)
+        update = ", ".join(f"{quoted[c.name]} = SOURCE.{quoted[c.name]}" for c in into.columns if not c.primary_key)
+        insert = ", ".join(quoted.values())
+        values = ", ".join(f"SOURCE.{q}" for q in quoted.values())
+
+        # When every column is part of the primary key there's nothing to UPDATE, so only INSERT the new rows.
+        if not update:
+            # fmt: off
+            SQL_INSERT_NEW = sa.sql.text(
+                f"""
+                INSERT INTO {preparer.format_table(into)} ({insert})
+                SELECT {values}
+                  FROM {from_} AS SOURCE
+                 WHERE NOT EXISTS (SELECT 1 FROM {preparer.format_table(into)} AS TARGET WHERE {joined})
+                """
+            )
+            # fmt: on
+            r = self.session.execute(SQL_INSERT_NEW)
+            log.debug("Redshift response >> INSERT\n%s", r.rowcount)
+            return
+
+        # fmt: off
+        SQL_MERGE_INTO = sa.sql.text(
+            f"""
+            MERGE INTO {preparer.format_table(into)} AS TARGET
+            USING {from_} AS SOURCE
+               ON {joined}
+             WHEN     MATCHED THEN UPDATE SET {update}
+             WHEN NOT MATCHED THEN INSERT ({insert}) VALUES ({values})
+            """
+        )
+        # fmt: on
+        r = self.session.execute(SQL_MERGE_INTO)
+        log.debug("Redshift response >> MERGE\n%s", r.rowcount)
+
+    def dump_staged(self, table: sa.Table, *, data: TableRows) -> None:
+        """Load rows into Redshift by COPYing them from the staging bucket."""
+        # Decided before uploading, so a partial upload is cleaned up too.
+        prefix = self.stage_prefix_for(table.name)
+
+        try:
+            self.stage_and_put(tablename=table.name, data=data, prefix=prefix)
+
+            if self.load_strategy == "APPEND":
+                self.copy_into(into=table, from_=prefix)
+
+            if self.load_strategy == "TRUNCATE":
+                self.session.execute(table.delete())
+                self.copy_into(into=table, from_=prefix)
+
+            if self.load_strategy == "SWAP":
+                with self.loading_shadow(table) as shadow:
+                    self.copy_into(into=shadow, from_=prefix)
+
+            if self.load_strategy == "UPSERT":
+                staging = sa.Table(
+                    f"TMP_TABLE_{table.name}_{uuid.uuid4().hex[:5]}",
+                    sa.MetaData(),
+                    *(sa.Column(c.name, c.type) for c in table.columns),
+                )
+                preparer = self.engine.dialect.identifier_preparer
+
+                # fmt: off
+                SQL_TEMP_TABLE = sa.sql.text(
+                    f"""
+                    CREATE TEMPORARY TABLE {preparer.format_table(staging)} (LIKE {preparer.format_table(table)})
+                    """
+                )
+                # fmt: on
+                self.session.execute(SQL_TEMP_TABLE)
+                self.copy_into(into=staging, from_=prefix)
+                self.merge_into(into=table, from_=preparer.format_table(staging))
+
+            self.session.commit()
+
+        finally:
+            try:
+                self.remove_staged(prefix)
+            except Exception as e:
+                log.warning(f"Could not remove staged files from s3://{self.stage_bucket}/{prefix}: {e}")
+
+    def shadow_table(self, table: sa.Table) -> sa.Table:
+        """CREATE an empty copy of the Table, inheriting its sort and distribution keys."""
+        shadow = sa.Table(
+            f"{table.name}_swap_{uuid.uuid4().hex[:5]}",
+            sa.MetaData(schema=table.schema),
+            *(sa.Column(c.name, c.type) for c in table.columns),
+        )
+        preparer = self.engine.dialect.identifier_preparer
+
+        # fmt: off
+        SQL_CREATE_LIKE = sa.sql.text(
+            f"""
+            CREATE TABLE {preparer.format_table(shadow)} (LIKE {preparer.format_table(table)})
+            """
+        )
+        # fmt: on
+        self.session.execute(SQL_CREATE_LIKE)
+        return shadow
+
+    def cluster_table(self, table: sa.Table, *, columns: list[str]) -> None:
+        """Implement the ALTER SORTKEY statement."""
+        # REDSHIFT DOCS:
+        #   https://docs.aws.amazon.com/redshift/latest/dg/r_ALTER_TABLE.html
+        #
+        preparer = self.engine.dialect.identifier_preparer
+        sortkey = ", ".join(preparer.quote(column) for column in columns)
+
+        # fmt: off
+        SQL_ALTER_SORTKEY = sa.sql.text(
+            f"""
+            ALTER TABLE {preparer.format_table(table)} ALTER SORTKEY ({sortkey})
+            """
+        )
+        # fmt: on
+        with self.engine.begin() as connection:
+            connection.execute(SQL_ALTER_SORTKEY)
+
+    # MANDATORY PROTOCOL MEMBERS
 
     def dump(self, tablename: str, *, data: TableRows) -> None:
         """INSERT rows into Redshift."""
@@ -56,8 +345,13 @@ class Redshift(DatabaseSyncer):
             log.warning(f"No data to write to syncer {self}")
             return
 
+        data = self.sort_by_clustering(tablename, data=data)
         table = self.metadata.tables[tablename]
 
+        if self.stage_bucket is not None:
+            self.dump_staged(table, data=data)
+            return
+
         if self.load_strategy == "APPEND":
             sync_utils.batched(table.insert().values, session=self.session, data=data, max_parameters=250)
             self.session.commit()
@@ -66,9 +360,10 @@ class Redshift(DatabaseSyncer):
             self.session.execute(table.delete())
             sync_utils.batched(table.insert().values, session=self.session, data=data, max_parameters=250)
 
+        if self.load_strategy == "SWAP":
+            with self.loading_shadow(table) as shadow:
+                sync_utils.batched(shadow.insert().values, session=self.session, data=data, max_parameters=250)
+
         if self.load_strategy == "UPSERT":
-            # TODO: @saurabhsingh1608, 2024/04/09
-            #   need to investigate COPY->MERGE INTO functionality, similar to how we have in Snowflake syncer
-            #   https://docs.aws.amazon.com/redshift/latest/dg/r_MERGE.html
-            #
+            # Without a stage_bucket, fall back to row-by-row. See .dump_staged() for the COPY->MERGE path.
             sync_utils.generic_upsert(table, session=self.session, data=data, max_params=250)
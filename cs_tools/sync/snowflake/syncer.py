@@ -28,6 +28,7 @@ class Snowflake(DatabaseSyncer):
 
     __manifest_path__ = pathlib.Path(__file__).parent / "MANIFEST.json"
     __syncer_name__ = "snowflake"
+    __sorts_by_clustering__ = True
 
     account_name: str
     username: str
@@ -40,6 +41,10 @@ class Snowflake(DatabaseSyncer):
     private_key_path: Optional[pydantic.FilePath] = None
     log_level: Literal["debug", "info", "warning"] = "warning"
     temp_dir: Optional[pydantic.DirectoryPath] = pathlib.Path(".")
+    stage_file_size_mb: int = pydantic.Field(default=128, ge=1)
+    stage_parallelism: int = pydantic.Field(default=4, ge=1, le=99)
+    dump_parallelism: int = pydantic.Field(default=4, ge=1)
+    stage_format: Literal["csv", "parquet"] = "csv"
 
     @pydantic.field_validator("account_name")
     @classmethod
@@ -73,7 +78,7 @@ class Snowflake(DatabaseSyncer):
         super().__init__(**kwargs)
         logging.getLogger("snowflake").setLevel(self.log_level.upper())
 
-        self._engine = sa.create_engine(self.make_url())
+        self._engine = sa.create_engine(self.make_url(), **self.pool_options)
         self.metadata = sqlmodel.MetaData(schema=self.schema_)
 
     def __repr__(self) -> str:
@@ -149,17 +154,23 @@ class Snowflake(DatabaseSyncer):
         # ==============================================================================================================
         stage_name = f"{self.database}.{self.schema_}.TMP_STAGE_{tablename}_{uuid.uuid4().hex[:5]}"
 
+        if self.stage_format == "parquet":
+            file_format = "TYPE = PARQUET"
+        else:
+            file_format = """
+                TYPE = CSV
+                FIELD_DELIMITER = '|'
+                FIELD_OPTIONALLY_ENCLOSED_BY = '"'
+                EMPTY_FIELD_AS_NULL = TRUE
+                COMPRESSION = GZIP
+            """
+
         # fmt: off
         SQL_TEMP_STAGE = sa.sql.text(
             f"""
             CREATE TEMPORARY STAGE {stage_name}
             COMMENT = 'a temporary landing spot for CS Tools (+github: thoughtspot/cs_tools) syncer data dumps'
-            FILE_FORMAT = (
-                TYPE = CSV
-                FIELD_DELIMITER = '|'
-                FIELD_OPTIONALLY_ENCLOSED_BY = '"'
-                EMPTY_FIELD_AS_NULL = TRUE
-            )
+            FILE_FORMAT = ({file_format})
         """
         )
         # fmt: on
@@ -167,17 +178,40 @@ class Snowflake(DatabaseSyncer):
         log.debug("Snowflake response >> CREATE STAGE\n%s", r.scalar())
 
         # ==============================================================================================================
-        # SAVE & UPLOAD CSV
+        # SAVE & UPLOAD FILES
         # ==============================================================================================================
-        with sync_utils.temp_csv_for_upload(tmp=self.temp_dir, filename=tablename, data=data) as fd:
-            fp = pathlib.Path(fd.name)
+        # SNOWFLAKE DOCS:
+        #   Loading is fastest from many compressed files of roughly 100-250MB each, and PUT will upload every file
+        #   matched by the wildcard concurrently, using PARALLEL threads.
+        #
+        #   https://docs.snowflake.com/en/user-guide/data-load-considerations-prepare#general-file-sizing-recommendations
+        #   https://docs.snowflake.com/en/sql-reference/sql/put#optional-parameters
+        #
+        max_file_size = self.stage_file_size_mb * 1024 * 1024
+
+        if self.stage_format == "parquet":
+            table = self.table(tablename)
+            files = sync_utils.temp_parquet_parts_for_upload(
+                tmp=self.temp_dir, filename=tablename, table=table, data=data, max_file_size=max_file_size
+            )
+            compression = "NONE"
+        else:
+            files = sync_utils.temp_csv_parts_for_upload(
+                tmp=self.temp_dir, filename=tablename, data=data, max_file_size=max_file_size
+            )
+            compression = "GZIP"
+
+        with files as parts:
+            log.debug(f"Staging {len(parts)} {self.stage_format} file(s) for {tablename}")
+            fp = parts[0].parent
 
             # fmt: off
             SQL_PUT = sa.sql.text(
                 f"""
-                PUT 'file://{fp.as_posix()}' @{stage_name}
-                PARALLEL = 4
-                AUTO_COMPRESS = TRUE
+                PUT 'file://{fp.as_posix()}/*' @{stage_name}
+                PARALLEL = {self.stage_parallelism}
+                AUTO_COMPRESS = FALSE
+                SOURCE_COMPRESSION = {compression}
                 """
             )
             # fmt: on
@@ -188,6 +222,9 @@ class Snowflake(DatabaseSyncer):
 
     def copy_into(self, *, into: str, from_: str) -> None:
         """Implement the COPY INTO statement."""
+        # Parquet files are self-describing, so line up their fields with the target columns by name.
+        match_by = "MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE" if self.stage_format == "parquet" else ""
+
         # fmt: off
         SQL_COPY_INTO = sa.sql.text(
             f"""
@@ -195,6 +232,7 @@ class Snowflake(DatabaseSyncer):
             FROM {from_}
             ON_ERROR = ABORT_STATEMENT
             PURGE = TRUE
+            {match_by}
             """
         )
         # fmt: on
@@ -225,13 +263,98 @@ class Snowflake(DatabaseSyncer):
         r = self.session.execute(SQL_MERGE_INTO)
         log.debug("Snowflake response >> MERGE INTO\n%s", r.scalar())
 
-    # MANDATORY PROTOCOL MEMBERS
+    def shadow_table(self, table: sa.Table) -> sa.Table:
+        """CREATE an empty copy of the Table, inheriting its clustering key."""
+        # SNOWFLAKE DOCS:
+        #   https://docs.snowflake.com/en/sql-reference/sql/create-table#create-table-like
+        #
+        shadow = sa.Table(
+            f"{table.name}_swap_{uuid.uuid4().hex[:5]}",
+            sa.MetaData(schema=table.schema),
+            *(sa.Column(c.name, c.type) for c in table.columns),
+        )
 
-    def load(self, tablename: str) -> TableRows:
-        """SELECT rows from Snowflake."""
-        table = self.metadata.tables[f"{self.schema_}.{tablename}"]
-        rows = self.session.execute(table.select())
-        return [row.model_dump() for row in rows]
+        # fmt: off
+        SQL_CREATE_LIKE = sa.sql.text(
+            f"""
+            CREATE TABLE {self.database}.{shadow} LIKE {self.database}.{table}
+            """
+        )
+        # fmt: on
+        r = self.session.execute(SQL_CREATE_LIKE)
+        log.debug("Snowflake response >> CREATE TABLE LIKE\n%s", r.scalar())
+        return shadow
+
+    def swap_table(self, table: sa.Table, *, shadow: sa.Table) -> None:
+        """Implement the ALTER TABLE .. SWAP WITH statement."""
+        # SNOWFLAKE DOCS:
+        #   Swapping is a metadata-only operation, readers see either the old or the new data.
+        #   https://docs.snowflake.com/en/sql-reference/sql/alter-table#parameters
+        #
+        # fmt: off
+        SQL_SWAP_WITH = sa.sql.text(
+            f"""
+            ALTER TABLE {self.database}.{table} SWAP WITH {self.database}.{shadow}
+            """
+        )
+        # fmt: on
+        r = self.session.execute(SQL_SWAP_WITH)
+        log.debug("Snowflake response >> SWAP WITH\n%s", r.scalar())
+
+        # After the SWAP, the shadow holds the previous data.
+        self.drop_shadow(shadow)
+
+    def drop_shadow(self, shadow: sa.Table) -> None:
+        """DROP a shadow table, which lives in the configured database."""
+        self.session.execute(sa.sql.text(f"DROP TABLE IF EXISTS {self.database}.{shadow}"))
+
+    def clustering_key(self, table: sa.Table) -> list[str]:
+        """Fetch the column names of the table's current clustering key."""
+        # SNOWFLAKE DOCS:
+        #   CLUSTERING_KEY is the key's expression, eg. LINEAR(TIMESTAMP, GUID), or NULL when there isn't one.
+        #   https://docs.snowflake.com/en/sql-reference/info-schema/tables
+        #
+        # fmt: off
+        SQL_CLUSTERING_KEY = sa.sql.text(
+            f"""
+            SELECT clustering_key
+              FROM {self.database}.information_schema.tables
+             WHERE UPPER(table_schema) = UPPER(:schema)
+               AND UPPER(table_name) = UPPER(:table)
+            """
+        )
+        # fmt: on
+        with self.engine.connect() as connection:
+            expression = connection.execute(SQL_CLUSTERING_KEY, {"schema": self.schema_, "table": table.name}).scalar()
+
+        if not expression:
+            return []
+
+        _, _, columns = expression.partition("(")
+        return [column.strip().strip('"') for column in columns.rstrip(")").split(",")]
+
+    def cluster_table(self, table: sa.Table, *, columns: list[str]) -> None:
+        """Implement the ALTER TABLE .. CLUSTER BY statement."""
+        # SNOWFLAKE DOCS:
+        #   https://docs.snowflake.com/en/user-guide/tables-clustering-keys#defining-a-clustering-key-for-a-table
+        #
+        # Changing the key kicks off reclustering of the whole table, so leave it be if it's already set.
+        if [c.upper() for c in self.clustering_key(table)] == [c.upper() for c in columns]:
+            log.debug(f"{table} is already clustered by {columns}")
+            return
+
+        # fmt: off
+        SQL_CLUSTER_BY = sa.sql.text(
+            f"""
+            ALTER TABLE {self.database}.{table} CLUSTER BY ({", ".join(columns)})
+            """
+        )
+        # fmt: on
+        with self.engine.begin() as connection:
+            r = connection.execute(SQL_CLUSTER_BY)
+            log.debug("Snowflake response >> CLUSTER BY\n%s", r.scalar())
+
+    # MANDATORY PROTOCOL MEMBERS
 
     def dump(self, tablename: str, *, data: TableRows) -> None:
         """INSERT rows into Snowflake."""
@@ -239,6 +362,7 @@ class Snowflake(DatabaseSyncer):
             log.warning(f"no data to write to syncer {self}")
             return
 
+        data = self.sort_by_clustering(tablename, data=data)
         table = self.metadata.tables[f"{self.schema_}.{tablename}"]
         stage = self.stage_and_put(tablename=tablename, data=data)
 
@@ -249,8 +373,16 @@ class Snowflake(DatabaseSyncer):
             self.session.execute(table.delete())
             self.copy_into(from_=f"@{stage}", into=tablename)
 
+        if self.load_strategy == "SWAP":
+            with self.loading_shadow(table) as shadow:
+                self.copy_into(from_=f"@{stage}", into=shadow.name)
+
         if self.load_strategy == "UPSERT":
             # Since we PUT a file into @stage, we now need to tell Snowflake the name of each of the columns.
-            column = ", ".join(f"${i} as {c.name}" for i, c in enumerate(table.columns, start=1))
+            if self.stage_format == "parquet":
+                types = {c.name: c.type.compile(dialect=self.engine.dialect) for c in table.columns}
+                column = ", ".join(f"$1:{c.name}::{types[c.name]} as {c.name}" for c in table.columns)
+            else:
+                column = ", ".join(f"${i} as {c.name}" for i, c in enumerate(table.columns, start=1))
             staged = f"(SELECT {column} FROM @{stage})"
             self.merge_into(from_=staged, into=table)
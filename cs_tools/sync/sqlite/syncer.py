@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Callable, Optional, Union
 import logging
 import pathlib
 
@@ -10,7 +9,7 @@ import pydantic
 import sqlalchemy as sa
 
 from cs_tools.sync import utils as sync_utils
-from cs_tools.sync.base import DatabaseSyncer
+from cs_tools.sync.base import DatabaseSyncer, Syncer
 
 from . import const
 
@@ -25,6 +24,7 @@ class SQLite(DatabaseSyncer):
 
     __manifest_path__ = pathlib.Path(__file__).parent / "MANIFEST.json"
     __syncer_name__ = "sqlite"
+    __commits_per_dump__ = True
 
     database_path: Union[pydantic.FilePath, pydantic.NewPath]
 
@@ -36,7 +36,7 @@ class SQLite(DatabaseSyncer):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._engine = sa.create_engine(f"sqlite:///{self.database_path}", future=True)
+        self._engine = sa.create_engine(f"sqlite:///{self.database_path}", **self.pool_options, future=True)
 
     def __repr__(self):
         return f"<SQLiteSyncer conn_string='{self.engine.url}'>"
@@ -69,30 +69,25 @@ class SQLite(DatabaseSyncer):
     #     self.session.execute("PRAGMA locking_mode = EXCLUSIVE;")
     #     self.session.execute("PRAGMA temp_store = MEMORY;")
 
-    def read_stream(self, tablename: str, *, batch: int = 100_000) -> Iterator[TableRows]:
-        """Read rows from a SQLite database."""
-        table = self.metadata.tables[tablename]
+    def cluster_table(self, table: sa.Table, *, columns: list[str]) -> None:
+        """SQLite tables are ordered by their rowid, so an index is the closest we can get."""
+        self.create_index(table, columns=columns)
 
-        with self.session.execute(table.select()).yield_per(num=batch) as result:
-            for rows in result.partitions():
-                yield [row._asdict() for row in rows]
+    def dump_many(
+        self, directives: dict[str, TableRows], *, on_written: Optional[Callable[[str], None]] = None
+    ) -> None:
+        """SQLite allows only a single writer at a time, so tables are always written one after another."""
+        return Syncer.dump_many(self, directives, on_written=on_written)
 
     # MANDATORY PROTOCOL MEMBERS
 
-    def load(self, tablename: str) -> TableRows:
-        """SELECT rows from SQLite."""
-        table = self.metadata.tables[tablename]
-        query = table.select()
-        result = self.session.execute(query)
-        rows = [row._asdict() for row in result.all()]
-        return rows
-
     def dump(self, tablename: str, *, data: TableRows) -> None:
         """INSERT rows into SQLite."""
         if not data:
             log.warning(f"no '{tablename}' data to write to syncer {self}")
             return
 
+        data = self.sort_by_clustering(tablename, data=data)
         table = self.metadata.tables[tablename]
 
         if self.load_strategy == "APPEND":
@@ -106,6 +101,12 @@ class SQLite(DatabaseSyncer):
                 table.insert().values, session=self.session, data=data, max_parameters=const.SQLITE_MAX_VARIABLES
             )
 
+        if self.load_strategy == "SWAP":
+            with self.loading_shadow(table) as shadow:
+                sync_utils.batched(
+                    shadow.insert().values, session=self.session, data=data, max_parameters=const.SQLITE_MAX_VARIABLES
+                )
+
         if self.load_strategy == "UPSERT":
             sync_utils.batched(
                 self.insert_on_conflict,
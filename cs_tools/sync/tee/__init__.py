@@ -0,0 +1 @@
+from .syncer import Tee
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Optional, Union
+import concurrent.futures as cf
+import dataclasses
+import logging
+import pathlib
+import time
+
+import pydantic
+
+from cs_tools import errors
+from cs_tools.datastructures import ValidatedSQLModel
+from cs_tools.sync import base
+from cs_tools.sync.base import Syncer
+
+if TYPE_CHECKING:
+    import sqlmodel
+
+    from cs_tools.sync.types import TableRows
+
+log = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class TargetStatistics:
+    """Running totals for a single target of the Tee."""
+
+    rows: int = 0
+    seconds: float = 0.0
+    failures: int = 0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+class Tee(Syncer):
+    """Write the same data to many Syncers at once."""
+
+    __manifest_path__ = pathlib.Path(__file__).parent / "MANIFEST.json"
+    __syncer_name__ = "tee"
+
+    targets: list[str]
+    models: list[type[ValidatedSQLModel]] = []  # noqa: RUF012
+    ignore_failures: bool = False
+
+    _syncers: list[Syncer] = []  # noqa: RUF012
+    _statistics: dict[str, TargetStatistics] = {}  # noqa: RUF012
+    _failed: set[str] = set()  # noqa: RUF012
+    _pool: Optional[cf.ThreadPoolExecutor] = pydantic.PrivateAttr(None)
+
+    @pydantic.field_validator("targets", mode="before")
+    @classmethod
+    def _ensure_list(cls, value: Union[str, list[str]]) -> list[str]:
+        # Definitions may contain commas of their own, so a single target is the only thing a string can be.
+        if isinstance(value, str):
+            return [value]
+
+        return value
+
+    @pydantic.field_validator("targets", mode="after")
+    @classmethod
+    def _ensure_protocol_given(cls, value: list[str]) -> list[str]:
+        for target in value:
+            if "://" not in target:
+                raise ValueError(f"'{target}' is not a valid syncer, expected the form protocol://definition")
+
+            if target.startswith("tee://"):
+                raise ValueError("a Tee syncer may not write to another Tee")
+
+        return value
+
+    def __init__(self, **data):
+        super().__init__(**data)
+        self._syncers = []
+        self._statistics = {}
+        self._failed = set()
+
+        for target in self.targets:
+            protocol, _, definition = target.partition("://")
+            SyncerClass = base.syncer_class(protocol)
+            configuration = base.parse_definition(definition)
+
+            # DatabaseSyncers, and Syncers which wrap them, are told which tables to create.
+            if "models" in SyncerClass.model_fields and self.models:
+                configuration["models"] = self.models
+
+            syncer = SyncerClass(**configuration)
+            self._syncers.append(syncer)
+            self._statistics[self.target_name(syncer)] = TargetStatistics()
+
+        self._pool = cf.ThreadPoolExecutor(max_workers=len(self._syncers), thread_name_prefix="tee")
+
+    def __teardown__(self, exc: Optional[BaseException] = None) -> None:
+        self._pool.shutdown(wait=True)
+        failures: list[BaseException] = []
+
+        for syncer in self._syncers:
+            name = self.target_name(syncer)
+
+            # A failed command rolls back every target, a target which failed a write is always rolled back.
+            if exc is None and name in self._failed:
+                target_exc = errors.CSToolsError(f"A write to {name} failed")
+            else:
+                target_exc = exc
+
+            try:
+                base.teardown(syncer, target_exc)
+            except Exception as e:
+                log.error(f"Failed to finish writing to {name}: {e}")
+                log.debug(e, exc_info=e)
+                failures.append(e)
+
+        for name, stats in self._statistics.items():
+            log.info(
+                f"{name} wrote {stats.rows:,} rows in {stats.seconds:.2f}s ({stats.rows_per_second:,.0f} rows/s)"
+                + (f", [b red]{stats.failures} failed writes[/]" if stats.failures else "")
+            )
+
+        # Don't mask the failure which ended the command with one of our own.
+        if failures and exc is None:
+            raise failures[0]
+
+    def commits_per_dump(self) -> bool:
+        # With ignore_failures, a write may have been skipped by one of the targets.
+        return not self.ignore_failures and all(syncer.commits_per_dump() for syncer in self._syncers)
+
+    @property
+    def is_database_syncer(self) -> bool:
+        return any(syncer.is_database_syncer for syncer in self._syncers)
+
+    def create_model_table(self, model: type[sqlmodel.SQLModel]) -> None:
+        """CREATE TABLE for the model in every target which writes to a Database."""
+        for syncer in self._syncers:
+            if syncer.is_database_syncer:
+                syncer.create_model_table(model)
+
+    def __repr__(self):
+        return f"<TeeSyncer to {', '.join(self.target_name(syncer) for syncer in self._syncers)}>"
+
+    @staticmethod
+    def target_name(syncer: Syncer) -> str:
+        """A readable name for the target."""
+        return repr(syncer)
+
+    def fan_out(self, write: Callable[[Syncer], None], *, n_rows: int) -> None:
+        """Run the write against every target concurrently, waiting for all of them to finish."""
+
+        def _timed(syncer: Syncer) -> None:
+            start = time.perf_counter()
+            write(syncer)
+            stats = self._statistics[self.target_name(syncer)]
+            stats.rows += n_rows
+            stats.seconds += time.perf_counter() - start
+
+        futures = {self._pool.submit(_timed, syncer): syncer for syncer in self._syncers}
+        failures: list[BaseException] = []
+
+        for future in cf.as_completed(futures):
+            if (exc := future.exception()) is None:
+                continue
+
+            name = self.target_name(futures[future])
+            self._statistics[name].failures += 1
+            self._failed.add(name)
+            log.error(f"Failed to write to {name}: {exc}")
+            log.debug(exc, exc_info=exc)
+            failures.append(exc)
+
+        if failures and not self.ignore_failures:
+            raise failures[0]
+
+    # MANDATORY PROTOCOL MEMBERS
+
+    def load(self, directive: str) -> TableRows:
+        """Read rows from the first target."""
+        return self._syncers[0].load(directive)
+
+    def dump(self, directive: str, *, data: TableRows) -> None:
+        """Write rows to every target."""
+        if not data:
+            log.warning(f"No data to write to syncer {self}")
+            return
+
+        self.fan_out(lambda syncer: syncer.dump(directive, data=data), n_rows=len(data))
+
+    def dump_many(
+        self, directives: dict[str, TableRows], *, on_written: Optional[Callable[[str], None]] = None
+    ) -> None:
+        """Write rows for many directives to every target."""
+        n_rows = sum(len(data) for data in directives.values())
+        self.fan_out(lambda syncer: syncer.dump_many(directives), n_rows=n_rows)
+
+        for directive in directives:
+            if on_written is not None:
+                on_written(directive)
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Any, Literal, Optional
+import concurrent.futures as cf
+import datetime as dt
+import decimal
 import logging
+import math
 import pathlib
 
 from pydantic_core import PydanticCustomError
@@ -22,11 +27,49 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
+def _to_trino_literal(value: Any) -> str:
+    """Render a python value as a Trino SQL literal."""
+    # TRINO DOCS:
+    #   https://trino.io/docs/current/language/types.html
+    if value is None:
+        return "NULL"
+
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+
+    if isinstance(value, int):
+        return repr(value)
+
+    if isinstance(value, float):
+        if math.isnan(value):
+            return "nan()"
+        if math.isinf(value):
+            return "infinity()" if value > 0 else "-infinity()"
+        return repr(value)
+
+    if isinstance(value, decimal.Decimal):
+        return f"DECIMAL '{value:f}'"
+
+    if isinstance(value, dt.datetime):
+        # Timezone-aware values keep their instant, whether the column has a time zone or not.
+        if value.tzinfo is not None:
+            value = value.astimezone(dt.timezone.utc).replace(tzinfo=None)
+            return f"TIMESTAMP '{value.isoformat(sep=' ', timespec='microseconds')} +00:00'"
+        return f"TIMESTAMP '{value.isoformat(sep=' ', timespec='microseconds')}'"
+
+    if isinstance(value, dt.date):
+        return f"DATE '{value.isoformat()}'"
+
+    escaped = str(value).replace("'", "''")
+    return f"'{escaped}'"
+
+
 class Trino(DatabaseSyncer):
     """Interact with a Trino database."""
 
     __manifest_path__ = pathlib.Path(__file__).parent / "MANIFEST.json"
     __syncer_name__ = "trino"
+    __commits_per_dump__ = True
 
     host: pydantic.IPvAnyAddress
     port: Optional[int] = 8080
@@ -35,6 +78,8 @@ class Trino(DatabaseSyncer):
     authentication: Literal["basic", "jwt"]
     username: Optional[str] = None
     secret: Optional[str] = None
+    insert_max_bytes: int = pydantic.Field(default=1_000_000, ge=1_024)
+    insert_parallelism: int = pydantic.Field(default=1, ge=1)
 
     @pydantic.field_validator("username", mode="before")
     def ensure_basic_auth_username_given(cls, value: Any, info: pydantic.ValidationInfo) -> Any:
@@ -48,9 +93,17 @@ class Trino(DatabaseSyncer):
             raise PydanticCustomError("missing", "Field required, you must provide a json web token", {"secret": value})
         return value
 
+    @pydantic.field_validator("load_strategy", mode="after")
+    def ensure_swap_not_requested(cls, value: str) -> str:
+        # Renames are not atomic across Trino connectors, so we can't guarantee readers never see an empty table.
+        if value == "SWAP":
+            raise ValueError(f"{cls.__name__} does not support the SWAP load_strategy, use TRUNCATE instead")
+        return value
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._engine = sa.create_engine(self.make_url(), future=True)
+        options = {**self.pool_options, "pool_size": max(self.pool_size, self.insert_parallelism)}
+        self._engine = sa.create_engine(self.make_url(), **options, future=True)
         self.metadata = sqlmodel.MetaData(schema=self.schema_)
 
     def make_url(self) -> URL:
@@ -80,13 +133,61 @@ class Trino(DatabaseSyncer):
     def __repr__(self):
         return f"<TrinoSyncer to {self.host}/{self.catalog}>"
 
-    # MANDATORY PROTOCOL MEMBERS
+    def insert_statements(self, table: sa.Table, *, data: TableRows) -> Iterator[str]:
+        """Render rows into INSERT .. VALUES statements which each fit within insert_max_bytes."""
+        preparer = self.engine.dialect.identifier_preparer
+        column = ", ".join(preparer.quote(c.name) for c in table.columns)
+        prefix = f"INSERT INTO {preparer.format_table(table)} ({column}) VALUES "
 
-    def load(self, tablename: str) -> TableRows:
-        """SELECT rows from Trino."""
-        table = self.metadata.tables[f"{self.schema_}.{tablename}"]
-        rows = self.session.execute(table.select())
-        return [row.model_dump() for row in rows]
+        values: list[str] = []
+        size = len(prefix)
+
+        for row in data:
+            literal = "(" + ", ".join(_to_trino_literal(row.get(c.name)) for c in table.columns) + ")"
+            literal_size = len(literal.encode()) + len(", ")
+
+            if values and size + literal_size > self.insert_max_bytes:
+                yield prefix + ", ".join(values)
+                values, size = [], len(prefix)
+
+            values.append(literal)
+            size += literal_size
+
+        if values:
+            yield prefix + ", ".join(values)
+
+    def bulk_insert(self, table: sa.Table, *, data: TableRows) -> None:
+        """
+        INSERT rows in as few, large statements as possible, optionally over several connections.
+
+        Parallel INSERTs are not transactional, each one is committed as soon as it finishes. Within
+        dump_many(), whose tables must all commit or roll back together, they're run one at a time.
+        """
+        # Each INSERT is a full distributed query, so the coordinator overhead is paid per statement rather than per
+        # row. Rendering literals directly also sidesteps the client's limit on bound parameters.
+        is_in_transaction = getattr(self._local, "session", None) is not None
+
+        if self.insert_parallelism == 1 or is_in_transaction:
+            for statement in self.insert_statements(table, data=data):
+                self.session.connection().exec_driver_sql(statement)
+
+            return
+
+        def _execute(statement: str) -> None:
+            with self.engine.connect() as connection:
+                connection.exec_driver_sql(statement)
+                connection.commit()
+
+        # Make any prior work (eg. TRUNCATE) visible to the other connections first.
+        self.session.commit()
+
+        with cf.ThreadPoolExecutor(max_workers=self.insert_parallelism) as pool:
+            futures = [pool.submit(_execute, statement) for statement in self.insert_statements(table, data=data)]
+
+            for future in cf.as_completed(futures):
+                future.result()
+
+    # MANDATORY PROTOCOL MEMBERS
 
     def dump(self, tablename: str, *, data: TableRows) -> None:
         """INSERT rows into Trino."""
@@ -94,14 +195,15 @@ class Trino(DatabaseSyncer):
             log.warning(f"no data to write to syncer {self}")
             return
 
+        data = self.sort_by_clustering(tablename, data=data)
         table = self.metadata.tables[f"{self.schema_}.{tablename}"]
 
         if self.load_strategy == "APPEND":
-            sync_utils.batched(table.insert().values, session=self.session, data=data)
+            self.bulk_insert(table, data=data)
 
         if self.load_strategy == "TRUNCATE":
             self.session.execute(table.delete())
-            sync_utils.batched(table.insert().values, session=self.session, data=data)
+            self.bulk_insert(table, data=data)
 
         if self.load_strategy == "UPSERT":
             sync_utils.generic_upsert(table, session=self.session, data=data)
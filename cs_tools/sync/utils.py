@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, Callable, Optional
 import collections
 import contextlib
 import csv
 import datetime as dt
+import gzip
+import io
 import logging
 import pathlib
+import shutil
 import tempfile
 
 import sqlalchemy as sa
@@ -14,6 +18,11 @@ import sqlalchemy as sa
 from cs_tools import utils
 from cs_tools.sync.types import TableRows
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from cs_tools.sync.base import Syncer
+
 log = logging.getLogger(__name__)
 DATETIME_FORMAT_ISO_8601 = "%Y-%m-%dT%H:%M:%S.%f"
 DATETIME_FORMAT_TSLOAD = "%Y-%m-%d %H:%M:%S"
@@ -37,6 +46,148 @@ def temp_csv_for_upload(tmp: pathlib.Path, *, filename: str, data: TableRows, in
     pathlib.Path(fd.name).unlink()
 
 
+@contextlib.contextmanager
+def temp_csv_parts_for_upload(
+    tmp: pathlib.Path,
+    *,
+    filename: str,
+    data: TableRows,
+    max_file_size: int,
+    include_header: bool = False,
+    fieldnames: Optional[list[str]] = None,
+) -> Iterator[list[pathlib.Path]]:
+    """
+    Temporarily create many gzipped files for bulk loading.
+
+    Rows are compressed as they're written, and a new file is started once the current
+    one reaches roughly max_file_size compressed bytes. Columns are written in the order of
+    fieldnames, which defaults to the keys of the first row.
+    """
+    directory = pathlib.Path(tempfile.mkdtemp(dir=tmp, prefix=f"{filename}_"))
+    parts: list[pathlib.Path] = []
+    raw, fd = None, None
+
+    try:
+        for row_number, row in enumerate(data, start=1):
+            if fd is None:
+                parts.append(directory / f"{filename}.{len(parts):04d}.csv.gz")
+                raw = parts[-1].open(mode="wb")
+                gz = gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6)
+                fd = io.TextIOWrapper(gz, encoding="utf-8", newline="")
+                # Keys which aren't columns of the target can't be loaded, so they're dropped.
+                extras = "raise" if fieldnames is None else "ignore"
+                writer = csv.DictWriter(fd, fieldnames=fieldnames or data[0].keys(), delimiter="|", extrasaction=extras)
+
+                if include_header:
+                    writer.writeheader()
+
+            writer.writerow(row)
+
+            # Only check the size every so often, the compressed bytes are flushed in blocks anyway.
+            if row_number % 10_000 == 0 and raw.tell() >= max_file_size:
+                fd.close()
+                raw.close()
+                raw, fd = None, None
+
+        if fd is not None:
+            fd.close()
+            raw.close()
+            raw, fd = None, None
+
+        yield parts
+
+    finally:
+        if fd is not None:
+            fd.close()
+            raw.close()
+
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def arrow_schema_from_table(table: sa.Table) -> pa.Schema:
+    """Translate the Table's column types into a typed Arrow schema."""
+    import pyarrow as pa
+
+    # fmt: off
+    arrow_types = {
+        bool: pa.bool_(),
+        int: pa.int64(),
+        float: pa.float64(),
+        str: pa.string(),
+        dt.date: pa.date32(),
+        # CS Tools models normalize all datetimes to UTC, so write them as instants.
+        dt.datetime: pa.timestamp("us", tz="UTC"),
+    }
+    # fmt: on
+
+    fields = []
+
+    for column in table.columns:
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            python_type = str
+
+        arrow_type = arrow_types.get(python_type, pa.string())
+        fields.append(pa.field(column.name, arrow_type, nullable=column.nullable))
+
+    return pa.schema(fields)
+
+
+@contextlib.contextmanager
+def temp_parquet_parts_for_upload(
+    tmp: pathlib.Path,
+    *,
+    filename: str,
+    table: sa.Table,
+    data: TableRows,
+    max_file_size: int,
+    rows_per_group: int = 100_000,
+    columns: Optional[list[str]] = None,
+) -> Iterator[list[pathlib.Path]]:
+    """
+    Temporarily create many Parquet files for bulk loading.
+
+    Values are written with the types of the Table's columns, so no string conversion is
+    necessary. A new file is started once the current one reaches roughly max_file_size.
+    Columns are written in the order given, which defaults to the Table's.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = arrow_schema_from_table(table)
+
+    if columns is not None:
+        schema = pa.schema([schema.field(column) for column in columns])
+    directory = pathlib.Path(tempfile.mkdtemp(dir=tmp, prefix=f"{filename}_"))
+    parts: list[pathlib.Path] = []
+    writer = None
+
+    try:
+        for rows in utils.batched(data, n=rows_per_group):
+            if writer is None:
+                parts.append(directory / f"{filename}.{len(parts):04d}.parquet")
+                writer = pq.ParquetWriter(parts[-1], schema=schema, compression="snappy")
+
+            writer.write_table(pa.Table.from_pylist(list(rows), schema=schema))
+
+            if parts[-1].stat().st_size >= max_file_size:
+                writer.close()
+                writer = None
+
+        if writer is not None:
+            writer.close()
+            writer = None
+
+        yield parts
+
+    finally:
+        if writer is not None:
+            writer.close()
+
+        shutil.rmtree(directory, ignore_errors=True)
+
+
 def format_datetime_values(row: dict[str, Any], *, dt_format: str = DATETIME_FORMAT_ISO_8601) -> dict[str, Any]:
     """Enforce a specific format for datetime values."""
     out = {}
@@ -50,6 +201,82 @@ def format_datetime_values(row: dict[str, Any], *, dt_format: str = DATETIME_FOR
     return out
 
 
+def last_row_per_key(data: TableRows, *, key: list[str]) -> TableRows:
+    """Keep only the last row for each key, in the order each key was first seen."""
+    latest = {tuple(row.get(column) for column in key): row for row in data}
+
+    if len(latest) < len(data):
+        log.debug(f"Dropped {len(data) - len(latest):,} rows which share a key with a later row")
+
+    return list(latest.values())
+
+
+def _strategy_holders(syncer: Syncer) -> Iterator[tuple[Syncer, str]]:
+    """Find the Syncers, and the name of the attribute, which decide how new data is written."""
+    # A DSyncer only proxies reads, so the strategy must be set on the Syncer it wraps.
+    syncer = getattr(syncer, "_syncer", syncer)
+
+    # A Tee delegates every write to its targets.
+    for target in getattr(syncer, "_syncers", []):
+        yield from _strategy_holders(target)
+
+    for attribute in ("load_strategy", "save_strategy"):
+        if hasattr(syncer, attribute):
+            yield syncer, attribute
+
+
+@contextlib.contextmanager
+def incremental_writes(syncer: Syncer, *, resuming: bool = False) -> Iterator[Callable[[], None]]:
+    """
+    Treat successive writes to the Syncer as a single load, call the yielded function before each one.
+
+    The first write uses the Syncer's own strategy, so TRUNCATE and OVERWRITE still replace
+    the existing data. Every later write, and every write when resuming a load which was
+    interrupted, is appended to it. A SWAP load writes every batch to the same shadow table,
+    which only replaces the table once the load has finished.
+    """
+    holders = [(holder, attribute, getattr(holder, attribute)) for holder, attribute in _strategy_holders(syncer)]
+    is_first_write = not resuming
+
+    def _next_write() -> None:
+        nonlocal is_first_write
+
+        for holder, attribute, initial in holders:
+            if initial in ("TRUNCATE", "OVERWRITE") or (initial == "SWAP" and resuming):
+                setattr(holder, attribute, initial if is_first_write else "APPEND")
+
+        is_first_write = False
+
+    try:
+        with contextlib.ExitStack() as stack:
+            for holder, _, initial in holders:
+                if initial == "SWAP" and not resuming:
+                    stack.enter_context(holder.swap_once())
+
+            yield _next_write
+
+    finally:
+        for holder, attribute, initial in holders:
+            setattr(holder, attribute, initial)
+
+
+@contextlib.contextmanager
+def incremental_dump(
+    syncer: Syncer, directive: str, *, resuming: bool = False
+) -> Iterator[Callable[[TableRows], None]]:
+    """Write successive batches of rows to the same directive, see incremental_writes()."""
+    with incremental_writes(syncer, resuming=resuming) as next_write:
+
+        def _dump(data: TableRows) -> None:
+            if not data:
+                return
+
+            next_write()
+            syncer.dump(directive, data=data)
+
+        yield _dump
+
+
 def batched(prepared_statement, *, session: sa.orm.Session, data: TableRows, max_parameters: int = 999, **kw) -> None:
     """Split data across multiple transactions."""
     batchsize = min(5000, max_parameters // len(data[0]))
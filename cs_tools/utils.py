@@ -4,8 +4,9 @@ from base64 import (
     urlsafe_b64decode as b64d,
     urlsafe_b64encode as b64e,
 )
-from collections.abc import Generator, Iterable
-from typing import Any, Callable, Optional, TypeVar, Union
+from collections.abc import Generator, Iterable, Iterator
+from typing import Any, Callable, Generic, Optional, TypeVar, Union
+import contextlib
 import datetime as dt
 import getpass
 import importlib
@@ -15,7 +16,9 @@ import json
 import logging
 import os
 import pathlib
+import queue
 import site
+import sqlite3
 import threading
 import zlib
 
@@ -186,6 +189,160 @@ class ExceptedThread(threading.Thread):
             log.debug(f"Something went wrong in {self}", exc_info=True)
 
 
+class WritePipeline(Generic[T]):
+    """
+    Hand items off to a background thread which writes them, while the caller produces the next.
+
+    The queue between the two is bounded, so a producer which gets too far ahead of the writer
+    blocks until there's room again. Errors in the writer are raised back in the producer.
+
+    Usage:
+        with WritePipeline(lambda rows: syncer.dump("table", data=rows)) as pipeline:
+            for page in fetch_pages():
+                pipeline.put(transform(page))
+    """
+
+    _DONE = object()
+
+    def __init__(self, write: Callable[[T], None], *, maxsize: int = 2, name: str = "write-pipeline"):
+        self.write = write
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._drain, name=name, daemon=True)
+        self._error: Optional[BaseException] = None
+
+    def __enter__(self) -> WritePipeline[T]:
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        self._queue.put(self._DONE)
+        self._thread.join()
+
+        if exc_type is None and self._error is not None:
+            raise self._error
+
+    def _drain(self) -> None:
+        while (item := self._queue.get()) is not self._DONE:
+            # Once the writer has failed, keep draining the queue so the producer is never blocked forever.
+            if self._error is not None:
+                continue
+
+            try:
+                self.write(item)
+            except BaseException as e:
+                log.debug(f"Something went wrong in {self._thread.name}", exc_info=True)
+                self._error = e
+
+    def put(self, item: T) -> None:
+        """Queue an item to be written, blocking while the queue is full."""
+        if self._error is not None:
+            raise self._error
+
+        self._queue.put(item)
+
+
+class CheckpointStore:
+    """
+    Remember which units of a long-running command have completed, so an interrupted run may resume.
+
+    A unit of work is identified by its (org, stage, chunk) and may keep the data it produced, for
+    later stages which depend on it. Checkpoints belong to a run, which should identify both the
+    command and the arguments it was called with.
+
+    On a clean exit, the run is complete and its checkpoints are cleared.
+
+    Usage:
+        with CheckpointStore(ts.config.temp_dir / "checkpoints.db", run="my-command", resume=resume) as checkpoints:
+            for org in orgs:
+                if checkpoints.is_complete("users", org=org):
+                    continue
+
+                syncer.dump("users", data=fetch_users(org))
+                checkpoints.complete("users", org=org)
+    """
+
+    def __init__(self, path: pathlib.Path, *, run: str, resume: bool = False):
+        self.path = path
+        self.run = run
+
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoint ("
+                "run TEXT, org TEXT, stage TEXT, chunk TEXT, completed_at TEXT, data TEXT, "
+                "PRIMARY KEY (run, org, stage, chunk))"
+            )
+
+        if not resume:
+            self.clear()
+
+        elif completed := len(self):
+            log.info(f"Resuming, skipping {completed:,} units of work completed by the previous run")
+
+    def __enter__(self) -> CheckpointStore:
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        if exc_type is None:
+            self.clear()
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            (count,) = conn.execute("SELECT COUNT(*) FROM checkpoint WHERE run = ?", (self.run,)).fetchone()
+
+        return count
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # A connection per operation, so units may be completed from any thread.
+        conn = sqlite3.connect(self.path, timeout=30)
+
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _key(self, stage: str, *, org: Optional[Any], chunk: Optional[Any]) -> tuple[str, str, str, str]:
+        return (self.run, "" if org is None else str(org), stage, "" if chunk is None else str(chunk))
+
+    def is_complete(self, stage: str, *, org: Optional[Any] = None, chunk: Optional[Any] = None) -> bool:
+        """Determine if the unit of work completed during this run."""
+        with self._connect() as conn:
+            r = conn.execute(
+                "SELECT 1 FROM checkpoint WHERE run = ? AND org = ? AND stage = ? AND chunk = ?",
+                self._key(stage, org=org, chunk=chunk),
+            )
+            return r.fetchone() is not None
+
+    def complete(self, stage: str, *, org: Optional[Any] = None, chunk: Optional[Any] = None, data: Any = None) -> None:
+        """Mark the unit of work as completed, keeping any data it produced."""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO checkpoint VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    *self._key(stage, org=org, chunk=chunk),
+                    dt.datetime.now(tz=dt.timezone.utc).isoformat(),
+                    json.dumps(data, cls=DateTimeEncoder),
+                ),
+            )
+
+    def staged(self, stage: str, *, org: Optional[Any] = None, chunk: Optional[Any] = None) -> Any:
+        """Fetch the data kept by a completed unit of work."""
+        with self._connect() as conn:
+            r = conn.execute(
+                "SELECT data FROM checkpoint WHERE run = ? AND org = ? AND stage = ? AND chunk = ?",
+                self._key(stage, org=org, chunk=chunk),
+            )
+            row = r.fetchone()
+
+        return None if row is None else json.loads(row[0])
+
+    def clear(self) -> None:
+        """Forget every unit of work in this run."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM checkpoint WHERE run = ?", (self.run,))
+
+
 def determine_editable_install() -> bool:
     """Determine if the current CS Tools context is an editable install."""
     if "FAKE_EDITABLE" in os.environ:
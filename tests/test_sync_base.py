@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import types
+
+from cs_tools.cli.tools.searchable import models
+from cs_tools.sync import utils as sync_utils
+from cs_tools.sync.base import DatabaseSyncer
+from cs_tools.sync.sqlite.syncer import SQLite
+import pytest
+import sqlalchemy as sa
+
+
+@pytest.fixture
+def syncer(tmp_path) -> SQLite:
+    metadata = sa.MetaData()
+    table = sa.Table("ts_example", metadata, sa.Column("id", sa.Integer, primary_key=True), sa.Column("name", sa.Text))
+    syncer = SQLite(database_path=tmp_path / "example.db", metadata=metadata, load_strategy="SWAP")
+
+    syncer.session.execute(table.insert(), [{"id": 1, "name": "old"}])
+    syncer.session.commit()
+    return syncer
+
+
+def select_names(syncer: SQLite, selectable: str = "ts_example") -> list[str]:
+    """Read from a separate connection, as any other reader of the Database would."""
+    with syncer.engine.connect() as connection:
+        return connection.execute(sa.text(f"SELECT name FROM {selectable} ORDER BY id")).scalars().all()
+
+
+def test_swap_table_replaces_rows_in_place_when_views_depend_on_it(syncer, monkeypatch):
+    syncer.session.execute(sa.text("CREATE VIEW v_example AS SELECT id, name FROM ts_example"))
+    monkeypatch.setattr(SQLite, "dependent_views", lambda self, table: ["v_example"])  # noqa: ARG005
+
+    syncer.dump("ts_example", data=[{"id": 2, "name": "new"}])
+
+    assert select_names(syncer, "v_example") == ["new"]
+    assert sa.inspect(syncer.engine).get_table_names() == ["ts_example"]
+
+
+def test_incremental_swap_replaces_the_table_once_every_batch_is_loaded(syncer):
+    with sync_utils.incremental_dump(syncer, "ts_example") as dump:
+        dump([{"id": 2, "name": "new"}])
+        assert select_names(syncer) == ["old"]
+
+        dump([{"id": 3, "name": "newer"}])
+        assert select_names(syncer) == ["old"]
+
+    syncer.session.commit()
+
+    assert select_names(syncer) == ["new", "newer"]
+    assert sa.inspect(syncer.engine).get_table_names() == ["ts_example"]
+    assert syncer.load_strategy == "SWAP"
+
+
+def test_failed_incremental_swap_keeps_the_table_and_drops_its_shadow(syncer):
+    with pytest.raises(RuntimeError, match="interrupted"):
+        with sync_utils.incremental_dump(syncer, "ts_example") as dump:
+            dump([{"id": 2, "name": "new"}])
+            raise RuntimeError("interrupted")
+
+    assert select_names(syncer) == ["old"]
+    assert sa.inspect(syncer.engine).get_table_names() == ["ts_example"]
+
+
+def test_only_models_which_declare_clustering_are_clustered():
+    assert models.AuditLogs.is_clustered()
+    assert not models.Cluster.is_clustered()
+
+
+def test_sort_by_clustering_only_where_the_database_benefits(syncer, monkeypatch):
+    syncer._clustering = {"ts_example": ["name"]}
+    data = [{"id": 1, "name": "b"}, {"id": 2, "name": None}, {"id": 3, "name": "a"}]
+
+    assert syncer.sort_by_clustering("ts_example", data=data) is data
+
+    monkeypatch.setattr(SQLite, "__sorts_by_clustering__", True)
+
+    assert [row["id"] for row in syncer.sort_by_clustering("ts_example", data=data)] == [3, 1, 2]
+
+
+def test_only_loads_committed_by_each_dump_may_resume(syncer):
+    assert not syncer.commits_per_dump()
+
+    syncer.load_strategy = "APPEND"
+
+    assert syncer.commits_per_dump()
+
+
+class FakeTransaction:
+    """Stands in for the open transaction of a dump_many() worker, recording how it was finished."""
+
+    def __init__(self, tablename: str, finished: list[tuple[str, str]], *, fails_to_commit: bool = False):
+        self.tablename = tablename
+        self.finished = finished
+        self.fails_to_commit = fails_to_commit
+        self.connection = types.SimpleNamespace(close=lambda: None)
+
+    def commit(self) -> None:
+        if self.fails_to_commit:
+            raise RuntimeError(f"could not commit {self.tablename}")
+
+        self.finished.append(("commit", self.tablename))
+
+    def rollback(self) -> None:
+        self.finished.append(("rollback", self.tablename))
+
+
+def test_dump_many_reports_each_table_it_writes(syncer):
+    syncer.load_strategy = "APPEND"
+    written = []
+
+    syncer.dump_many({"ts_example": [{"id": 2, "name": "new"}]}, on_written=written.append)
+
+    assert written == ["ts_example"]
+    assert select_names(syncer) == ["old", "new"]
+
+
+def test_concurrent_dump_many_rolls_back_every_table_when_a_write_fails(syncer, monkeypatch):
+    finished, written = [], []
+
+    def dump_in_transaction(self, tablename, *, data):  # noqa: ARG001
+        if tablename == "b":
+            raise RuntimeError("could not write b")
+
+        return FakeTransaction(tablename, finished)
+
+    monkeypatch.setattr(SQLite, "_dump_in_transaction", dump_in_transaction)
+    syncer.dump_parallelism = 3
+
+    with pytest.raises(RuntimeError, match="could not write b"):
+        DatabaseSyncer.dump_many(syncer, {"a": [], "b": [], "c": []}, on_written=written.append)
+
+    assert finished == [("rollback", "a"), ("rollback", "c")]
+    assert written == []
+
+
+def test_concurrent_dump_many_only_reports_tables_committed_before_a_failed_commit(syncer, monkeypatch):
+    finished, written = [], []
+
+    def dump_in_transaction(self, tablename, *, data):  # noqa: ARG001
+        return FakeTransaction(tablename, finished, fails_to_commit=tablename == "b")
+
+    monkeypatch.setattr(SQLite, "_dump_in_transaction", dump_in_transaction)
+    syncer.dump_parallelism = 3
+
+    with pytest.raises(RuntimeError, match="could not commit b"):
+        DatabaseSyncer.dump_many(syncer, {"a": [], "b": [], "c": []}, on_written=written.append)
+
+    assert finished == [("commit", "a"), ("rollback", "c")]
+    assert written == ["a"]
+
+
+def test_read_stream_yields_rows_in_batches(syncer):
+    syncer.load_strategy = "APPEND"
+    syncer.dump("ts_example", data=[{"id": idx, "name": f"row {idx}"} for idx in range(2, 6)])
+
+    batches = list(syncer.read_stream("ts_example", batch=2))
+
+    assert [len(rows) for rows in batches] == [2, 2, 1]
+    assert [row["name"] for rows in batches for row in rows] == ["old", "row 2", "row 3", "row 4", "row 5"]
+    assert syncer.load("ts_example") == [row for rows in batches for row in rows]
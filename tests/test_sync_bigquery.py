@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import pytest
+
+pytest.importorskip("google.cloud.bigquery")
+pytest.importorskip("sqlalchemy_bigquery")
+
+from cs_tools import errors  # noqa: E402
+from cs_tools.sync.bigquery.syncer import BigQuery  # noqa: E402
+import pyarrow.parquet as pq  # noqa: E402
+import sqlalchemy as sa  # noqa: E402
+
+
+class FakeJob:
+    job_type = "load"
+
+    def __init__(self, job_id: str, *, destination: str = "", error: Optional[Exception] = None, rows: int = 0):
+        self.job_id = job_id
+        self.destination = destination
+        self.error = error
+        self.rows = rows
+        self.awaited = False
+
+    def result(self):
+        self.awaited = True
+
+        if self.error is not None:
+            raise self.error
+
+
+class FakeClient:
+    """Stands in for google.cloud.bigquery.Client, recording the load jobs submitted to it."""
+
+    def __init__(self):
+        self.jobs: list[FakeJob] = []
+        self.errors: list[Optional[Exception]] = []
+        """The error each job fails with in turn, later jobs succeed."""
+
+    def get_table(self, table_ref: str):
+        return table_ref
+
+    def load_table_from_file(self, buffer, destination, **options):
+        assert options["rewind"]
+        error = self.errors.pop(0) if self.errors else None
+        job = FakeJob(
+            f"job-{len(self.jobs)}", destination=destination, error=error, rows=pq.read_table(buffer).num_rows
+        )
+        self.jobs.append(job)
+        return job
+
+
+@pytest.fixture
+def client(monkeypatch) -> FakeClient:
+    client = FakeClient()
+    create_engine = sa.create_engine
+
+    monkeypatch.setattr(BigQuery, "make_client", lambda self: client)  # noqa: ARG005
+    # The dialect connects through the API client, so a local database stands in for it.
+    monkeypatch.setattr(sa, "create_engine", lambda url, **options: create_engine("sqlite://"))  # noqa: ARG005
+    return client
+
+
+@pytest.fixture
+def syncer(tmp_path, client) -> BigQuery:  # noqa: ARG001
+    keyfile = tmp_path / "credentials.json"
+    keyfile.write_text("{}")
+
+    return BigQuery(
+        project_id="project",
+        dataset="dataset",
+        credentials_keyfile=keyfile,
+        stage_format="parquet",
+        load_batch_size=2,
+        load_parallelism=2,
+    )
+
+
+@pytest.fixture
+def table() -> sa.Table:
+    return sa.Table(
+        "ts_example", sa.MetaData(), sa.Column("id", sa.Integer, primary_key=True), sa.Column("name", sa.Text)
+    )
+
+
+def rows(n: int) -> list[dict]:
+    return [{"id": idx, "name": f"row {idx}"} for idx in range(n)]
+
+
+def test_copy_into_submits_a_job_per_batch_and_waits_at_teardown(syncer, client, table):
+    syncer.copy_into(data=rows(5), into=table)
+
+    assert sorted(job.rows for job in client.jobs) == [1, 2, 2]
+    assert not any(job.awaited for job in client.jobs)
+
+    syncer.__teardown__()
+
+    assert all(job.awaited for job in client.jobs)
+
+
+def test_wait_for_pending_jobs_awaits_every_job_before_raising(syncer, client, table):
+    client.errors = [RuntimeError("quota"), None, RuntimeError("schema")]
+    syncer.copy_into(data=rows(5), into=table)
+
+    with pytest.raises(errors.CSToolsError, match="2 BigQuery jobs failed") as e:
+        syncer.wait_for_pending_jobs()
+
+    assert all(job.awaited for job in client.jobs)
+    assert "quota" in str(e.value)
+    assert "schema" in str(e.value)
+
+
+def test_teardown_after_a_failed_command_does_not_mask_the_failure(syncer, client, table):
+    client.errors = [RuntimeError("quota")]
+    syncer.copy_into(data=rows(4), into=table)
+
+    syncer.__teardown__(RuntimeError("the command failed"))
+
+    assert all(job.awaited for job in client.jobs)
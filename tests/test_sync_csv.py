@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+import datetime as dt
+import gzip
+import pathlib
+
+from cs_tools.sync import base
+from cs_tools.sync.csv.syncer import CSV
+import pytest
+import sqlalchemy as sa
+
+DATA = [{"id": 1, "name": "first"}, {"id": 2, "name": "second"}, {"id": 3, "name": "third"}]
+
+
+def read_lines(path: pathlib.Path) -> list[str]:
+    """Decompress a file by its extension, as any other reader of the file would."""
+    content = path.read_bytes()
+
+    if path.suffix == ".gz":
+        content = gzip.decompress(content)
+
+    if path.suffix == ".zst":
+        zstandard = pytest.importorskip("zstandard")
+        content = zstandard.ZstdDecompressor().decompressobj().decompress(content)
+
+    return content.decode("utf-8").splitlines()
+
+
+def write(syncer: CSV, data: list[dict]) -> None:
+    syncer.dump("ts_example", data=data)
+    base.teardown(syncer)
+
+
+@pytest.mark.parametrize("compression, extension", [("NONE", ".csv"), ("GZIP", ".csv.gz"), ("ZSTD", ".csv.zst")])
+def test_compressed_files_have_a_header(tmp_path, compression, extension):
+    if compression == "ZSTD":
+        pytest.importorskip("zstandard")
+
+    syncer = CSV(directory=tmp_path, compression=compression)
+    write(syncer, DATA)
+
+    assert read_lines(tmp_path / f"ts_example{extension}") == ["id|name", "1|first", "2|second", "3|third"]
+    assert syncer.load("ts_example", column_types={"id": int, "name": str}) == DATA
+
+
+def test_appending_to_a_compressed_file_keeps_a_single_header(tmp_path):
+    for _ in range(2):
+        write(CSV(directory=tmp_path, compression="GZIP", save_strategy="APPEND"), DATA)
+
+    assert read_lines(tmp_path / "ts_example.csv.gz") == ["id|name"] + ["1|first", "2|second", "3|third"] * 2
+
+
+def test_every_rolled_part_has_a_header(tmp_path):
+    syncer = CSV(directory=tmp_path, compression="GZIP", max_rows_per_file=2)
+    write(syncer, DATA)
+
+    assert read_lines(tmp_path / "ts_example.0000.csv.gz") == ["id|name", "1|first", "2|second"]
+    assert read_lines(tmp_path / "ts_example.0001.csv.gz") == ["id|name", "3|third"]
+    assert syncer.load("ts_example", column_types={"id": int, "name": str}) == DATA
+
+
+def test_only_files_of_the_current_settings_are_read(tmp_path):
+    write(CSV(directory=tmp_path), DATA[:1])
+    write(CSV(directory=tmp_path, compression="GZIP"), DATA[1:2])
+    write(CSV(directory=tmp_path, compression="GZIP", max_rows_per_file=1), DATA[2:])
+
+    column_types = {"id": int, "name": str}
+    assert CSV(directory=tmp_path).load("ts_example", column_types=column_types) == DATA[:1]
+    assert CSV(directory=tmp_path, compression="GZIP").load("ts_example", column_types=column_types) == DATA[1:2]
+
+    syncer = CSV(directory=tmp_path, compression="GZIP", max_rows_per_file=1)
+    assert syncer.load("ts_example", column_types=column_types) == DATA[2:]
+
+
+def test_values_are_converted_to_the_types_of_the_model(tmp_path):
+    table = sa.Table(
+        "ts_example",
+        sa.MetaData(),
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("is_active", sa.Boolean),
+        sa.Column("score", sa.Float),
+        sa.Column("created", sa.DateTime),
+        sa.Column("day", sa.Date),
+        sa.Column("name", sa.Text),
+    )
+    created = dt.datetime(2024, 1, 31, 12, 30, tzinfo=dt.timezone.utc)
+    data = [
+        {"id": 1, "is_active": True, "score": 1.5, "created": created, "day": created.date(), "name": "first"},
+        {"id": 2, "is_active": False, "score": None, "created": None, "day": None, "name": None},
+    ]
+
+    syncer = CSV(directory=tmp_path)
+    write(syncer, data)
+
+    assert syncer.load("ts_example", model=SimpleNamespace(__table__=table)) == data
+
+
+def test_files_without_a_header_are_read_by_the_given_columns(tmp_path):
+    syncer = CSV(directory=tmp_path, header=False)
+    column_types = {"id": int, "name": str}
+    write(syncer, DATA)
+
+    assert read_lines(tmp_path / "ts_example.csv") == ["1|first", "2|second", "3|third"]
+    assert [len(rows) for rows in syncer.read_stream("ts_example", batch=2, column_types=column_types)] == [2, 1]
+    assert syncer.load("ts_example", column_types=column_types) == DATA
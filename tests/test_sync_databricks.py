@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Optional
+import base64
+import json
+import pathlib
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from cs_tools.sync.databricks.syncer import Databricks  # noqa: E402
+import sqlalchemy as sa  # noqa: E402
+
+
+class FakeDBFS:
+    """Stands in for the DBFS API, recording the paths created and deleted and the blocks uploaded."""
+
+    def __init__(self):
+        self.created: list[str] = []
+        self.deleted: list[str] = []
+        self.blocks: dict[int, list[bytes]] = {}
+        self.closed: list[int] = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content or b"{}")
+
+        if request.url.path.endswith("/dbfs/create"):
+            self.created.append(body["path"])
+            return httpx.Response(200, json={"handle": len(self.created)})
+
+        if request.url.path.endswith("/dbfs/add-block"):
+            assert body["handle"] not in self.closed
+            self.blocks.setdefault(body["handle"], []).append(base64.b64decode(body["data"]))
+
+        if request.url.path.endswith("/dbfs/close"):
+            self.closed.append(body["handle"])
+
+        if request.url.path.endswith("/dbfs/delete"):
+            assert body["recursive"]
+            self.deleted.append(body["path"])
+
+        return httpx.Response(200, json={})
+
+
+class FakeSession:
+    """Stands in for sa.orm.Session, recording the statements executed on it."""
+
+    def __init__(self, *, error: Optional[Exception] = None):
+        self.error = error
+        self.statements: list[str] = []
+
+    def execute(self, statement, parameters: Optional[dict] = None) -> SimpleNamespace:
+        assert parameters is None
+        self.statements.append(str(statement))
+
+        if self.error is not None:
+            raise self.error
+
+        return SimpleNamespace(scalar=lambda: None)
+
+
+@pytest.fixture
+def dbfs(monkeypatch) -> FakeDBFS:
+    dbfs = FakeDBFS()
+    client = httpx.Client
+
+    def make_client(**options) -> httpx.Client:
+        return client(**options, transport=httpx.MockTransport(dbfs.handle))
+
+    monkeypatch.setattr(httpx, "Client", make_client)
+    return dbfs
+
+
+@pytest.fixture
+def session(monkeypatch) -> FakeSession:
+    session = FakeSession()
+    create_engine = sa.create_engine
+
+    # The SQL warehouse is remote, so statements are recorded by the session rather than run.
+    monkeypatch.setattr(sa, "create_engine", lambda url, **options: create_engine("sqlite://"))  # noqa: ARG005
+    monkeypatch.setattr(Databricks, "session", property(lambda self: session))  # noqa: ARG005
+    return session
+
+
+def make_syncer(tmp_path: pathlib.Path) -> Databricks:
+    return Databricks(
+        server_hostname="https://example.cloud.databricks.com",
+        http_path="/sql/1.0/warehouses/example",
+        access_token="dapi-example",
+        catalog="main",
+        temp_dir=tmp_path,
+        use_experimental_dataload=True,
+        stage_parallelism=2,
+    )
+
+
+@pytest.fixture
+def table() -> sa.Table:
+    return sa.Table(
+        "ts_example", sa.MetaData(), sa.Column("id", sa.Integer, primary_key=True), sa.Column("name", sa.Text)
+    )
+
+
+def test_dbfs_put_uploads_the_file_in_blocks_of_at_most_one_megabyte(tmp_path, dbfs, session):  # noqa: ARG001
+    syncer = make_syncer(tmp_path)
+    content = bytes(range(256)) * (5 * 1024 * 9)
+    fp = tmp_path / "example.csv.gz"
+    fp.write_bytes(content)
+
+    syncer.dbfs_put(fp, path="/mnt/cs_tools/example.csv.gz")
+
+    assert dbfs.created == ["/mnt/cs_tools/example.csv.gz"]
+    assert dbfs.closed == [1]
+    assert [len(block) for block in dbfs.blocks[1]] == [1024 * 1024] * 11 + [262_144]
+    assert b"".join(dbfs.blocks[1]) == content
+
+
+def test_staged_files_are_copied_then_removed(tmp_path, dbfs, session, table):
+    syncer = make_syncer(tmp_path)
+
+    syncer.insert_into(table, tablename="ts_example", data=[{"id": 1, "name": "first"}])
+
+    (created,) = dbfs.created
+    (stage,) = dbfs.deleted
+    assert created.startswith(f"{stage}/")
+    assert "COPY INTO ts_example" in session.statements[0]
+    assert f"FROM '{stage}'" in session.statements[0]
+
+
+def test_staged_files_are_removed_when_the_copy_fails(tmp_path, dbfs, session, table):
+    session.error = RuntimeError("COPY INTO failed")
+    syncer = make_syncer(tmp_path)
+
+    with pytest.raises(RuntimeError, match="COPY INTO failed"):
+        syncer.insert_into(table, tablename="ts_example", data=[{"id": 1, "name": "first"}])
+
+    assert len(dbfs.deleted) == 1
+    assert dbfs.deleted[0].startswith("/mnt/cs_tools/TMP_STAGE_ts_example_")
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import pathlib
+
+import pytest
+
+pytest.importorskip("duckdb_engine")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from cs_tools.sync import base  # noqa: E402
+from cs_tools.sync.duckdb.syncer import DuckDB  # noqa: E402
+import sqlalchemy as sa  # noqa: E402
+
+
+def make_syncer(tmp_path: pathlib.Path, **options) -> DuckDB:
+    metadata = sa.MetaData()
+    sa.Table("ts_example", metadata, sa.Column("id", sa.Integer, primary_key=True), sa.Column("name", sa.Text))
+    return DuckDB(database_path=tmp_path / "example.duckdb", metadata=metadata, **options)
+
+
+def select_rows(syncer: DuckDB) -> list[tuple]:
+    with syncer.engine.connect() as connection:
+        return connection.execute(sa.text("SELECT id, name FROM ts_example ORDER BY id")).all()
+
+
+def test_options_are_case_insensitive(tmp_path):
+    syncer = make_syncer(tmp_path, load_strategy="upsert", export_compression="snappy")
+
+    assert syncer.load_strategy == "UPSERT"
+    assert syncer.export_compression == "SNAPPY"
+
+
+def test_upsert_replaces_rows_by_primary_key(tmp_path):
+    syncer = make_syncer(tmp_path, load_strategy="upsert")
+
+    syncer.dump("ts_example", data=[{"id": 1, "name": "first"}, {"id": 2, "name": "second"}])
+    syncer.dump("ts_example", data=[{"id": 2, "name": "changed"}])
+    base.teardown(syncer)
+
+    assert select_rows(syncer) == [(1, "first"), (2, "changed")]
+
+
+def test_rows_of_earlier_dumps_are_kept_when_the_command_fails(tmp_path):
+    syncer = make_syncer(tmp_path, export_directory=tmp_path)
+
+    syncer.dump("ts_example", data=[{"id": 1, "name": "first"}])
+    base.teardown(syncer, RuntimeError("the command failed"))
+
+    assert select_rows(syncer) == [(1, "first")]
+    assert not (tmp_path / "ts_example.parquet").exists()
+
+
+def test_written_tables_are_exported_once_the_command_succeeds(tmp_path):
+    syncer = make_syncer(tmp_path, export_directory=tmp_path)
+
+    syncer.dump("ts_example", data=[{"id": 1, "name": "first"}])
+    base.teardown(syncer)
+
+    assert pq.read_table(tmp_path / "ts_example.parquet").to_pylist() == [{"id": 1, "name": "first"}]
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import pytest
+
+pytest.importorskip("openpyxl")
+
+from cs_tools.sync import base  # noqa: E402
+from cs_tools.sync.excel.syncer import Excel  # noqa: E402
+
+
+def rows(*ids: int) -> list[dict]:
+    return [{"id": idx, "name": f"row {idx}"} for idx in ids]
+
+
+def write(syncer: Excel, tab_name: str, data: list[dict], exc: Optional[BaseException] = None) -> None:
+    syncer.dump(tab_name, data=data)
+    base.teardown(syncer, exc)
+
+
+def test_write_only_workbooks_are_saved_at_teardown(tmp_path):
+    fp = tmp_path / "example.xlsx"
+    syncer = Excel(filepath=fp, write_only=True)
+
+    syncer.dump("ts_example", data=rows(1, 2))
+    syncer.dump("ts_example", data=rows(3))
+    assert not fp.exists()
+
+    base.teardown(syncer)
+
+    assert Excel(filepath=fp).load("ts_example") == rows(1, 2, 3)
+
+
+def test_write_only_workbooks_carry_over_the_tabs_they_do_not_write(tmp_path):
+    fp = tmp_path / "example.xlsx"
+    write(Excel(filepath=fp), "ts_other", rows(1))
+    write(Excel(filepath=fp, write_only=True), "ts_example", rows(2))
+
+    syncer = Excel(filepath=fp)
+    assert syncer.workbook.sheetnames == ["ts_example", "ts_other"]
+    assert syncer.load("ts_other") == rows(1)
+    assert syncer.load("ts_example") == rows(2)
+
+
+@pytest.mark.parametrize("save_strategy, expected", [("APPEND", rows(1, 2, 3)), ("OVERWRITE", rows(3))])
+def test_write_only_workbooks_carry_over_the_rows_of_an_appended_tab(tmp_path, save_strategy, expected):
+    fp = tmp_path / "example.xlsx"
+    write(Excel(filepath=fp), "ts_example", rows(1, 2))
+    write(Excel(filepath=fp, write_only=True, save_strategy=save_strategy), "ts_example", rows(3))
+
+    assert Excel(filepath=fp).load("ts_example") == expected
+
+
+def test_carry_over_copies_every_saved_row_including_the_header(tmp_path):
+    fp = tmp_path / "example.xlsx"
+    write(Excel(filepath=fp), "ts_example", rows(1, 2))
+
+    syncer = Excel(filepath=fp, write_only=True)
+
+    assert syncer.carry_over("ts_example") == 3
+    assert syncer.carry_over("ts_missing") == 0
+
+
+def test_a_failed_write_only_command_keeps_the_original_workbook(tmp_path):
+    fp = tmp_path / "example.xlsx"
+    write(Excel(filepath=fp), "ts_example", rows(1))
+    write(Excel(filepath=fp, write_only=True), "ts_example", rows(2), RuntimeError("the command failed"))
+
+    assert Excel(filepath=fp).load("ts_example") == rows(1)
+    assert [p.name for p in tmp_path.iterdir()] == ["example.xlsx"]
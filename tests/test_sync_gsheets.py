@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Optional
+import concurrent.futures as cf
+
+import pytest
+
+gspread = pytest.importorskip("gspread")
+
+from cs_tools.sync.gsheets.syncer import GoogleSheets  # noqa: E402
+
+
+class FakeAPIError(gspread.exceptions.APIError):
+    def __init__(self, message: str):
+        Exception.__init__(self, message)
+
+    def _extract_text(self, error):
+        return str(error.args[0])
+
+
+class FakeWorksheet:
+    def __init__(self, title: str, *, rows: int, cols: int, error: Optional[Exception] = None):
+        self.title = title
+        self.row_count = rows
+        self.col_count = cols
+        self.error = error
+        self.values: list[list] = []
+
+    def clear(self):
+        self.values = []
+
+    def resize(self, rows: int, cols: int):
+        self.row_count, self.col_count = rows, cols
+
+    def update(self, values, range_name, **options):
+        assert options["value_input_option"] == "RAW"
+
+        if self.error is not None:
+            raise self.error
+
+        offset = int(range_name.removeprefix("A")) - 1
+        self.values[offset : offset + len(values)] = values
+
+    def append_rows(self, values, **options):
+        assert options["value_input_option"] == "RAW"
+
+        if self.error is not None:
+            raise self.error
+
+        self.values.extend(values)
+
+
+class FakeWorkbook:
+    """Stands in for gspread.Spreadsheet, keeping each tab in memory."""
+
+    url = "https://docs.google.com/spreadsheets/d/fake"
+
+    def __init__(self, error: Optional[Exception] = None):
+        self.tabs: dict[str, FakeWorksheet] = {}
+        self.error = error
+
+    def worksheet(self, title: str) -> FakeWorksheet:
+        try:
+            return self.tabs[title]
+        except KeyError:
+            raise gspread.WorksheetNotFound(title) from None
+
+    def add_worksheet(self, title: str, rows: int, cols: int) -> FakeWorksheet:
+        self.tabs[title] = FakeWorksheet(title, rows=rows, cols=cols, error=self.error)
+        return self.tabs[title]
+
+
+class DeferredPool:
+    """Queue every write until run(), so dumps complete before any write starts."""
+
+    def __init__(self):
+        self.calls: list[tuple] = []
+
+    def submit(self, fn, *args, **kwargs) -> cf.Future:
+        future: cf.Future = cf.Future()
+        self.calls.append((future, fn, args, kwargs))
+        return future
+
+    def run(self) -> None:
+        for future, fn, args, kwargs in self.calls:
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+
+        self.calls = []
+
+    def shutdown(self, wait: bool = True) -> None:
+        assert wait
+        self.run()
+
+
+@pytest.fixture
+def pool(monkeypatch) -> DeferredPool:
+    pool = DeferredPool()
+    monkeypatch.setattr(cf, "ThreadPoolExecutor", lambda **options: pool)  # noqa: ARG005
+    return pool
+
+
+@pytest.fixture
+def make_syncer(tmp_path, monkeypatch, pool):  # noqa: ARG001
+    credentials_file = tmp_path / "credentials.json"
+    credentials_file.write_text("{}")
+
+    def _make_syncer(workbook: FakeWorkbook) -> GoogleSheets:
+        client = SimpleNamespace(open=lambda spreadsheet: workbook)  # noqa: ARG005
+        monkeypatch.setattr(GoogleSheets, "make_client", lambda self: client)  # noqa: ARG005
+        return GoogleSheets(spreadsheet="fake", credentials_file=credentials_file, max_request_bytes=1024)
+
+    return _make_syncer
+
+
+def rows(*ids: int) -> list[dict]:
+    # Long enough that a few rows fill a request.
+    return [{"id": idx, "name": f"row {idx} " + "x" * 300} for idx in ids]
+
+
+def values(*ids: int) -> list[list]:
+    return [["id", "name"]] + [list(row.values()) for row in rows(*ids)]
+
+
+def test_each_dump_keeps_the_strategy_it_was_queued_with(make_syncer, pool):
+    syncer = make_syncer(FakeWorkbook())
+
+    syncer.dump("ts_example", data=rows(1))
+    syncer.save_strategy = "APPEND"
+    syncer.dump("ts_example", data=rows(2))
+    syncer.save_strategy = "OVERWRITE"
+
+    pool.run()
+    syncer.__teardown__()
+
+    assert syncer.workbook.tabs["ts_example"].values == values(1, 2)
+
+
+def test_overwrite_writes_in_chunks_at_their_offsets(make_syncer, pool):
+    syncer = make_syncer(FakeWorkbook())
+
+    syncer.dump("ts_example", data=rows(*range(10)))
+    pool.run()
+    syncer.__teardown__()
+
+    tab = syncer.workbook.tabs["ts_example"]
+    assert tab.values == values(*range(10))
+    assert (tab.row_count, tab.col_count) == (11, 2)
+
+
+def test_a_failed_write_fails_the_teardown(make_syncer, pool):
+    syncer = make_syncer(FakeWorkbook(error=FakeAPIError("quota exceeded")))
+
+    syncer.dump("ts_example", data=rows(1))
+    syncer.dump("ts_example", data=rows(2))
+    pool.run()
+
+    with pytest.raises(gspread.exceptions.APIError, match="quota exceeded"):
+        syncer.__teardown__()
+
+
+def test_teardown_after_a_failed_command_does_not_mask_the_failure(make_syncer, pool):
+    syncer = make_syncer(FakeWorkbook(error=FakeAPIError("quota exceeded")))
+
+    syncer.dump("ts_example", data=rows(1))
+    pool.run()
+
+    syncer.__teardown__(RuntimeError("the command failed"))
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import datetime as dt
+import gzip
+import json
+
+from cs_tools.sync import base
+from cs_tools.sync.json.syncer import JSON
+import pytest
+
+
+class DateTime(dt.datetime):
+    """Stands in for datetime subclasses, like pendulum.DateTime."""
+
+
+@pytest.mark.parametrize("compression, extension", [("NONE", ".jsonl"), ("GZIP", ".jsonl.gz")])
+def test_json_lines_can_be_read_back_mid_session(tmp_path, compression, extension):
+    syncer = JSON(directory=tmp_path, format="jsonl", compression=compression)
+
+    syncer.dump("ts_example", data=[{"id": 1}, {"id": 2}])
+    assert syncer.load("ts_example") == [{"id": 1}, {"id": 2}]
+
+    # Writes after a read are added to the file, rather than replacing it.
+    syncer.dump("ts_example", data=[{"id": 3}])
+    assert syncer.load("ts_example") == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+    base.teardown(syncer)
+    content = (tmp_path / f"ts_example{extension}").read_bytes()
+
+    if compression == "GZIP":
+        content = gzip.decompress(content)
+
+    assert [json.loads(line) for line in content.decode("utf-8").splitlines()] == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+
+def test_json_lines_replace_the_file_of_an_earlier_session(tmp_path):
+    for rows in ([{"id": 1}], [{"id": 2}]):
+        syncer = JSON(directory=tmp_path, format="jsonl")
+        syncer.dump("ts_example", data=rows)
+        base.teardown(syncer)
+
+    assert JSON(directory=tmp_path, format="jsonl").load("ts_example") == [{"id": 2}]
+
+
+@pytest.mark.parametrize("format_", ["json", "jsonl"])
+def test_time_like_values_are_written_in_iso_format(tmp_path, format_):
+    syncer = JSON(directory=tmp_path, format=format_)
+    tz = dt.timezone.utc
+
+    syncer.dump(
+        "ts_example",
+        data=[
+            {"at": dt.datetime(2024, 1, 31, 12, 30, tzinfo=tz)},
+            {"at": DateTime(2024, 1, 31, 12, 30, tzinfo=tz)},
+            {"at": dt.date(2024, 1, 31)},
+        ],
+    )
+    base.teardown(syncer)
+
+    assert syncer.load("ts_example") == [
+        {"at": "2024-01-31T12:30:00+00:00"},
+        {"at": "2024-01-31T12:30:00+00:00"},
+        {"at": "2024-01-31"},
+    ]
+
+
+def test_other_values_are_not_serializable(tmp_path):
+    syncer = JSON(directory=tmp_path, format="jsonl")
+
+    with pytest.raises(TypeError, match="Object of type set is not JSON serializable"):
+        syncer.dump("ts_example", data=[{"ids": {1, 2}}])
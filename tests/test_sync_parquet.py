@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import datetime as dt
+import pathlib
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from cs_tools.sync.parquet.syncer import Parquet  # noqa: E402
+
+
+def make_syncer(directory: pathlib.Path, **options) -> Parquet:
+    return Parquet(directory=directory, row_group_size=2, **options)
+
+
+def rows(*ids: int) -> list[dict]:
+    return [{"id": idx, "name": f"row {idx}"} for idx in ids]
+
+
+def test_dumps_after_a_read_are_appended(tmp_path):
+    syncer = make_syncer(tmp_path)
+
+    syncer.dump("ts_example", data=rows(1, 2, 3))
+    assert syncer.load("ts_example") == rows(1, 2, 3)
+
+    syncer.dump("ts_example", data=rows(4, 5))
+    assert syncer.load("ts_example") == rows(1, 2, 3, 4, 5)
+
+    syncer.__teardown__()
+
+    assert make_syncer(tmp_path).load("ts_example") == rows(1, 2, 3, 4, 5)
+    assert [fp.name for fp in tmp_path.iterdir()] == ["ts_example.parquet"]
+
+
+def test_the_file_is_only_replaced_at_teardown(tmp_path):
+    syncer = make_syncer(tmp_path)
+    syncer.dump("ts_example", data=rows(1))
+    syncer.__teardown__()
+
+    syncer = make_syncer(tmp_path)
+    syncer.dump("ts_example", data=rows(2, 3))
+
+    # Until the Syncer is torn down, other readers still see the previous file, complete with its footer.
+    assert make_syncer(tmp_path).load("ts_example") == rows(1)
+
+    syncer.__teardown__()
+
+    assert make_syncer(tmp_path).load("ts_example") == rows(2, 3)
+
+
+def test_a_failed_command_keeps_the_original_file(tmp_path):
+    syncer = make_syncer(tmp_path)
+    syncer.dump("ts_example", data=rows(1))
+    syncer.__teardown__()
+
+    syncer = make_syncer(tmp_path)
+    syncer.dump("ts_example", data=rows(2))
+    syncer.load("ts_example")
+    syncer.dump("ts_example", data=rows(3))
+    syncer.__teardown__(RuntimeError("the command failed"))
+
+    assert make_syncer(tmp_path).load("ts_example") == rows(1)
+    assert [fp.name for fp in tmp_path.iterdir()] == ["ts_example.parquet"]
+
+
+def test_filters_apply_across_every_part(tmp_path):
+    syncer = make_syncer(tmp_path)
+
+    syncer.dump("ts_example", data=rows(1, 2))
+    syncer.load("ts_example")
+    syncer.dump("ts_example", data=rows(3, 4))
+
+    assert syncer.load("ts_example", columns=["name"], filters=[("id", ">=", 2)]) == [
+        {"name": "row 2"},
+        {"name": "row 3"},
+        {"name": "row 4"},
+    ]
+
+    syncer.__teardown__()
+
+
+def events(*days: int, start: int = 1) -> list[dict]:
+    return [
+        {"id": idx, "timestamp": dt.datetime(2024, 1, day, 12, tzinfo=dt.timezone.utc)}
+        for idx, day in enumerate(days, start=start)
+    ]
+
+
+def test_partitioned_rows_are_loaded_without_the_date_partition(tmp_path):
+    syncer = make_syncer(tmp_path, partition_by="timestamp")
+    syncer.dump("ts_example", data=events(30, 31))
+    syncer.__teardown__()
+
+    assert sorted((tmp_path / "ts_example").iterdir()) == [
+        tmp_path / "ts_example" / "timestamp_date=2024-01-30",
+        tmp_path / "ts_example" / "timestamp_date=2024-01-31",
+    ]
+    assert sorted(make_syncer(tmp_path).load("ts_example"), key=lambda row: row["id"]) == events(30, 31)
+
+
+def test_rerunning_a_window_replaces_its_partitions(tmp_path):
+    syncer = make_syncer(tmp_path, partition_by="timestamp")
+    syncer.dump("ts_example", data=events(30, 31))
+    syncer.__teardown__()
+
+    syncer = make_syncer(tmp_path, partition_by="timestamp")
+    syncer.dump("ts_example", data=events(31, start=3))
+    syncer.__teardown__()
+
+    assert sorted(make_syncer(tmp_path).load("ts_example"), key=lambda row: row["id"]) == [
+        *events(30),
+        *events(31, start=3),
+    ]
+
+
+def test_writes_within_a_session_add_to_a_partition(tmp_path):
+    syncer = make_syncer(tmp_path, partition_by="timestamp")
+    syncer.dump("ts_example", data=events(31))
+    syncer.dump("ts_example", data=events(31, start=2))
+    syncer.__teardown__()
+
+    assert len(list((tmp_path / "ts_example" / "timestamp_date=2024-01-31").iterdir())) == 2
+    assert sorted(make_syncer(tmp_path).load("ts_example"), key=lambda row: row["id"]) == events(31, 31)
+
+
+def test_filters_on_the_date_partition_prune_other_days(tmp_path):
+    syncer = make_syncer(tmp_path, partition_by="timestamp")
+    syncer.dump("ts_example", data=events(30, 31, 31))
+    syncer.__teardown__()
+
+    # Only the matching partition's files are read, the others are skipped by their path alone.
+    (tmp_path / "ts_example" / "timestamp_date=2024-01-30").joinpath("zz-not-a-parquet-file.parquet").write_text("")
+
+    syncer = make_syncer(tmp_path)
+    filters = [("timestamp_date", "==", "2024-01-31")]
+    assert [row["id"] for row in syncer.load("ts_example", columns=["id"], filters=filters)] == [2, 3]
+
+
+def test_compact_merges_the_files_of_each_partition(tmp_path):
+    syncer = make_syncer(tmp_path, partition_by="timestamp")
+    syncer.dump("ts_example", data=events(30, 31))
+    syncer.dump("ts_example", data=events(31, start=3))
+    syncer.dump("ts_example", data=events(31, start=4))
+    syncer.__teardown__()
+
+    assert syncer.compact("ts_example") == 2
+    assert len(list((tmp_path / "ts_example" / "timestamp_date=2024-01-31").iterdir())) == 1
+    assert sorted(syncer.load("ts_example"), key=lambda row: row["id"]) == events(30, 31, 31, 31)
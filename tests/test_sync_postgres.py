@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import datetime as dt
+import os
+import uuid
+
+import pytest
+
+pytest.importorskip("psycopg2")
+
+from cs_tools.sync import base  # noqa: E402
+from cs_tools.sync.postgres.syncer import CopyTextStream, Postgres  # noqa: E402
+import sqlalchemy as sa  # noqa: E402
+
+# A Syncer definition for a disposable Postgres database, eg. host=localhost&database=postgres&username=postgres
+DEFINITION = os.environ.get("CS_TOOLS_TEST_POSTGRES_DEFINITION")
+
+requires_postgres = pytest.mark.skipif(DEFINITION is None, reason="CS_TOOLS_TEST_POSTGRES_DEFINITION is not set")
+
+
+@pytest.fixture
+def make_syncer():
+    tables: list[tuple[Postgres, sa.Table]] = []
+
+    def _make_syncer(**options) -> tuple[Postgres, sa.Table]:
+        syncer = Postgres(**base.parse_definition(DEFINITION), **options)
+        table = sa.Table(
+            f"ts_example_{uuid.uuid4().hex[:5]}",
+            syncer.metadata,
+            sa.Column("id", sa.Integer, primary_key=True),
+            sa.Column("name", sa.Text),
+        )
+        syncer.metadata.create_all(syncer.engine, tables=[table])
+        tables.append((syncer, table))
+        return syncer, table
+
+    yield _make_syncer
+
+    for syncer, table in tables:
+        table.drop(syncer.engine, checkfirst=True)
+
+
+def select_rows(syncer: Postgres, table: sa.Table) -> list[tuple]:
+    with syncer.engine.connect() as connection:
+        return connection.execute(sa.select(table.c.id, table.c.name).order_by(table.c.id)).all()
+
+
+def test_copy_text_stream_escapes_values_and_reads_in_chunks():
+    created = dt.datetime(2024, 1, 31, 12, 30, tzinfo=dt.timezone.utc)
+    data = [
+        {"id": 1, "name": "tab\there", "created": created},
+        {"id": 2, "name": "new\nline \\ slash", "created": None},
+        {"id": 3, "name": True},
+    ]
+    stream = CopyTextStream(data, columns=["id", "name", "created"])
+
+    chunks = iter(lambda: stream.read(8), b"")
+
+    assert b"".join(chunks).decode().splitlines() == [
+        "1\ttab\\there\t2024-01-31T12:30:00+00:00",
+        "2\tnew\\nline \\\\ slash\t\\N",
+        "3\tt\t\\N",
+    ]
+
+
+@requires_postgres
+def test_append_copies_rows_which_need_escaping(make_syncer):
+    syncer, table = make_syncer(load_strategy="APPEND")
+    data = [{"id": 1, "name": "tab\there"}, {"id": 2, "name": "new\nline \\ slash"}, {"id": 3, "name": None}]
+
+    syncer.dump(table.name, data=data)
+    base.teardown(syncer)
+
+    assert select_rows(syncer, table) == [(1, "tab\there"), (2, "new\nline \\ slash"), (3, None)]
+
+
+@requires_postgres
+def test_truncate_replaces_every_row(make_syncer):
+    syncer, table = make_syncer(load_strategy="TRUNCATE")
+
+    syncer.dump(table.name, data=[{"id": 1, "name": "first"}, {"id": 2, "name": "second"}])
+    syncer.dump(table.name, data=[{"id": 3, "name": "third"}])
+    base.teardown(syncer)
+
+    assert select_rows(syncer, table) == [(3, "third")]
+
+
+@requires_postgres
+@pytest.mark.parametrize("stage_upsert_with_copy", [False, True])
+def test_upsert_keeps_the_last_row_of_each_key(make_syncer, stage_upsert_with_copy):
+    syncer, table = make_syncer(load_strategy="UPSERT", stage_upsert_with_copy=stage_upsert_with_copy)
+
+    syncer.dump(table.name, data=[{"id": 1, "name": "first"}, {"id": 2, "name": "second"}])
+    syncer.dump(table.name, data=[{"id": 2, "name": "changed"}, {"id": 3, "name": "third"}, {"id": 2, "name": "last"}])
+    base.teardown(syncer)
+
+    assert select_rows(syncer, table) == [(1, "first"), (2, "last"), (3, "third")]
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Optional
+import gzip
+import pathlib
+import sys
+
+from cs_tools.sync.redshift import compiler
+from cs_tools.sync.redshift.syncer import Redshift
+import pytest
+import sqlalchemy as sa
+
+
+class FakeS3:
+    """Stands in for boto3, keeping uploaded objects in memory."""
+
+    def __init__(self, *, error: Optional[Exception] = None):
+        self.error = error
+        self.objects: dict[str, bytes] = {}
+        self.uploaded: dict[str, bytes] = {}
+        self.deleted: list[str] = []
+
+    def upload_file(self, filename: str, bucket: str, key: str) -> None:
+        assert bucket == "bucket"
+
+        if self.error is not None:
+            raise self.error
+
+        self.objects[key] = self.uploaded[key] = pathlib.Path(filename).read_bytes()
+
+    def delete(self, prefix: str) -> None:
+        self.deleted.append(prefix)
+        self.objects = {k: v for k, v in self.objects.items() if not k.startswith(prefix)}
+
+    # boto3.client("s3") and boto3.resource("s3").Bucket(..).objects.filter(Prefix=..).delete()
+
+    def client(self, service: str, **options) -> FakeS3:
+        assert service == "s3"
+        assert "aws_access_key_id" in options
+        return self
+
+    def resource(self, service: str, **options) -> FakeS3:
+        assert service == "s3"
+        assert "aws_access_key_id" in options
+        return self
+
+    def Bucket(self, name: str) -> SimpleNamespace:
+        assert name == "bucket"
+        return SimpleNamespace(objects=self)
+
+    def filter(self, Prefix: str) -> SimpleNamespace:
+        return SimpleNamespace(delete=lambda: self.delete(Prefix))
+
+
+class FakeSession:
+    """Stands in for sa.orm.Session, recording the statements executed on it."""
+
+    def __init__(self):
+        self.statements: list[tuple[str, dict]] = []
+
+    def execute(self, statement, parameters: Optional[dict] = None) -> SimpleNamespace:
+        self.statements.append((str(statement), parameters or {}))
+        return SimpleNamespace(rowcount=0)
+
+    def commit(self) -> None:
+        pass
+
+
+@pytest.fixture
+def make_syncer(monkeypatch):
+    session = FakeSession()
+    create_engine = sa.create_engine
+
+    # The cluster is remote, so statements are recorded by the session rather than run.
+    monkeypatch.setattr(sa, "create_engine", lambda url, **options: create_engine("sqlite://"))  # noqa: ARG005
+    monkeypatch.setattr(Redshift, "session", property(lambda self: session))  # noqa: ARG005
+
+    def _make_syncer(tmp_path: pathlib.Path, **options) -> Redshift:
+        configuration = {
+            "host": "localhost",
+            "username": "cs_tools",
+            "secret": "secret",
+            "database": "db",
+            "temp_dir": tmp_path,
+            "stage_bucket": "bucket",
+            "stage_iam_role": "arn:aws:iam::123456789012:role/cs_tools",
+            "stage_parallelism": 2,
+            "metadata": sa.MetaData(),
+            **options,
+        }
+        return Redshift(**configuration)
+
+    return _make_syncer
+
+
+def make_table(syncer: Redshift, *columns: sa.Column) -> sa.Table:
+    return sa.Table("ts_example", syncer.metadata, *columns)
+
+
+@pytest.fixture
+def s3(monkeypatch) -> FakeS3:
+    s3 = FakeS3()
+    monkeypatch.setitem(sys.modules, "boto3", s3)
+    return s3
+
+
+def test_csv_is_staged_in_the_order_it_is_copied(tmp_path, s3, make_syncer):
+    syncer = make_syncer(tmp_path)
+    table = make_table(syncer, sa.Column("id", sa.Integer, primary_key=True), sa.Column("name", sa.Text))
+
+    syncer.dump_staged(table, data=[{"name": "first", "id": 1, "unknown": "x"}, {"id": 2, "name": "second"}])
+
+    ((key, content),) = s3.uploaded.items()
+    assert gzip.decompress(content).decode().splitlines() == ["1|first", "2|second"]
+
+    (statement, parameters), *_ = syncer.session.statements
+    assert "COPY ts_example (id, name)" in statement
+    assert parameters == {"iam_role": "arn:aws:iam::123456789012:role/cs_tools"}
+    assert s3.deleted == [key.rpartition("/")[0] + "/"]
+    assert s3.objects == {}
+
+
+@pytest.mark.parametrize("stage_format", ["csv", "parquet"])
+def test_long_strings_are_trimmed_before_they_are_staged(tmp_path, s3, monkeypatch, make_syncer, stage_format):
+    if stage_format == "parquet":
+        pq = pytest.importorskip("pyarrow.parquet")
+        monkeypatch.setattr(Redshift, "column_order", lambda self, table: [c.name for c in table.columns])  # noqa: ARG005
+
+    syncer = make_syncer(tmp_path, stage_format=stage_format)
+    table = make_table(
+        syncer,
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("name", compiler.TrimmedString(length=compiler.MAX_VARCHAR_LENGTH)),
+    )
+
+    syncer.dump_staged(table, data=[{"id": 1, "name": "x" * (compiler.MAX_VARCHAR_LENGTH + 1)}])
+
+    ((key, content),) = s3.uploaded.items()
+    fp = tmp_path / pathlib.PurePosixPath(key).name
+    fp.write_bytes(content)
+
+    if stage_format == "parquet":
+        (name,) = pq.read_table(fp).column("name").to_pylist()
+    else:
+        (line,) = gzip.decompress(content).decode().splitlines()
+        name = line.partition("|")[2]
+
+    assert name == "x" * (compiler.MAX_VARCHAR_LENGTH - 4) + "..."
+
+
+def test_access_keys_are_never_part_of_the_statement(tmp_path, s3, make_syncer):
+    syncer = make_syncer(
+        tmp_path, stage_iam_role=None, stage_access_key_id="AKIAEXAMPLE", stage_secret_access_key="top-secret"
+    )
+    table = make_table(syncer, sa.Column("id", sa.Integer, primary_key=True), sa.Column("name", sa.Text))
+
+    syncer.dump_staged(table, data=[{"id": 1, "name": "first"}])
+
+    (statement, parameters), *_ = syncer.session.statements
+    assert "top-secret" not in statement
+    assert parameters == {"access_key_id": "AKIAEXAMPLE", "secret_access_key": "top-secret"}
+    assert s3.objects == {}
+
+
+def test_staged_files_are_removed_when_the_upload_fails(tmp_path, s3, make_syncer):
+    s3.error = RuntimeError("upload failed")
+    syncer = make_syncer(tmp_path)
+    table = make_table(syncer, sa.Column("id", sa.Integer, primary_key=True), sa.Column("name", sa.Text))
+
+    with pytest.raises(RuntimeError, match="upload failed"):
+        syncer.dump_staged(table, data=[{"id": 1, "name": "first"}])
+
+    assert len(s3.deleted) == 1
+    assert s3.deleted[0].startswith("cs_tools/TMP_STAGE_ts_example_")
+    assert syncer.session.statements == []
+
+
+def test_merge_only_inserts_when_every_column_is_a_key(tmp_path, make_syncer):
+    syncer = make_syncer(tmp_path)
+    table = make_table(
+        syncer, sa.Column("a", sa.Integer, primary_key=True), sa.Column("b", sa.Integer, primary_key=True)
+    )
+
+    syncer.merge_into(into=table, from_="staging")
+
+    (statement, _), *_ = syncer.session.statements
+    assert "UPDATE SET" not in statement
+    assert "NOT EXISTS" in statement
+
+
+def test_merge_updates_the_non_key_columns(tmp_path, make_syncer):
+    syncer = make_syncer(tmp_path)
+    table = make_table(syncer, sa.Column("id", sa.Integer, primary_key=True), sa.Column("name", sa.Text))
+
+    syncer.merge_into(into=table, from_="staging")
+
+    (statement, _), *_ = syncer.session.statements
+    assert "UPDATE SET name = SOURCE.name" in statement
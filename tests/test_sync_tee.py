@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Optional
+import pathlib
+
+from cs_tools import errors
+from cs_tools.sync import base
+from cs_tools.sync.tee.syncer import Tee
+import pytest
+import sqlalchemy as sa
+
+
+def make_tee(tmp_path: pathlib.Path, *names: str, **options) -> Tee:
+    """A Tee to a CSV target in a directory of each name."""
+    return Tee(targets=[f"csv://directory={tmp_path / name}" for name in names], **options)
+
+
+@pytest.fixture
+def finished(monkeypatch) -> dict[str, Optional[BaseException]]:
+    """Record the exception each target is finished with, by the name of its directory."""
+    finished: dict[str, Optional[BaseException]] = {}
+    teardown = base.teardown
+
+    def record(syncer: base.Syncer, exc: Optional[BaseException] = None) -> None:
+        finished[syncer.directory.name] = exc
+        teardown(syncer, exc)
+
+    monkeypatch.setattr(base, "teardown", record)
+    return finished
+
+
+def test_parse_definition_keeps_commas_and_repeated_parameters():
+    definition = "targets=snowflake://snowflake.toml&targets=parquet://directory=a,b"
+
+    assert not base.is_definition_file(definition)
+    assert base.parse_definition(definition) == {"targets": ["snowflake://snowflake.toml", "parquet://directory=a,b"]}
+
+
+def test_parse_definition_reads_a_file(tmp_path):
+    fp = tmp_path / "definition.toml"
+    fp.write_text("[configuration]\ntargets = ['parquet://directory=archive']\n")
+
+    assert base.is_definition_file(fp.as_posix())
+    assert base.parse_definition(fp.as_posix()) == {"targets": ["parquet://directory=archive"]}
+
+
+def test_a_failed_command_rolls_back_every_target(tmp_path, finished):
+    failure = RuntimeError("the command failed")
+
+    make_tee(tmp_path, "a", "b").__teardown__(failure)
+
+    assert finished == {"a": failure, "b": failure}
+
+
+def test_only_the_failed_target_is_rolled_back_when_ignoring_failures(tmp_path, finished):
+    tee = Tee(targets=[f"csv://directory={tmp_path / 'a'}", f"json://directory={tmp_path / 'b'}"], ignore_failures=True)
+
+    # Sets are written to a CSV as their text, but can't be serialized to JSON.
+    tee.dump("ts_example", data=[{"ids": {1, 2}}])
+    tee.__teardown__()
+
+    assert finished["a"] is None
+    assert isinstance(finished["b"], errors.CSToolsError)
+
+
+def test_a_target_failing_to_finish_fails_the_command(tmp_path, finished, monkeypatch):
+    teardown = base.teardown
+
+    def fail_to_finish_a(syncer: base.Syncer, exc: Optional[BaseException] = None) -> None:
+        teardown(syncer, exc)
+
+        if syncer.directory.name == "a":
+            raise RuntimeError("commit failed")
+
+    monkeypatch.setattr(base, "teardown", fail_to_finish_a)
+
+    with pytest.raises(RuntimeError, match="commit failed"):
+        make_tee(tmp_path, "a", "b").__teardown__()
+
+    # Every target is still finished with.
+    assert finished == {"a": None, "b": None}
+
+
+def test_tables_are_created_in_every_database_target(tmp_path):
+    tee = Tee(targets=[f"csv://directory={tmp_path}", f"sqlite://database_path={tmp_path / 'example.db'}"])
+    assert tee.is_database_syncer
+
+    # Models are defined at runtime from the shape of the data, eg. by the extractor.
+    table = sa.Table("ts_example", sa.MetaData(), sa.Column("id", sa.Integer, primary_key=True))
+    tee.create_model_table(SimpleNamespace(__table__=table, __tablename__="ts_example"))
+
+    tee.dump("ts_example", data=[{"id": 1}, {"id": 2}])
+    base.teardown(tee)
+
+    with sa.create_engine(f"sqlite:///{tmp_path / 'example.db'}").connect() as connection:
+        assert connection.execute(sa.text("SELECT id FROM ts_example ORDER BY id")).scalars().all() == [1, 2]
+
+    assert (tmp_path / "ts_example.csv").read_text().splitlines() == ["id", "1", "2"]
+
+
+def test_a_tee_of_files_is_not_a_database_syncer(tmp_path):
+    tee = Tee(targets=[f"csv://directory={tmp_path}", f"json://directory={tmp_path}"])
+
+    assert not tee.is_database_syncer
+    base.teardown(tee)
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import datetime as dt
+import decimal
+
+import pytest
+
+pytest.importorskip("trino")
+
+from cs_tools.sync.trino.syncer import _to_trino_literal  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "value, literal",
+    [
+        (None, "NULL"),
+        (True, "TRUE"),
+        (False, "FALSE"),
+        (42, "42"),
+        (1.5, "1.5"),
+        (float("nan"), "nan()"),
+        (float("inf"), "infinity()"),
+        (float("-inf"), "-infinity()"),
+        (decimal.Decimal("12.340"), "DECIMAL '12.340'"),
+        (decimal.Decimal("1E+3"), "DECIMAL '1000'"),
+        ("it's", "'it''s'"),
+        (dt.date(2024, 1, 31), "DATE '2024-01-31'"),
+        (dt.datetime(2024, 1, 31, 12, 30), "TIMESTAMP '2024-01-31 12:30:00.000000'"),  # noqa: DTZ001
+    ],
+)
+def test_to_trino_literal(value, literal):
+    assert _to_trino_literal(value) == literal
+
+
+def test_timezone_aware_datetimes_are_rendered_in_utc():
+    value = dt.datetime(2024, 1, 31, 12, 30, tzinfo=dt.timezone(dt.timedelta(hours=-5)))
+
+    assert _to_trino_literal(value) == "TIMESTAMP '2024-01-31 17:30:00.000000 +00:00'"
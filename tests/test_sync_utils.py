@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import gzip
+import pathlib
+
+from cs_tools.sync import utils as sync_utils
+
+
+def test_last_row_per_key_keeps_the_last_row_for_each_key():
+    data = [
+        {"org_id": 0, "guid": "a", "name": "first"},
+        {"org_id": 0, "guid": "b", "name": "second"},
+        {"org_id": 1, "guid": "a", "name": "third"},
+        {"org_id": 0, "guid": "a", "name": "fourth"},
+    ]
+
+    assert sync_utils.last_row_per_key(data, key=["org_id", "guid"]) == [
+        {"org_id": 0, "guid": "a", "name": "fourth"},
+        {"org_id": 0, "guid": "b", "name": "second"},
+        {"org_id": 1, "guid": "a", "name": "third"},
+    ]
+
+
+def test_last_row_per_key_without_duplicates_is_unchanged():
+    data = [{"guid": "a"}, {"guid": "b"}]
+
+    assert sync_utils.last_row_per_key(data, key=["guid"]) == data
+
+
+def read_parts(parts: list[pathlib.Path]) -> list[list[str]]:
+    return [gzip.decompress(part.read_bytes()).decode("utf-8").splitlines() for part in parts]
+
+
+def test_temp_csv_parts_split_once_a_part_reaches_max_file_size(tmp_path):
+    data = [{"id": idx, "name": f"row {idx}"} for idx in range(25_000)]
+
+    with sync_utils.temp_csv_parts_for_upload(tmp_path, filename="ts_example", data=data, max_file_size=1) as parts:
+        assert [part.name for part in parts] == [
+            "ts_example.0000.csv.gz",
+            "ts_example.0001.csv.gz",
+            "ts_example.0002.csv.gz",
+        ]
+        contents = read_parts(parts)
+
+    # The size is only checked every 10,000 rows.
+    assert [len(lines) for lines in contents] == [10_000, 10_000, 5_000]
+    assert [line for lines in contents for line in lines] == [f"{idx}|row {idx}" for idx in range(25_000)]
+
+    # The parts only exist for the life of the context manager.
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_temp_csv_parts_stay_whole_under_max_file_size(tmp_path):
+    data = [{"id": idx, "name": f"row {idx}"} for idx in range(25_000)]
+
+    with sync_utils.temp_csv_parts_for_upload(tmp_path, filename="ts_example", data=data, max_file_size=2**30) as parts:
+        assert len(parts) == 1
+        assert len(read_parts(parts)[0]) == 25_000
+
+
+def test_temp_csv_parts_each_have_a_header(tmp_path):
+    data = [{"id": idx, "name": f"row {idx}"} for idx in range(20_001)]
+
+    with sync_utils.temp_csv_parts_for_upload(
+        tmp_path, filename="ts_example", data=data, max_file_size=1, include_header=True
+    ) as parts:
+        contents = read_parts(parts)
+
+    assert [lines[0] for lines in contents] == ["id|name", "id|name", "id|name"]
+    assert [len(lines) for lines in contents] == [10_001, 10_001, 2]
+
+
+def test_temp_csv_parts_follow_fieldnames(tmp_path):
+    data = [{"name": "first", "id": 1, "unknown": "x"}, {"id": 2}]
+
+    with sync_utils.temp_csv_parts_for_upload(
+        tmp_path, filename="ts_example", data=data, max_file_size=2**30, fieldnames=["id", "name"]
+    ) as parts:
+        contents = read_parts(parts)
+
+    assert contents == [["1|first", "2|"]]
@@ -4,7 +4,48 @@ import pathlib
 
 from cs_tools import utils
 import cs_tools
+import pytest
 
 
 def test_get_package_directory():
     assert utils.get_package_directory("cs_tools") == pathlib.Path(cs_tools.__file__).parent
+
+
+def test_write_pipeline_writes_in_order():
+    written = []
+
+    with utils.WritePipeline(written.append, maxsize=1) as pipeline:
+        for item in range(10):
+            pipeline.put(item)
+
+    assert written == list(range(10))
+
+
+def test_write_pipeline_raises_writer_errors():
+    def write(item):
+        if item == 3:
+            raise ValueError("cannot write 3")
+
+    with pytest.raises(ValueError, match="cannot write 3"):
+        with utils.WritePipeline(write) as pipeline:
+            for item in range(10):
+                pipeline.put(item)
+
+
+def test_checkpoint_store_resumes_only_interrupted_runs(tmp_path):
+    path = tmp_path / "checkpoints.db"
+
+    with pytest.raises(RuntimeError):
+        with utils.CheckpointStore(path, run="command") as checkpoints:
+            checkpoints.complete("users", org=0, data=[{"user_guid": "abc"}])
+            raise RuntimeError("interrupted")
+
+    checkpoints = utils.CheckpointStore(path, run="command", resume=True)
+    assert checkpoints.is_complete("users", org=0)
+    assert checkpoints.staged("users", org=0) == [{"user_guid": "abc"}]
+    assert not checkpoints.is_complete("users", org=1)
+
+    with checkpoints:
+        pass
+
+    assert not utils.CheckpointStore(path, run="command", resume=True).is_complete("users", org=0)